@@ -0,0 +1,11 @@
+import os
+
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'Kolokwa_connect.settings')
+
+app = Celery('Kolokwa_connect')
+
+# CELERY_* settings (broker, serializers, timezone) come from Django settings
+app.config_from_object('django.conf:settings', namespace='CELERY')
+app.autodiscover_tasks()
@@ -0,0 +1,30 @@
+# Kolokwa_connect/Kolokwa_connect/middleware.py
+from django.http import HttpResponse
+from django.utils.cache import patch_cache_control
+
+# Paths answered by HealthCheckMiddleware (with and without the trailing slash,
+# since the probes in render.yaml / docker-compose.yml omit it)
+HEALTH_CHECK_PATHS = frozenset({'/health', '/health/'})
+
+
+def health_check_response():
+    response = HttpResponse("OK", status=200, content_type='text/plain')
+    patch_cache_control(response, max_age=0, no_store=True)
+    return response
+
+
+class HealthCheckMiddleware:
+    """
+    Answer liveness probes before the session, auth and CSRF middleware run,
+    so a probe never reads a session or touches the database.
+    This is the only handler for /health (there is no URL pattern);
+    it must sit at the top of MIDDLEWARE.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if request.path in HEALTH_CHECK_PATHS:
+            return health_check_response()
+        return self.get_response(request)
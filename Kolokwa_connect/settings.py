@@ -55,6 +55,7 @@ INSTALLED_APPS = [
     'django.contrib.messages',
     'django.contrib.staticfiles',
     'django.contrib.sites',
+    'django.contrib.postgres',
     
     # Third party apps
     'rest_framework',
@@ -82,6 +83,7 @@ INSTALLED_APPS = [
 
 
 MIDDLEWARE = [
+    'Kolokwa_connect.middleware.HealthCheckMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -142,8 +144,16 @@ else:
             'PASSWORD': os.getenv('DATABASE_PASSWORD', ''),
             'HOST': os.getenv('DATABASE_HOST', ''),
             'PORT': os.getenv('DATABASE_PORT', ''),
+            # Reuse connections across requests instead of reconnecting per request
+            'CONN_MAX_AGE': int(os.getenv('DATABASE_CONN_MAX_AGE', '60')),
+            'CONN_HEALTH_CHECKS': True,
         }
     }
+    if DATABASES['default']['ENGINE'] == 'django.db.backends.postgresql':
+        # Server-side binding lets psycopg 3 PREPARE statements a connection runs
+        # repeatedly (5+ times by default), so hot lookups skip parse/plan; the
+        # statements live as long as the persistent connection above
+        DATABASES['default']['OPTIONS'] = {'server_side_binding': True}
 
 
 # Custom User Model
@@ -173,6 +183,18 @@ if static_dir.exists():
 else:
     STATICFILES_DIRS = []
 
+# Files served by WhiteNoise at the site root (favicon.ico) without a Django view
+WHITENOISE_ROOT = BASE_DIR / 'public'
+
+
+def favicon_cache_headers(headers, path, url):
+    """Cache favicon.ico for a year; other unhashed files keep WhiteNoise's short default max-age"""
+    if url == '/favicon.ico':
+        headers['Cache-Control'] = 'public, max-age=31536000'
+
+
+WHITENOISE_ADD_HEADERS_FUNCTION = favicon_cache_headers
+
 # CLOUDINARY CONFIGURATION - ALL IN ONE PLACE
 CLOUDINARY_STORAGE = {
     'CLOUD_NAME': config('CLOUDINARY_CLOUD_NAME'),
@@ -257,12 +279,23 @@ RAG_CONFIG = {
     'SEMANTIC_WEIGHT': 0.7,  # Weight for semantic search
 }
 
-CACHES = {
-    'default': {
-        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
-        'LOCATION': 'cache_table',
+# Use Redis when available, fall back to the database cache table
+REDIS_URL = config('REDIS_URL', default='')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'cache_table',
+        }
     }
-}
 
 # CORS settings
 CORS_ALLOWED_ORIGINS = [
@@ -311,6 +344,9 @@ CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
 
+# Months of translation_history partitions kept by manage_history_partitions
+TRANSLATION_HISTORY_RETENTION_MONTHS = config('TRANSLATION_HISTORY_RETENTION_MONTHS', default=6, cast=int)
+
 # API Documentation
 SPECTACULAR_SETTINGS = {
     'TITLE': 'Kolokwa Connect API',
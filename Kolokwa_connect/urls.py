@@ -3,13 +3,22 @@ from django.urls import path, include
 from django.views.generic import TemplateView
 from django.conf import settings
 from django.conf.urls.static import static
-from django.contrib.staticfiles.storage import staticfiles_storage
-from django.views.generic.base import RedirectView
 
-from .views import home, about, health_check_view
+from .views import home, about
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 
-from users.workos_views import workos_callback, workos_login, workos_logout
+# Everything served under api/
+api_urlpatterns = [
+    # API Authentication
+    path('auth/', include('dj_rest_auth.urls')),
+    path('auth/registration/', include('dj_rest_auth.registration.urls')),
+
+    path('nl/', include('nl_interact.urls')),
+
+    # API Documentation
+    path('schema/', SpectacularAPIView.as_view(), name='schema'),
+    path('docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
+]
 
 urlpatterns = [
     # Admin
@@ -18,30 +27,20 @@ urlpatterns = [
     # Home and general pages
     path('', home, name='home'),
     path('about/', about, name='about'),
-    path('health/', health_check_view, name='health_check'),
     
     # WorkOS Authentication (add these BEFORE allauth)
-    path('auth/workos/callback', workos_callback, name='workos-callback'),
-    path('auth/workos/login', workos_login, name='workos-login'),
-    path('auth/workos/logout', workos_logout, name='workos-logout'),
+    path('auth/workos/', include('users.workos_urls')),
     
     # Traditional Authentication (allauth)
     path('accounts/', include('allauth.urls')),
     
-    # API Authentication
-    path('api/auth/', include('dj_rest_auth.urls')),
-    path('api/auth/registration/', include('dj_rest_auth.registration.urls')),
-    
     # App URLs
     path('users/', include('users.urls', namespace='users')),
     path('dictionary/', include('dictionary.urls', namespace='dictionary')),
     path('gamification/', include('gamification.urls')),
-    path('api/nl/', include('nl_interact.urls')),
 
-    # API Documentation
-    path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
-    path('api/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
-    path('favicon.ico', RedirectView.as_view(url=staticfiles_storage.url('img/logo.png'))),
+    # API (auth, natural language, docs)
+    path('api/', include(api_urlpatterns)),
 ]
 
 # Serve media files in development
@@ -1,9 +1,63 @@
 # Kolokwa_connect/Kolokwa_connect/views.py
+import time
+from functools import lru_cache
+
 from django.shortcuts import render
-from dictionary.models import KoloquaEntry, WordCategory, TranslationHistory
-from users.models import User
-from django.db.models import Q, Count
-from django.http import HttpResponse
+from dictionary.models import KoloquaEntry, SiteStats, SITE_STATS_CACHE_KEY
+from django.contrib.postgres.search import SearchQuery
+from django.conf import settings
+from django.core.cache import cache
+from django.core.cache.utils import make_template_fragment_key
+
+# How long platform statistics are served from cache (seconds)
+SITE_STATS_TIMEOUT = 120
+# Width of the per-process statistics window (seconds)
+SITE_STATS_LOCAL_WINDOW = 60
+
+# Columns rendered by the word cards on the home page
+LISTING_FIELDS = ('koloqua_text', 'english_translation', 'entry_type', 'created_at')
+
+# {% cache %} fragments in index.html that depend on dictionary content
+HOME_FRAGMENTS = ('home_stats', 'home_recent_words')
+
+
+@lru_cache(maxsize=2)
+def _site_stats_for_window(window):
+    """
+    Platform statistics for one time window, memoized per process.
+    Read from the denormalized SiteStats row through the shared cache.
+    The returned dict is shared between requests; treat it as read-only.
+    """
+    stats = cache.get(SITE_STATS_CACHE_KEY)
+    if stats is None:
+        stats = SiteStats.load().as_dict()
+        cache.set(SITE_STATS_CACHE_KEY, stats, SITE_STATS_TIMEOUT)
+    return stats
+
+
+def get_site_stats():
+    """
+    Platform statistics shared by the home and about pages.
+    Within a window each worker answers from memory; the shared cache
+    is invalidated when entries or translations change.
+    """
+    return _site_stats_for_window(int(time.time() // SITE_STATS_LOCAL_WINDOW))
+
+
+def clear_local_site_stats():
+    """
+    Drop this process's memoized statistics and the cached home page fragments.
+    Connected to entry and translation changes in dictionary.signals.
+    """
+    _site_stats_for_window.cache_clear()
+    # The fragments are keyed on the request's active language, so clear every variant
+    languages = {settings.LANGUAGE_CODE, *(code for code, _ in settings.LANGUAGES)}
+    cache.delete_many([
+        make_template_fragment_key(fragment, [language])
+        for fragment in HOME_FRAGMENTS
+        for language in languages
+    ])
+
 
 def home(request):
     """
@@ -14,39 +68,29 @@ def home(request):
     search_results = None
 
     if query:
-        # Search dictionary entries
+        # Full-text search over the indexed search_vector (Koloqua + English stemming)
+        search_query = (
+            SearchQuery(query, config='simple', search_type='websearch') |
+            SearchQuery(query, config='english', search_type='websearch')
+        )
         search_results = KoloquaEntry.objects.filter(
-            Q(status='verified'),
-            Q(koloqua_text__icontains=query) |
-            Q(english_translation__icontains=query) |
-            Q(entry_type__icontains=query) |
-            Q(tags__icontains=query) |
-            Q(example_sentence_koloqua__icontains=query) |
-            Q(example_sentence_english__icontains=query)
-        ).distinct().order_by('-created_at')[:20]  # Limit to 20 results
+            status='verified',
+            search_vector=search_query
+        ).order_by('-created_at').values('id', *LISTING_FIELDS)[:20]  # Limit to 20 results
 
     # Get statistics for the dashboard
-    word_count = KoloquaEntry.objects.filter(status='verified').count()
-    
-    # FIXED: Use annotation instead of filtering by non-existent field
-    contributor_count = User.objects.annotate(
-        entry_count=Count('contributions')
-    ).filter(
-        is_active=True,
-        entry_count__gt=0
-    ).count()
-    
-    translation_count = TranslationHistory.objects.filter(found=True).count()
-    example_count = KoloquaEntry.objects.exclude(example_sentence_koloqua='').count()
+    stats = get_site_stats()
     
     # Get recently added words
-    recent_words = KoloquaEntry.objects.filter(status='verified').order_by('-created_at')[:6]
+    recent_words = KoloquaEntry.objects.filter(
+        status='verified'
+    ).only(*LISTING_FIELDS).order_by('-created_at')[:6]
 
     context = {
-        'word_count': word_count,
-        'contributor_count': contributor_count,
-        'translation_count': translation_count,
-        'example_count': example_count,
+        'word_count': stats['word_count'],
+        'contributor_count': stats['contributor_count'],
+        'translation_count': stats['translation_count'],
+        'example_count': stats['example_count'],
         'recent_words': recent_words,
         'search_results': search_results,
         'query': query,
@@ -58,42 +102,15 @@ def about(request):
     """
     About page view with platform statistics.
     """
-    # Total words in dictionary (verified only)
-    word_count = KoloquaEntry.objects.filter(status='verified').count()
-    
-    # Total registered users on platform
-    total_users = User.objects.filter(is_active=True).count()
-    
-    # FIXED: Use annotation instead of filtering by non-existent field
-    # Active contributors (users who have made contributions)
-    contributor_count = User.objects.annotate(
-        entry_count=Count('contributions')
-    ).filter(
-        is_active=True,
-        entry_count__gt=0
-    ).count()
-    
-    # Total translations found
-    translation_count = TranslationHistory.objects.filter(found=True).count()
-    
-    # Entries with example sentences
-    example_count = KoloquaEntry.objects.exclude(example_sentence_koloqua='').count()
-    
-    # Additional stats you might want
-    pending_entries = KoloquaEntry.objects.filter(status='pending').count()
-    total_entries = KoloquaEntry.objects.count()
+    stats = get_site_stats()
 
     context = {
-        'word_count': word_count,
-        'total_users': total_users,  # Total users
-        'contributor_count': contributor_count,  # Active contributors
-        'translation_count': translation_count,
-        'example_count': example_count,
-        'pending_entries': pending_entries,
-        'total_entries': total_entries,
+        'word_count': stats['word_count'],
+        'total_users': stats['total_users'],  # Total users
+        'contributor_count': stats['contributor_count'],  # Active contributors
+        'translation_count': stats['translation_count'],
+        'example_count': stats['example_count'],
+        'pending_entries': stats['pending_entries'],
+        'total_entries': stats['total_entries'],
     }
     return render(request, 'about.html', context)
-
-
-def health_check_view(request):
-    return HttpResponse("OK", status=200)
\ No newline at end of file
@@ -34,14 +34,33 @@ if not STATIC_DIR.exists():
     print(f"  mkdir {STATIC_DIR}")
     exit(1)
 
+def scan_directory(directory):
+    """Map file name -> size for one directory in a single scandir pass."""
+    try:
+        with os.scandir(directory) as entries:
+            return {
+                entry.name: entry.stat(follow_symlinks=False).st_size
+                for entry in entries if entry.is_file()
+            }
+    except FileNotFoundError:
+        return {}
+
+# Scan each parent directory once instead of stat-ing every file twice
+directory_listings = {}
+for file_path in required_files:
+    parent = (STATIC_DIR / file_path).parent
+    if parent not in directory_listings:
+        directory_listings[parent] = scan_directory(parent)
+
 missing_files = []
 found_files = []
 
 for file_path in required_files:
     full_path = STATIC_DIR / file_path
-    if full_path.exists():
+    listing = directory_listings[full_path.parent]
+    if full_path.name in listing:
         found_files.append(file_path)
-        file_size = full_path.stat().st_size
+        file_size = listing[full_path.name]
         print(f"✓ Found: {file_path} ({file_size:,} bytes)")
     else:
         missing_files.append(file_path)
@@ -1,10 +1,11 @@
 from django.contrib import admin
-from .models import KoloquaEntry, WordCategory, EntryVerification, EntryVote, TranslationHistory
+from .models import KoloquaEntry, WordCategory, EntryVerification, EntryVote, TranslationHistory, SiteStats
 
 @admin.register(WordCategory)
 class WordCategoryAdmin(admin.ModelAdmin):
     list_display = ['name', 'description', 'created_at']
     search_fields = ['name']
+    show_full_result_count = False
 
 
 @admin.register(KoloquaEntry)
@@ -14,13 +15,17 @@ class KoloquaEntryAdmin(admin.ModelAdmin):
     search_fields = ['koloqua_text', 'english_translation']
     readonly_fields = ['upvotes', 'downvotes', 'verification_count', 'created_at', 'updated_at']
     filter_horizontal = ['categories']
+    list_select_related = ['contributor']
+    show_full_result_count = False
     
     actions = ['mark_as_verified', 'mark_as_rejected']
     
     def mark_as_verified(self, request, queryset):
         queryset.update(status='verified')
+        SiteStats.recount()
     mark_as_verified.short_description = "Mark selected entries as Verified"
 
     def mark_as_rejected(self, request, queryset):
         queryset.update(status='rejected')
+        SiteStats.recount()
     mark_as_rejected.short_description = "Mark selected entries as Rejected"
\ No newline at end of file
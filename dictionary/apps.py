@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class DictionaryConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'dictionary'
+
+    def ready(self):
+        import dictionary.signals
@@ -5,10 +5,125 @@ and prepare it for database import.
 """
 
 import csv
+import functools
+import hashlib
+import itertools
+import json
+import mmap
+import os
 import re
-from typing import List, Tuple, Dict
+import string
+import sys
+from typing import List, Tuple, Dict, Iterator, Optional
 from pathlib import Path
 
+# Pattern used for every entry, compiled once at import
+WORD_RE = re.compile(r'\w+')
+
+# Processed hardcoded entries, regenerated with `python extract_koloqua_data.py --freeze`
+FROZEN_ENTRIES_PATH = Path(__file__).with_name('koloqua_entries.frozen.json')
+
+# Columns of the generated CSV, in order
+CSV_HEADERS = (
+    'koloqua_text',
+    'english_translation',
+    'example_sentence_koloqua',
+    'example_sentence_english',
+    'entry_type',
+    'context_explanation',
+    'tags',
+    'categories',
+)
+
+# Output buffer for the generated CSV; flushes in large writes instead of 8 KiB ones
+CSV_WRITE_BUFFER_SIZE = 1 << 20
+
+# Punctuation kept by clean_text() besides word characters and whitespace
+ALLOWED_PUNCTUATION = frozenset('-\'"()[]{},.!?;')
+
+
+class DisallowedCharsTable(dict):
+    """
+    str.translate() table deleting every character that is not a word
+    character, whitespace or allowed punctuation. Entries are filled in on
+    first sight of each code point, so the table stays small.
+    """
+
+    def __missing__(self, codepoint: int):
+        char = chr(codepoint)
+        if char.isalnum() or char == '_' or char.isspace() or char in ALLOWED_PUNCTUATION:
+            self[codepoint] = codepoint
+        else:
+            self[codepoint] = None
+        return self[codepoint]
+
+
+DISALLOWED_CHARS = DisallowedCharsTable()
+
+# Words in the English meaning that mark an entry as a proverb
+PROVERB_INDICATORS = frozenset({'expression', 'saying', 'proverb', 'oath'})
+
+# Conjunctions in the Koloqua text that mark a multi-word entry as an idiom
+IDIOM_CONJUNCTIONS = frozenset({'when', 'if', 'because', 'since'})
+
+# Usage flags, in priority order, and the substrings of the English meaning that raise them
+CONTEXT_FLAGS = (
+    ('insult', ('insult', 'ridicule')),
+    ('greeting', ('greeting', 'hello', 'goodbye')),
+    ('slang', ('slang', 'informal')),
+    ('traditional', ('traditional', 'secret', 'ritual')),
+)
+
+# Context explanation for every (flag, entry type) pair, formatted once
+CONTEXT_TEMPLATES = {
+    'insult': "Informal {} used to express criticism or mockery. Use with caution in formal settings.",
+    'greeting': "Common social {} used in everyday greetings and farewells.",
+    'slang': "Informal {} commonly used in casual conversation among peers.",
+    'traditional': "Traditional {} with cultural significance. May be used in specific cultural contexts.",
+    'common': "Common {} used in everyday Liberian Koloqua conversation.",
+}
+CONTEXT_EXPLANATIONS = {
+    (flag, entry_type): template.format(entry_type)
+    for flag, template in CONTEXT_TEMPLATES.items()
+    for entry_type in ('word', 'phrase', 'idiom', 'proverb')
+}
+
+# Semantic tags and the keywords (whole words) that trigger them
+TAG_TABLE = (
+    ('slang', frozenset({'slang', 'informal', 'street'})),
+    ('formal', frozenset({'formal', 'official', 'proper'})),
+    ('food', frozenset({'eat', 'food', 'cook', 'rice', 'soup', 'meat'})),
+    ('family', frozenset({'father', 'mother', 'brother', 'sister', 'aunt', 'uncle', 'child'})),
+    ('emotion', frozenset({'angry', 'happy', 'sad', 'love', 'hate', 'excited'})),
+    ('money', frozenset({'money', 'dollar', 'buy', 'sell', 'pay', 'business'})),
+    ('social', frozenset({'friend', 'greet', 'hello', 'goodbye', 'thank'})),
+    ('body', frozenset({'hand', 'foot', 'head', 'eye', 'body', 'heart'})),
+    ('animals', frozenset({'monkey', 'bird', 'fish', 'snake', 'chicken', 'cow'})),
+    ('clothing', frozenset({'wear', 'dress', 'shirt', 'clothes'})),
+    ('traditional', frozenset({'traditional', 'culture', 'secret', 'ritual'})),
+)
+
+# Categories (WordCategory names) and the keywords (whole words) that suggest them
+CATEGORY_TABLE = (
+    ('Greetings & Social', frozenset({'hello', 'goodbye', 'thank', 'please', 'welcome', 'friend'})),
+    ('Food & Cooking', frozenset({'rice', 'fish', 'cook', 'eat', 'food', 'soup', 'meat', 'drink'})),
+    ('Family & Relationships', frozenset({'father', 'mother', 'brother', 'sister', 'aunt', 'uncle', 'child', 'wife', 'husband'})),
+    ('Slang & Informal', frozenset({'slang', 'informal', 'street', 'crazy', 'stupid', 'fool'})),
+    ('Animals & Nature', frozenset({'monkey', 'bird', 'fish', 'snake', 'elephant', 'tree', 'forest', 'river'})),
+    ('Body & Health', frozenset({'head', 'hand', 'foot', 'eye', 'medicine', 'sick', 'pain', 'blood'})),
+    ('Clothing & Appearance', frozenset({'clothes', 'wear', 'dress', 'shirt', 'beautiful', 'ugly', 'hair'})),
+    ('Money & Business', frozenset({'money', 'dollar', 'buy', 'sell', 'pay', 'business', 'work'})),
+    ('Transportation', frozenset({'car', 'taxi', 'road', 'walk', 'travel', 'motorcycle'})),
+    ('Emotions & Feelings', frozenset({'happy', 'sad', 'angry', 'love', 'hate', 'fear', 'worry'})),
+    ('Traditional & Cultural', frozenset({'traditional', 'culture', 'secret', 'ritual', 'ceremony'})),
+)
+
+
+def tokenize(text_lower: str) -> set:
+    """Distinct words of already lower-cased text, ignoring punctuation."""
+    return set(WORD_RE.findall(text_lower))
+
+
 def parse_koloqua_dictionary_text(text_content: str) -> List[Dict[str, str]]:
     """
     Parse the Koloqua dictionary text and extract structured data.
@@ -20,156 +135,146 @@ def parse_koloqua_dictionary_text(text_content: str) -> List[Dict[str, str]]:
         List of dictionaries containing structured dictionary entries
     """
     entries = []
-    lines = text_content.strip().split('\n')
+    for line in text_content.strip().split('\n'):
+        entry = parse_dictionary_line(line)
+        if entry is not None:
+            entries.append(entry)
     
-    current_entry = {}
-    current_word = None
+    return entries
+
+def parse_koloqua_dictionary_file(file_path: str) -> List[Dict[str, str]]:
+    """
+    Parse a Koloqua dictionary text file without reading it into memory.
     
-    for line in lines:
-        line = line.strip()
-        
-        # Skip header and empty lines
-        if not line or line.startswith('Koloqua Dictionary') or line.startswith('Liberian Word'):
-            continue
-        
-        # Skip section headers (single letters)
-        if re.match(r'^[A-Z]\s*$', line):
-            continue
+    The file is memory-mapped and scanned line by line as bytes; only lines
+    that can hold an entry are decoded. Gives the same entries as
+    parse_koloqua_dictionary_text() on the file's text-mode contents.
+    
+    Args:
+        file_path: Path to a UTF-8 dictionary text file
         
-        # Parse dictionary entries
-        # Format: Word/Phrase\tMeaning\tSample Sentence\tEnglish Translation
-        parts = line.split('\t')
+    Returns:
+        List of dictionaries containing structured dictionary entries
+    """
+    entries = []
+    with open(file_path, 'rb') as file:
+        # mmap cannot map an empty file
+        if os.fstat(file.fileno()).st_size == 0:
+            return entries
         
-        if len(parts) >= 4:
-            koloqua_word = parts[0].strip()
-            english_meaning = parts[1].strip()
-            sample_koloqua = parts[2].strip()
-            sample_english = parts[3].strip()
-            
-            # Clean up the data
-            koloqua_word = clean_text(koloqua_word)
-            english_meaning = clean_text(english_meaning)
-            sample_koloqua = clean_text(sample_koloqua)
-            sample_english = clean_text(sample_english)
-            
-            # Skip if essential fields are empty
-            if not koloqua_word or not english_meaning:
-                continue
-            
-            entry = {
-                'koloqua_text': koloqua_word,
-                'english_translation': english_meaning,
-                'example_sentence_koloqua': sample_koloqua,
-                'example_sentence_english': sample_english,
-                'entry_type': determine_entry_type(koloqua_word, english_meaning),
-                'context_explanation': generate_context_explanation(koloqua_word, english_meaning),
-                'tags': generate_tags(koloqua_word, english_meaning),
-                'categories': suggest_categories(koloqua_word, english_meaning)
-            }
-            
-            entries.append(entry)
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for raw_line in iter(mapped.readline, b''):
+                # An entry needs four tab-separated fields; headers, section letters
+                # and blank lines have fewer tabs and are skipped undecoded
+                if raw_line.count(b'\t') < 3:
+                    continue
+                
+                # Text mode would also have split on lone '\r' line endings
+                text = raw_line.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+                for line in text.split('\n'):
+                    entry = parse_dictionary_line(line)
+                    if entry is not None:
+                        entries.append(entry)
     
     return entries
 
+def parse_dictionary_line(line: str) -> Optional[Dict[str, str]]:
+    """Parse one dictionary text line into an entry, or None for headers and incomplete lines."""
+    line = line.strip()
+    
+    # Skip header and empty lines
+    if not line or line.startswith('Koloqua Dictionary') or line.startswith('Liberian Word'):
+        return None
+    
+    # Skip section headers (single letters); the line is already stripped
+    if len(line) == 1 and line in string.ascii_uppercase:
+        return None
+    
+    # Parse dictionary entries
+    # Format: Word/Phrase\tMeaning\tSample Sentence\tEnglish Translation
+    parts = line.split('\t')
+    
+    if len(parts) < 4:
+        return None
+    
+    # Clean up the data
+    koloqua_word = clean_text(parts[0].strip())
+    english_meaning = clean_text(parts[1].strip())
+    sample_koloqua = clean_text(parts[2].strip())
+    sample_english = clean_text(parts[3].strip())
+    
+    # Skip if essential fields are empty
+    if not koloqua_word or not english_meaning:
+        return None
+    
+    # Lower-case once per entry for all classification helpers
+    koloqua_lower = koloqua_word.lower()
+    english_lower = english_meaning.lower()
+    entry_type = determine_entry_type(koloqua_lower, english_lower)
+    tags, categories = classify(koloqua_lower, english_lower)
+    
+    return {
+        'koloqua_text': koloqua_word,
+        'english_translation': english_meaning,
+        'example_sentence_koloqua': sample_koloqua,
+        'example_sentence_english': sample_english,
+        'entry_type': entry_type,
+        'context_explanation': generate_context_explanation(entry_type, english_lower),
+        'tags': list(tags),
+        'categories': list(categories)
+    }
+
 def clean_text(text: str) -> str:
     """Clean and normalize text content."""
     if not text:
         return ""
     
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
+    # Collapse whitespace; printable text (no tabs, newlines or exotic spaces)
+    # without doubled or edge spaces is already collapsed, so skip the split/join
+    if not (text.isprintable() and '  ' not in text and text[0] != ' ' and text[-1] != ' '):
+        text = ' '.join(text.split())
     
     # Remove control characters but keep basic punctuation
-    text = re.sub(r'[^\w\s\-\'\"\(\)\[\]\{\}\,\.\!\?\;]', '', text)
-    
-    return text
+    return text.translate(DISALLOWED_CHARS)
 
-def determine_entry_type(koloqua_text: str, english_translation: str) -> str:
-    """Determine if entry is word, phrase, idiom, or proverb."""
-    word_count = len(koloqua_text.split())
+def determine_entry_type(koloqua_lower: str, english_lower: str) -> str:
+    """Determine if entry is word, phrase, idiom, or proverb from lower-cased texts."""
+    word_count = len(koloqua_lower.split())
     
     if word_count == 1:
         return 'word'
-    elif any(indicator in english_translation.lower() for indicator in 
-             ['expression', 'saying', 'proverb', 'oath']):
+    elif not PROVERB_INDICATORS.isdisjoint(tokenize(english_lower)):
         return 'proverb'
-    elif word_count > 4 or any(word in koloqua_text.lower() for word in 
-                               ['when', 'if', 'because', 'since']):
+    elif word_count > 4 or not IDIOM_CONJUNCTIONS.isdisjoint(tokenize(koloqua_lower)):
         return 'idiom'
     else:
         return 'phrase'
 
-def generate_context_explanation(koloqua_text: str, english_translation: str) -> str:
-    """Generate context explanation for usage."""
-    entry_type = determine_entry_type(koloqua_text, english_translation)
-    
-    if 'insult' in english_translation.lower() or 'ridicule' in english_translation.lower():
-        return f"Informal {entry_type} used to express criticism or mockery. Use with caution in formal settings."
-    elif any(word in english_translation.lower() for word in ['greeting', 'hello', 'goodbye']):
-        return f"Common social {entry_type} used in everyday greetings and farewells."
-    elif any(word in english_translation.lower() for word in ['slang', 'informal']):
-        return f"Informal {entry_type} commonly used in casual conversation among peers."
-    elif any(word in english_translation.lower() for word in ['traditional', 'secret', 'ritual']):
-        return f"Traditional {entry_type} with cultural significance. May be used in specific cultural contexts."
-    else:
-        return f"Common {entry_type} used in everyday Liberian Koloqua conversation."
+def generate_context_explanation(entry_type: str, english_lower: str) -> str:
+    """Generate context explanation for usage from the entry type and lower-cased translation."""
+    for flag, keywords in CONTEXT_FLAGS:
+        if any(keyword in english_lower for keyword in keywords):
+            return CONTEXT_EXPLANATIONS[flag, entry_type]
+    return CONTEXT_EXPLANATIONS['common', entry_type]
 
-def generate_tags(koloqua_text: str, english_translation: str) -> List[str]:
-    """Generate relevant tags for the entry."""
-    tags = ['koloqua', 'liberian']
-    
-    text_combined = (koloqua_text + ' ' + english_translation).lower()
+@functools.lru_cache(maxsize=4096)
+def classify(koloqua_lower: str, english_lower: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Generate relevant tags and suggest categories for the entry from one tokenization.
+    Memoized on the two strings, so results are tuples; callers copy them into lists.
+    """
+    tokens = tokenize(koloqua_lower + ' ' + english_lower)
     
     # Add semantic tags based on content
-    tag_keywords = {
-        'slang': ['slang', 'informal', 'street'],
-        'formal': ['formal', 'official', 'proper'],
-        'food': ['eat', 'food', 'cook', 'rice', 'soup', 'meat'],
-        'family': ['father', 'mother', 'brother', 'sister', 'aunt', 'uncle', 'child'],
-        'emotion': ['angry', 'happy', 'sad', 'love', 'hate', 'excited'],
-        'money': ['money', 'dollar', 'buy', 'sell', 'pay', 'business'],
-        'social': ['friend', 'greet', 'hello', 'goodbye', 'thank'],
-        'body': ['hand', 'foot', 'head', 'eye', 'body', 'heart'],
-        'animals': ['monkey', 'bird', 'fish', 'snake', 'chicken', 'cow'],
-        'clothing': ['wear', 'dress', 'shirt', 'clothes'],
-        'traditional': ['traditional', 'culture', 'secret', 'ritual']
-    }
-    
-    for tag, keywords in tag_keywords.items():
-        if any(keyword in text_combined for keyword in keywords):
-            tags.append(tag)
+    tags = ('koloqua', 'liberian') + tuple(tag for tag, keywords in TAG_TABLE if not keywords.isdisjoint(tokens))
     
-    return tags
-
-def suggest_categories(koloqua_text: str, english_translation: str) -> List[str]:
-    """Suggest appropriate categories for the entry."""
-    text_combined = (koloqua_text + ' ' + english_translation).lower()
-    
-    categories = []
-    
-    category_mappings = {
-        'Greetings & Social': ['hello', 'goodbye', 'thank', 'please', 'welcome', 'friend'],
-        'Food & Cooking': ['rice', 'fish', 'cook', 'eat', 'food', 'soup', 'meat', 'drink'],
-        'Family & Relationships': ['father', 'mother', 'brother', 'sister', 'aunt', 'uncle', 'child', 'wife', 'husband'],
-        'Slang & Informal': ['slang', 'informal', 'street', 'crazy', 'stupid', 'fool'],
-        'Animals & Nature': ['monkey', 'bird', 'fish', 'snake', 'elephant', 'tree', 'forest', 'river'],
-        'Body & Health': ['head', 'hand', 'foot', 'eye', 'medicine', 'sick', 'pain', 'blood'],
-        'Clothing & Appearance': ['clothes', 'wear', 'dress', 'shirt', 'beautiful', 'ugly', 'hair'],
-        'Money & Business': ['money', 'dollar', 'buy', 'sell', 'pay', 'business', 'work'],
-        'Transportation': ['car', 'taxi', 'road', 'walk', 'travel', 'motorcycle'],
-        'Emotions & Feelings': ['happy', 'sad', 'angry', 'love', 'hate', 'fear', 'worry'],
-        'Traditional & Cultural': ['traditional', 'culture', 'secret', 'ritual', 'ceremony']
-    }
-    
-    for category, keywords in category_mappings.items():
-        if any(keyword in text_combined for keyword in keywords):
-            categories.append(category)
+    categories = tuple(category for category, keywords in CATEGORY_TABLE if not keywords.isdisjoint(tokens))
     
     # Default category if none found
     if not categories:
-        categories.append('Slang & Informal')
+        categories = ('Slang & Informal',)
     
-    return categories
+    return tags, categories
 
 def create_csv_from_dictionary_text(input_file_path: str = None, output_csv_path: str = "koloqua_dictionary.csv") -> None:
     """
@@ -180,349 +285,393 @@ def create_csv_from_dictionary_text(input_file_path: str = None, output_csv_path
         output_csv_path: Path for output CSV file
     """
     
-    # Use the provided dictionary data (hardcoded for reliability)
-    dictionary_entries = get_hardcoded_dictionary_data()
+    # Use the provided dictionary data (hardcoded for reliability): the processed
+    # snapshot when it is current, otherwise processed and streamed row by row
+    dictionary_entries = load_frozen_entries()
+    if dictionary_entries is None:
+        dictionary_entries = iter_hardcoded_entries()
     
     # If input file provided, try to parse it
     if input_file_path and Path(input_file_path).exists():
         try:
-            with open(input_file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
-                parsed_entries = parse_koloqua_dictionary_text(content)
-                if parsed_entries:
-                    dictionary_entries.extend(parsed_entries)
+            parsed_entries = parse_koloqua_dictionary_file(input_file_path)
+            if parsed_entries:
+                dictionary_entries = itertools.chain(dictionary_entries, parsed_entries)
         except Exception as e:
             print(f"Error reading input file: {e}")
     
     # Write to CSV
-    csv_headers = [
-        'koloqua_text',
-        'english_translation', 
-        'example_sentence_koloqua',
-        'example_sentence_english',
-        'entry_type',
-        'context_explanation',
-        'tags',
-        'categories'
-    ]
-    
-    with open(output_csv_path, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=csv_headers)
-        writer.writeheader()
+    with open(output_csv_path, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER_SIZE) as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(CSV_HEADERS)
         
-        for entry in dictionary_entries:
-            # Convert lists to comma-separated strings
-            entry_copy = entry.copy()
-            if isinstance(entry_copy.get('tags'), list):
-                entry_copy['tags'] = ','.join(entry_copy['tags'])
-            if isinstance(entry_copy.get('categories'), list):
-                entry_copy['categories'] = ','.join(entry_copy['categories'])
-            
-            writer.writerow(entry_copy)
+        # Rows in CSV_HEADERS order; lists become comma-separated strings.
+        # The counter advances once per written row
+        row_counter = itertools.count()
+        writer.writerows(
+            (
+                entry['koloqua_text'],
+                entry['english_translation'],
+                entry['example_sentence_koloqua'],
+                entry['example_sentence_english'],
+                entry['entry_type'],
+                entry['context_explanation'],
+                ','.join(entry['tags']),
+                ','.join(entry['categories']),
+            )
+            for entry, _ in zip(dictionary_entries, row_counter)
+        )
+        entry_count = next(row_counter)
     
-    print(f"Created CSV file with {len(dictionary_entries)} entries: {output_csv_path}")
+    print(f"Created CSV file with {entry_count} entries: {output_csv_path}")
 
-def get_hardcoded_dictionary_data() -> List[Dict[str, str]]:
-    """Return hardcoded dictionary data extracted from the provided document."""
-    
-    raw_entries = [
-        # A
-        ("Abuse", "To insult, ridicule", "Buh you na abuse the man bad way oh!", "You shouldn't insult the man badly!"),
-        ("Argo Oil", "Vegetable oil", "Wheh play ley argo oy (eh)?", "Where is the vegetable oil?"),
-        ("Air cool", "Air conditioning", "", ""),
-        ("All two", "both", "Take all two to the papay deh", "Take both to the old man"),
-        ("Ants bear", "The pangolin", "", ""),
-        ("Antay", "Aunt", "La ma antay (deh)", "That's my aunt (there)"),
-        
-        # B
-        ("Ba", "A friend, buddy, peer", "Ba, come leh go", "Friend, come let's go"),
-        ("bamboo", "The raffia palm tree", "", ""),
-        ("baboon", "chimpanzee", "", ""),
-        ("Baf fence", "An outdoor shower area", "", ""),
-        ("Bamboo wine", "Palm wine", "", ""),
-        ("Bamboo worm", "Beetle grubs", "", ""),
-        ("banjo", "To sell something at a discount; cheap", "All de tinnen you selling yeh, la banjo?", "Everything you sell, are they cheap?"),
-        ("Barbing saloon", "Barber shop", "We coming go to lay barbing saloon jessna", "We are going to the barbershop right now"),
-        ("Beard-beard", "A longer beard on a man", "See beard-beard oh!", "Look at his beard!"),
-        ("Bend-bend", "Crooked, twisted, not straight", "", ""),
-        ("Bend de elbow", "To get drunk", "I no longer bend de elbow", "I no longer drink alcohol"),
-        ("Behind you", "To bother someone, to nag", "Buh what you behind me for again?", "Why are you harassing me again?"),
-        ("belle", "Big stomach; pregnancy", "The woman geh belle for da man", "The woman was impregnated by that man"),
-        ("Bessa", "A busybody, gossip, rumors", "Do na believe dat ting, dat bessa", "Don't believe that, that's gossip"),
-        ("Bessa body", "busy body; to be a gossip", "It na good to be bessa body oh", "It's not good to be a gossip"),
-        ("Big Book", "educated English, big words", "La your big book, don't bring it to me oh", "Don't speak to me using big words I don't understand"),
-        ("Biggor boy", "A big shot (usually young person)", "See biggor boy oh", "Look at the big shot"),
-        ("Big cold", "Very cold temperature", "", ""),
-        ("Big heart", "To be arrogant, boastful, brave", "You tink say you geh big heart?", "Do you think you're that bold and arrogant?"),
-        ("Big man", "A big shot, government official", "", ""),
-        ("Billhook", "A small cutting tool for harvesting rice", "", ""),
-        ("biskeh", "Biscuit or cookies", "La how much you buy dih biskeh?", "How much were these biscuits?"),
-        ("Bite an blow", "To take advantage of someone by fooling them", "", ""),
-        ("Blance", "To hit the football against something", "", ""),
-        ("Blast", "Yelling, reprimanding", "I will blast you jessna", "I will reprimand you immediately"),
-        ("Blay", "Stylish or fashionable clothing", "See blay oh!", "This person is very fashionable"),
-        ("Blinger", "A cell phone", "", ""),
-        ("Blood fish", "Atlantic blue fin tuna", "", ""),
-        ("Blood tableh", "Vitamin pills/tablets", "", ""),
-        ("Blood wasting", "Bleeding", "", ""),
-        ("Bluff", "To show off, to flaunt", "Oh? So la me you bluffing so?", "Are you showing off for me?"),
-        ("Bluffuh-joe", "Someone who is a showoff", "Looka this other bluffuh-joe", "Look at this showoff"),
-        ("Bobo", "A deaf mute person; ignorant person", "Small more, you will be bobo", "Keep this up and you'll be senseless"),
-        ("Body bra", "A one-piece women's swimsuit", "", ""),
-        ("Body Man", "A body builder; muscular man", "", ""),
-        ("Boiling", "Going out, having fun", "Today we boil!", "Today we're having fun!"),
-        ("Boke", "I see you; I catch you", "I boke you!", "I caught you!"),
-        ("Boney", "Dried herring fish", "The dry boney sweet in this food yeh", "The dried herring is tasty in this dish"),
-        ("Book", "A general term for education", "Book see book, book hide", "When educated meets more educated, the less educated defers"),
-        ("Book people", "The educated class", "The book people na come oh", "The educated people are here"),
-        ("Boid", "Bird", "How they can call da blah bweh?", "What is the name of that black bird?"),
-        ("Born town", "Birthplace; hometown", "", ""),
-        ("Bounder", "A rascal", "", ""),
-        ("Brabee", "An older brother", "Brabee you know you de bossman now", "Big bro, you're the boss now"),
-        ("Brackeh", "To meet up with someone", "Where can we brackeh?", "Where can we meet?"),
-        ("Bread nut", "Jack fruit", "", ""),
-        ("Break word", "To state an opinion", "", ""),
-        ("Bright", "Light skinned/complexion", "Wheh play breh Fatu eh?", "Where is fair-skinned Fatu?"),
-        ("Brutha", "Male sibling, close friend", "", ""),
-        ("Buba", "A long robe associated with Muslims", "", ""),
-        ("Bufeh", "To seize or takeaway quickly", "", ""),
-        ("Bugumaa", "Imaginary evil spirits or genies", "", ""),
-        ("Bug-a-bug", "termites", "", ""),
-        ("Bug-a-bug eat your brain", "Are you stupid?", "Bug-a-bug eat yor brain?", "Are you stupid?"),
-        ("Bumpay", "To hit a target", "ah bumpay!", "I hit the target!"),
-        ("Bunga", "The buttocks", "", ""),
-        ("Bush-school", "Traditional school; Sande and Poro", "", ""),
-        ("Bush cat", "The palm civet or golden cat", "", ""),
-        ("Bush chicken", "The partridge", "", ""),
-        ("Bush cow", "West African dwarf buffalo", "", ""),
-        ("Bush dog", "The river otter; mongoose", "", ""),
-        ("Bush road", "A foot path in the forest", "", ""),
-        ("Bush taxi", "To travel by foot", "", ""),
-        ("Bush wife", "Country wife; native woman", "", ""),
-        ("Butta rice", "Starchy imported rice from China", "", ""),
-        ("Butt up with", "Bump into someone unexpectedly", "I na butt up with my brother today oh!", "I ran into my brother today!"),
-        
-        # C
-        ("Call me dog", "An oath to hold someone in contempt", "If I don't put one slap in your ear, call me dog!", "I'd rather be called a dog than let you do that!"),
-        ("Calopay", "To knock down; turn over flat", "", ""),
-        ("Cahmo", "Commode; toilet", "I am going to use the cahmo", "I'm going to use the toilet"),
-        ("Cane juice", "Sugarcane liquor", "", ""),
-        ("Carboy", "Conductor driver assistant", "I cant drive dis truck without a carboy", "I can't drive this truck without an assistant"),
-        ("Car pay", "Taxi or bus fare", "", ""),
-        ("Cassava snake", "The Gaboon viper", "", ""),
-        ("Cat eye", "Light colored eyes; road reflectors", "", ""),
-        ("Catoon", "A cardboard box or carton", "Y'all muh bust la catoon in the back", "Please break that box in the backyard"),
-        ("Cavalla fish", "An Atlantic horse mackerel fish", "", ""),
-        ("Chakla", "To destroy, mess up", "The how y'all now chakla this room", "Look how you've messed up this room"),
-        ("Charged", "To be intoxicated", "", ""),
-        ("Chant", "To recite a magical spell", "", ""),
-        ("Chap", "To cut with a knife", "", ""),
-        ("Che", "An expression of surprise", "Che! So this whole pot of rice y'all na swallow all?", "So you ate all this rice?"),
-        ("Che-che", "Gossip, slander", "", ""),
-        ("Che-che-polay", "a gossip", "Chechepolay move from behind me oh!", "Gossip, get away from me!"),
-        ("Chuck rice", "Rice with greens and gravy", "I coming eat my chuck rice", "I'm going to eat my chuck rice"),
-        ("Chek", "A girlfriend or lover", "", ""),
-        ("Chicken rogue", "A chicken thief", "", ""),
-        ("Chicken soup", "Bullion cubes", "How you will fix this palm butter without chicken soup?", "How will you make palm butter without bullion cubes?"),
-        ("chiklet", "Bubble gum", "This chicklet sweet oh!", "This gum is sweet!"),
-        ("Chinee leh", "Cheap Chinese battery lamp", "Lih ullur Chinee leh na geh nattin inside", "The Chinese light has nothing inside"),
-        ("Chinee man", "Any Asian-looking man", "Go to ley chinee man on broad street", "Go to the Chinese man on Broad Street"),
-        ("chop", "To misuse money wrongfully", "You na chop the man schoo fees", "You misused the man's school fees"),
-        ("Church motha", "An older church lady leader", "", ""),
-        ("Civilize", "Westernized, Christian, educated", "", ""),
-        ("Coe tar ro", "A paved road", "Ley pull na fix the coe tar ro", "The people have fixed the road"),
-        ("Coat suit", "A two or three piece men's suit", "See the man coat suit seh", "Look at his nice suit"),
-        ("Coe bo", "Cheap street food", "I jeh eating my small coe bo", "I'm eating a small meal"),
-        ("Coe bo shop", "A small cook shop", "I to the coe bo shop", "I'm at the cook shop"),
-        ("Coffee bag fall in de wuhtuh", "Someone has gone crazy", "", ""),
-        ("Coh-pa", "A charcoal stove", "", ""),
-        ("Cook spoon", "A large metal cooking spoon", "", ""),
-        ("Colloma", "Fake or imitation", "", ""),
-        ("Come leh eat", "Polite invitation to eat", "", ""),
-        ("Common", "Well known, ordinary", "", ""),
-        ("Comping", "A rotational savings club", "", ""),
-        ("Con", "Crook", "", ""),
-        ("Correh", "Something of good quality", "Da man correh oh", "That man is good/upstanding"),
-        ("Cattah", "Cloth used to balance head load", "", ""),
-        ("Cotton tree", "The silk cotton tree", "", ""),
-        ("Country bread", "Pounced rice meal", "", ""),
-        ("Country chalk", "White clay for medicine/ritual", "", ""),
-        ("Country chicken", "Free-range village chicken", "", ""),
-        ("Country chop", "Stew with various meats over rice", "", ""),
-        ("Country guitar", "Homemade stringed instrument", "", ""),
-        ("Country medicine", "Traditional herbal remedies", "", ""),
-        ("Country money", "Thin iron rods used as currency", "", ""),
-        ("Country ray", "The country is economically hard", "Since this man take the country, the country ray", "Since this president took office, times are tough"),
-        ("Country rope", "Forest vines for tying", "", ""),
-        ("Country salt", "Potash made from palm ashes", "", ""),
-        ("Country soap", "Traditional village-made soap", "", ""),
-        ("Cow spirit", "Egret (white bird)", "", ""),
-        ("Co wator", "Bribe; welcome liquor", "", ""),
-        ("Crackay", "Stubborn, argumentative person", "", ""),
-        ("Craw-craw", "An itchy skin disease", "", ""),
-        ("Craw-craw frog", "A toad", "", ""),
-        ("Credih", "An advance loan, cell phone units", "", ""),
-        ("Crushing", "Having romantic feelings", "", ""),
-        ("Cruss", "Rice crust from pot bottom", "", ""),
-        ("Culture", "Traditional secret societies", "", ""),
-        ("Cup", "A can used to measure rice", "", ""),
-        ("Currenn", "Electricity", "", ""),
-        ("Cutlax", "A machete", "", ""),
-        ("cycle", "A bicycle", "", ""),
-        
-        # D
-        ("Da lie", "Not true; false", "Da ting you sayin da lie", "What you're saying is a lie"),
-        ("Dat ha", "That's how", "", ""),
-        ("Dan", "Ten Liberian dollars", "", ""),
-        ("Day bor", "Casual daily laborer", "", ""),
-        ("Dealin", "Using witchcraft/sorcery", "", ""),
-        ("Dear", "Expensive, costly", "This thing dear oh", "This is expensive"),
-        ("Deer", "The duiker antelope", "", ""),
-        ("Dux", "To ace something, top performer", "", ""),
-        ("Dey few days", "Recently", "", ""),
-        ("Dorfa", "A duck", "", ""),
-        ("Different different", "Several varieties", "", ""),
-        ("Direct code", "Straight talk, bold speech", "", ""),
-        ("Deeshcloth", "Eczema, skin rash", "You have deeshcloth on your hand", "You have eczema on your hand"),
-        ("Dite", "Garbage, trash", "", ""),
-        ("Dog baby", "Puppy", "", ""),
-        ("Dokafleh", "Used clothes from abroad", "Please bi me dokafleh sneakor", "Please buy me used sneakers"),
-        ("Dolphin fish", "The mahi-mahi fish", "", ""),
-        ("Dooji", "Heroin", "", ""),
-        ("Door mouf", "A doorway", "", ""),
-        ("Dragon", "A malevolent reptilian spirit", "", ""),
-        ("Drappay", "To give a small gift", "", ""),
-        ("Dress", "Move closer together, scoot over", "", ""),
-        ("Drill", "To march in military parade", "", ""),
-        ("Drunk you", "To get someone drunk", "", ""),
-        ("Druss", "Western medicine", "", ""),
-        ("Dry", "To be skinny or malnourished", "", ""),
-        ("Drah face", "To be unashamed; bold", "", ""),
-        ("Dry meat", "Dried bush meat", "", ""),
-        ("Dry monkey", "Severe malnutrition", "", ""),
-        ("Du", "The kusimanse mongoose", "", ""),
-        ("Dukor", "Monrovia", "", ""),
-        ("Dumboy", "Thick cassava dough to swallow", "", ""),
-        ("Dunkin", "Ignorant; fooled easily", "", ""),
-        ("Dusta", "A blackboard eraser", "", ""),
-        ("Dumpile", "A garbage dump", "", ""),
-        ("Dusty road", "A dirt/unpaved road", "", ""),
-        ("Dwah", "Small mythical creatures", "", ""),
-        ("Dynamo", "A diesel generator", "", ""),
-        
-        # E
-        ("Ee mah eyeball", "To rip someone off", "The man really eat my eyeball", "The man really cheated me"),
-        ("Een de butto", "To be drunk", "", ""),
-        ("Eh yah", "Expression of sympathy", "", ""),
-        ("Eye turning", "To be dizzy or drunk", "", ""),
-        ("Elda", "Title of respect for older person", "", ""),
-        
-        # F
-        ("Face cap", "Baseball hat", "", ""),
-        ("Fall off", "To fall apart, break", "", ""),
-        ("Fanga", "Small two-head pressure drum", "", ""),
-        ("Fanner", "Flat basket to winnow rice", "", ""),
-        ("Fanti cloth", "Brightly colored African cloth", "", ""),
-        ("Farina", "Dried cassava flakes cereal", "", ""),
-        ("Farm ro far", "To be deaf; distance is far", "", ""),
-        ("Fever grass", "Lemongrass", "", ""),
-        ("Fever leaf", "Wild basil plant", "", ""),
-        ("Fek-fek", "Fake, not true, worthless", "", ""),
-        ("Fine", "Beautiful, attractive", "This girl fine oh!", "This girl is beautiful!"),
-        ("Too Fine", "Too beautiful", "", ""),
-        ("Fish cup", "Tin of cooked fish in oil", "", ""),
-        ("Fiya", "To shoot at with weapon", "", ""),
-        ("Fiya behine", "To pressure; force someone", "", ""),
-        ("Flakajay", "Foolish; senseless; substandard", "I do na like dat flakajay talk", "I don't like that foolish talk"),
-        ("Flash", "Call and hang up after one ring", "", ""),
-        ("Flask", "A thermos for hot water", "", ""),
-        ("Flexing", "To party, go nightclubbing", "", ""),
-        ("Flok", "To beat as punishment", "", ""),
-        ("For common", "Commonly, often", "", ""),
-        ("For nating", "Worthless, good for nothing", "", ""),
-        ("Fooly tongor", "The gray duiker antelope", "", ""),
-        ("Foot", "The entire leg including foot", "", ""),
-        ("Fox", "The slender mongoose", "", ""),
-        ("Freak ah", "To love or be attracted to", "", ""),
-        ("Film sho", "A movie, video, or film", "", ""),
-        ("Fresh", "To be beautiful or fine", "", ""),
-        ("Fresh co", "Common cold, runny nose", "", ""),
-        ("Friskay", "Wild, rude, overactive", "Dis boy friskay-o", "This boy is wild!"),
-        ("Frog baby", "A tadpole", "", ""),
-        ("Forstor", "Slang for food or to eat", "", ""),
-        ("Fuan-fuan", "Trouble; problem; headache", "I do na wan any fuan-fuan", "I don't want any trouble"),
-        ("Fuel oil", "Diesel fuel/gas oil", "", ""),
-        ("Full-uh", "Something that is very full", "", ""),
-        ("Funny", "Doing something foolish or stupid", "Look a aye, you funny, ehn?", "Look at you, are you being stupid?"),
-        ("Fufu", "Food made from cassava", "", ""),
+# Entries extracted from the provided document, one per line:
+# Word/Phrase<TAB>Meaning<TAB>Sample Sentence<TAB>English Translation
+HARDCODED_ENTRIES_TSV = """\
+# A
+Abuse\tTo insult, ridicule\tBuh you na abuse the man bad way oh!\tYou shouldn't insult the man badly!
+Argo Oil\tVegetable oil\tWheh play ley argo oy (eh)?\tWhere is the vegetable oil?
+Air cool\tAir conditioning\t\t
+All two\tboth\tTake all two to the papay deh\tTake both to the old man
+Ants bear\tThe pangolin\t\t
+Antay\tAunt\tLa ma antay (deh)\tThat's my aunt (there)
+
+# B
+Ba\tA friend, buddy, peer\tBa, come leh go\tFriend, come let's go
+bamboo\tThe raffia palm tree\t\t
+baboon\tchimpanzee\t\t
+Baf fence\tAn outdoor shower area\t\t
+Bamboo wine\tPalm wine\t\t
+Bamboo worm\tBeetle grubs\t\t
+banjo\tTo sell something at a discount; cheap\tAll de tinnen you selling yeh, la banjo?\tEverything you sell, are they cheap?
+Barbing saloon\tBarber shop\tWe coming go to lay barbing saloon jessna\tWe are going to the barbershop right now
+Beard-beard\tA longer beard on a man\tSee beard-beard oh!\tLook at his beard!
+Bend-bend\tCrooked, twisted, not straight\t\t
+Bend de elbow\tTo get drunk\tI no longer bend de elbow\tI no longer drink alcohol
+Behind you\tTo bother someone, to nag\tBuh what you behind me for again?\tWhy are you harassing me again?
+belle\tBig stomach; pregnancy\tThe woman geh belle for da man\tThe woman was impregnated by that man
+Bessa\tA busybody, gossip, rumors\tDo na believe dat ting, dat bessa\tDon't believe that, that's gossip
+Bessa body\tbusy body; to be a gossip\tIt na good to be bessa body oh\tIt's not good to be a gossip
+Big Book\teducated English, big words\tLa your big book, don't bring it to me oh\tDon't speak to me using big words I don't understand
+Biggor boy\tA big shot (usually young person)\tSee biggor boy oh\tLook at the big shot
+Big cold\tVery cold temperature\t\t
+Big heart\tTo be arrogant, boastful, brave\tYou tink say you geh big heart?\tDo you think you're that bold and arrogant?
+Big man\tA big shot, government official\t\t
+Billhook\tA small cutting tool for harvesting rice\t\t
+biskeh\tBiscuit or cookies\tLa how much you buy dih biskeh?\tHow much were these biscuits?
+Bite an blow\tTo take advantage of someone by fooling them\t\t
+Blance\tTo hit the football against something\t\t
+Blast\tYelling, reprimanding\tI will blast you jessna\tI will reprimand you immediately
+Blay\tStylish or fashionable clothing\tSee blay oh!\tThis person is very fashionable
+Blinger\tA cell phone\t\t
+Blood fish\tAtlantic blue fin tuna\t\t
+Blood tableh\tVitamin pills/tablets\t\t
+Blood wasting\tBleeding\t\t
+Bluff\tTo show off, to flaunt\tOh? So la me you bluffing so?\tAre you showing off for me?
+Bluffuh-joe\tSomeone who is a showoff\tLooka this other bluffuh-joe\tLook at this showoff
+Bobo\tA deaf mute person; ignorant person\tSmall more, you will be bobo\tKeep this up and you'll be senseless
+Body bra\tA one-piece women's swimsuit\t\t
+Body Man\tA body builder; muscular man\t\t
+Boiling\tGoing out, having fun\tToday we boil!\tToday we're having fun!
+Boke\tI see you; I catch you\tI boke you!\tI caught you!
+Boney\tDried herring fish\tThe dry boney sweet in this food yeh\tThe dried herring is tasty in this dish
+Book\tA general term for education\tBook see book, book hide\tWhen educated meets more educated, the less educated defers
+Book people\tThe educated class\tThe book people na come oh\tThe educated people are here
+Boid\tBird\tHow they can call da blah bweh?\tWhat is the name of that black bird?
+Born town\tBirthplace; hometown\t\t
+Bounder\tA rascal\t\t
+Brabee\tAn older brother\tBrabee you know you de bossman now\tBig bro, you're the boss now
+Brackeh\tTo meet up with someone\tWhere can we brackeh?\tWhere can we meet?
+Bread nut\tJack fruit\t\t
+Break word\tTo state an opinion\t\t
+Bright\tLight skinned/complexion\tWheh play breh Fatu eh?\tWhere is fair-skinned Fatu?
+Brutha\tMale sibling, close friend\t\t
+Buba\tA long robe associated with Muslims\t\t
+Bufeh\tTo seize or takeaway quickly\t\t
+Bugumaa\tImaginary evil spirits or genies\t\t
+Bug-a-bug\ttermites\t\t
+Bug-a-bug eat your brain\tAre you stupid?\tBug-a-bug eat yor brain?\tAre you stupid?
+Bumpay\tTo hit a target\tah bumpay!\tI hit the target!
+Bunga\tThe buttocks\t\t
+Bush-school\tTraditional school; Sande and Poro\t\t
+Bush cat\tThe palm civet or golden cat\t\t
+Bush chicken\tThe partridge\t\t
+Bush cow\tWest African dwarf buffalo\t\t
+Bush dog\tThe river otter; mongoose\t\t
+Bush road\tA foot path in the forest\t\t
+Bush taxi\tTo travel by foot\t\t
+Bush wife\tCountry wife; native woman\t\t
+Butta rice\tStarchy imported rice from China\t\t
+Butt up with\tBump into someone unexpectedly\tI na butt up with my brother today oh!\tI ran into my brother today!
+
+# C
+Call me dog\tAn oath to hold someone in contempt\tIf I don't put one slap in your ear, call me dog!\tI'd rather be called a dog than let you do that!
+Calopay\tTo knock down; turn over flat\t\t
+Cahmo\tCommode; toilet\tI am going to use the cahmo\tI'm going to use the toilet
+Cane juice\tSugarcane liquor\t\t
+Carboy\tConductor driver assistant\tI cant drive dis truck without a carboy\tI can't drive this truck without an assistant
+Car pay\tTaxi or bus fare\t\t
+Cassava snake\tThe Gaboon viper\t\t
+Cat eye\tLight colored eyes; road reflectors\t\t
+Catoon\tA cardboard box or carton\tY'all muh bust la catoon in the back\tPlease break that box in the backyard
+Cavalla fish\tAn Atlantic horse mackerel fish\t\t
+Chakla\tTo destroy, mess up\tThe how y'all now chakla this room\tLook how you've messed up this room
+Charged\tTo be intoxicated\t\t
+Chant\tTo recite a magical spell\t\t
+Chap\tTo cut with a knife\t\t
+Che\tAn expression of surprise\tChe! So this whole pot of rice y'all na swallow all?\tSo you ate all this rice?
+Che-che\tGossip, slander\t\t
+Che-che-polay\ta gossip\tChechepolay move from behind me oh!\tGossip, get away from me!
+Chuck rice\tRice with greens and gravy\tI coming eat my chuck rice\tI'm going to eat my chuck rice
+Chek\tA girlfriend or lover\t\t
+Chicken rogue\tA chicken thief\t\t
+Chicken soup\tBullion cubes\tHow you will fix this palm butter without chicken soup?\tHow will you make palm butter without bullion cubes?
+chiklet\tBubble gum\tThis chicklet sweet oh!\tThis gum is sweet!
+Chinee leh\tCheap Chinese battery lamp\tLih ullur Chinee leh na geh nattin inside\tThe Chinese light has nothing inside
+Chinee man\tAny Asian-looking man\tGo to ley chinee man on broad street\tGo to the Chinese man on Broad Street
+chop\tTo misuse money wrongfully\tYou na chop the man schoo fees\tYou misused the man's school fees
+Church motha\tAn older church lady leader\t\t
+Civilize\tWesternized, Christian, educated\t\t
+Coe tar ro\tA paved road\tLey pull na fix the coe tar ro\tThe people have fixed the road
+Coat suit\tA two or three piece men's suit\tSee the man coat suit seh\tLook at his nice suit
+Coe bo\tCheap street food\tI jeh eating my small coe bo\tI'm eating a small meal
+Coe bo shop\tA small cook shop\tI to the coe bo shop\tI'm at the cook shop
+Coffee bag fall in de wuhtuh\tSomeone has gone crazy\t\t
+Coh-pa\tA charcoal stove\t\t
+Cook spoon\tA large metal cooking spoon\t\t
+Colloma\tFake or imitation\t\t
+Come leh eat\tPolite invitation to eat\t\t
+Common\tWell known, ordinary\t\t
+Comping\tA rotational savings club\t\t
+Con\tCrook\t\t
+Correh\tSomething of good quality\tDa man correh oh\tThat man is good/upstanding
+Cattah\tCloth used to balance head load\t\t
+Cotton tree\tThe silk cotton tree\t\t
+Country bread\tPounced rice meal\t\t
+Country chalk\tWhite clay for medicine/ritual\t\t
+Country chicken\tFree-range village chicken\t\t
+Country chop\tStew with various meats over rice\t\t
+Country guitar\tHomemade stringed instrument\t\t
+Country medicine\tTraditional herbal remedies\t\t
+Country money\tThin iron rods used as currency\t\t
+Country ray\tThe country is economically hard\tSince this man take the country, the country ray\tSince this president took office, times are tough
+Country rope\tForest vines for tying\t\t
+Country salt\tPotash made from palm ashes\t\t
+Country soap\tTraditional village-made soap\t\t
+Cow spirit\tEgret (white bird)\t\t
+Co wator\tBribe; welcome liquor\t\t
+Crackay\tStubborn, argumentative person\t\t
+Craw-craw\tAn itchy skin disease\t\t
+Craw-craw frog\tA toad\t\t
+Credih\tAn advance loan, cell phone units\t\t
+Crushing\tHaving romantic feelings\t\t
+Cruss\tRice crust from pot bottom\t\t
+Culture\tTraditional secret societies\t\t
+Cup\tA can used to measure rice\t\t
+Currenn\tElectricity\t\t
+Cutlax\tA machete\t\t
+cycle\tA bicycle\t\t
+
+# D
+Da lie\tNot true; false\tDa ting you sayin da lie\tWhat you're saying is a lie
+Dat ha\tThat's how\t\t
+Dan\tTen Liberian dollars\t\t
+Day bor\tCasual daily laborer\t\t
+Dealin\tUsing witchcraft/sorcery\t\t
+Dear\tExpensive, costly\tThis thing dear oh\tThis is expensive
+Deer\tThe duiker antelope\t\t
+Dux\tTo ace something, top performer\t\t
+Dey few days\tRecently\t\t
+Dorfa\tA duck\t\t
+Different different\tSeveral varieties\t\t
+Direct code\tStraight talk, bold speech\t\t
+Deeshcloth\tEczema, skin rash\tYou have deeshcloth on your hand\tYou have eczema on your hand
+Dite\tGarbage, trash\t\t
+Dog baby\tPuppy\t\t
+Dokafleh\tUsed clothes from abroad\tPlease bi me dokafleh sneakor\tPlease buy me used sneakers
+Dolphin fish\tThe mahi-mahi fish\t\t
+Dooji\tHeroin\t\t
+Door mouf\tA doorway\t\t
+Dragon\tA malevolent reptilian spirit\t\t
+Drappay\tTo give a small gift\t\t
+Dress\tMove closer together, scoot over\t\t
+Drill\tTo march in military parade\t\t
+Drunk you\tTo get someone drunk\t\t
+Druss\tWestern medicine\t\t
+Dry\tTo be skinny or malnourished\t\t
+Drah face\tTo be unashamed; bold\t\t
+Dry meat\tDried bush meat\t\t
+Dry monkey\tSevere malnutrition\t\t
+Du\tThe kusimanse mongoose\t\t
+Dukor\tMonrovia\t\t
+Dumboy\tThick cassava dough to swallow\t\t
+Dunkin\tIgnorant; fooled easily\t\t
+Dusta\tA blackboard eraser\t\t
+Dumpile\tA garbage dump\t\t
+Dusty road\tA dirt/unpaved road\t\t
+Dwah\tSmall mythical creatures\t\t
+Dynamo\tA diesel generator\t\t
+
+# E
+Ee mah eyeball\tTo rip someone off\tThe man really eat my eyeball\tThe man really cheated me
+Een de butto\tTo be drunk\t\t
+Eh yah\tExpression of sympathy\t\t
+Eye turning\tTo be dizzy or drunk\t\t
+Elda\tTitle of respect for older person\t\t
+
+# F
+Face cap\tBaseball hat\t\t
+Fall off\tTo fall apart, break\t\t
+Fanga\tSmall two-head pressure drum\t\t
+Fanner\tFlat basket to winnow rice\t\t
+Fanti cloth\tBrightly colored African cloth\t\t
+Farina\tDried cassava flakes cereal\t\t
+Farm ro far\tTo be deaf; distance is far\t\t
+Fever grass\tLemongrass\t\t
+Fever leaf\tWild basil plant\t\t
+Fek-fek\tFake, not true, worthless\t\t
+Fine\tBeautiful, attractive\tThis girl fine oh!\tThis girl is beautiful!
+Too Fine\tToo beautiful\t\t
+Fish cup\tTin of cooked fish in oil\t\t
+Fiya\tTo shoot at with weapon\t\t
+Fiya behine\tTo pressure; force someone\t\t
+Flakajay\tFoolish; senseless; substandard\tI do na like dat flakajay talk\tI don't like that foolish talk
+Flash\tCall and hang up after one ring\t\t
+Flask\tA thermos for hot water\t\t
+Flexing\tTo party, go nightclubbing\t\t
+Flok\tTo beat as punishment\t\t
+For common\tCommonly, often\t\t
+For nating\tWorthless, good for nothing\t\t
+Fooly tongor\tThe gray duiker antelope\t\t
+Foot\tThe entire leg including foot\t\t
+Fox\tThe slender mongoose\t\t
+Freak ah\tTo love or be attracted to\t\t
+Film sho\tA movie, video, or film\t\t
+Fresh\tTo be beautiful or fine\t\t
+Fresh co\tCommon cold, runny nose\t\t
+Friskay\tWild, rude, overactive\tDis boy friskay-o\tThis boy is wild!
+Frog baby\tA tadpole\t\t
+Forstor\tSlang for food or to eat\t\t
+Fuan-fuan\tTrouble; problem; headache\tI do na wan any fuan-fuan\tI don't want any trouble
+Fuel oil\tDiesel fuel/gas oil\t\t
+Full-uh\tSomething that is very full\t\t
+Funny\tDoing something foolish or stupid\tLook a aye, you funny, ehn?\tLook at you, are you being stupid?
+Fufu\tFood made from cassava\t\t
+
+# G
+Gallon\tPlastic container for liquids\t\t
+Galovant\tTo walk around\t\t
+Gamble seed\tCowrie shells for divination\t\t
+Gapping\tTo be hungry; suffering\tThe gapping rate is high\tThe hunger rate is high
+Gate\tCheckpoint on highway\t\t
+gavay\tSomeone who died; escaped\t\t
+GB\tCassava dough dumpling\t\t
+Gbana\tMischievous, unruly\t\t
+Gbapleh\tSmall finger-sized saltwater fish\t\t
+Gbassa jamba\tCassava leaf sauce\t\t
+Gbelleh\tFoolish, stupid\tDey gar dah gbelleh\tThis guy is stupid
+Gbehma\tTraditional music with electronic beats\t\t
+Gborku\tPlenty; surplus; many\tWe have ri gborku\tWe have plenty of rice
+Gboyo\tPart of secret society\t\t
+Geez\tGossip, salacious rumors\t\t
+Geh mouf\tPeople who talk too much\t\t
+Genah\tA forest spirit\t\t
+German plum\tLarge variety of mango\t\t
+Ghetto\tDrug hideout location\t\t
+Give belly\tTo impregnate a woman\t\t
+Go slow\tA labor strike\t\t
+Gobbachop official\tCorrupt government person\t\t
+Gohfada\tSugar-daddy older man\t\t
+Golden plum\tThe Ambarella fruit\t\t
+Gone weekend\tThis past weekend\t\t
+Gorilla\tOld, very large chimpanzee\t\t
+Grass\t\t\t
+Grasscutta\t\t\t
+Gravy\tsauce\t\t
+Grebo-bush\tBush/traditional school\t\t
+Gree-gree\tCharms or amulets\t\t
+Green monkey\tCallithrix monkey\t\t
+Greens\tLeafy vegetable cooked with oil\t\t
+Grip\tA suitcase\t\t
+Grumbo pekin\tPerson who likes trouble\t\t
+Gronna\tRebellious, disrespectful\t\t
+Gronna boy\tJuvenile delinquent, gangster\t\t
+Ground pea\tA peanut\t\t
+Ground pea candy\tPeanut brittle\t\t
+Gunshot\tA bullet\t\t
+Gun sound\tReport of gun firing\t\t
+Gut\tBig stomach\t\t
+Gutta\tA ditch\t\t
+Gwana\tThe Nile monitor lizard\t\t
+"""
+
+def iter_hardcoded_entries() -> Iterator[Dict[str, str]]:
+    """Yield processed entries from the hardcoded dictionary data one at a time."""
+    for line in HARDCODED_ENTRIES_TSV.splitlines():
+        # Skip section headers and blank lines
+        if not line or line.startswith('#'):
+            continue
         
-        # G
-        ("Gallon", "Plastic container for liquids", "", ""),
-        ("Galovant", "To walk around", "", ""),
-        ("Gamble seed", "Cowrie shells for divination", "", ""),
-        ("Gapping", "To be hungry; suffering", "The gapping rate is high", "The hunger rate is high"),
-        ("Gate", "Checkpoint on highway", "", ""),
-        ("gavay", "Someone who died; escaped", "", ""),
-        ("GB", "Cassava dough dumpling", "", ""),
-        ("Gbana", "Mischievous, unruly", "", ""),
-        ("Gbapleh", "Small finger-sized saltwater fish", "", ""),
-        ("Gbassa jamba", "Cassava leaf sauce", "", ""),
-        ("Gbelleh", "Foolish, stupid", "Dey gar dah gbelleh", "This guy is stupid"),
-        ("Gbehma", "Traditional music with electronic beats", "", ""),
-        ("Gborku", "Plenty; surplus; many", "We have ri gborku", "We have plenty of rice"),
-        ("Gboyo", "Part of secret society", "", ""),
-        ("Geez", "Gossip, salacious rumors", "", ""),
-        ("Geh mouf", "People who talk too much", "", ""),
-        ("Genah", "A forest spirit", "", ""),
-        ("German plum", "Large variety of mango", "", ""),
-        ("Ghetto", "Drug hideout location", "", ""),
-        ("Give belly", "To impregnate a woman", "", ""),
-        ("Go slow", "A labor strike", "", ""),
-        ("Gobbachop official", "Corrupt government person", "", ""),
-        ("Gohfada", "Sugar-daddy older man", "", ""),
-        ("Golden plum", "The Ambarella fruit", "", ""),
-        ("Gone weekend", "This past weekend", "", ""),
-        ("Gorilla", "Old, very large chimpanzee", "", ""),
-        ("Grass", "", "", ""),
-        ("Grasscutta", "", "", ""),
-        ("Gravy", "sauce", "", ""),
-        ("Grebo-bush", "Bush/traditional school", "", ""),
-        ("Gree-gree", "Charms or amulets", "", ""),
-        ("Green monkey", "Callithrix monkey", "", ""),
-        ("Greens", "Leafy vegetable cooked with oil", "", ""),
-        ("Grip", "A suitcase", "", ""),
-        ("Grumbo pekin", "Person who likes trouble", "", ""),
-        ("Gronna", "Rebellious, disrespectful", "", ""),
-        ("Gronna boy", "Juvenile delinquent, gangster", "", ""),
-        ("Ground pea", "A peanut", "", ""),
-        ("Ground pea candy", "Peanut brittle", "", ""),
-        ("Gunshot", "A bullet", "", ""),
-        ("Gun sound", "Report of gun firing", "", ""),
-        ("Gut", "Big stomach", "", ""),
-        ("Gutta", "A ditch", "", ""),
-        ("Gwana", "The Nile monitor lizard", "", ""),
-    ]
-    
-    processed_entries = []
-    for koloqua_text, english_translation, example_koloqua, example_english in raw_entries:
+        # Missing trailing fields (no sample sentence) read as empty strings
+        koloqua_text, english_translation, example_koloqua, example_english = (line.split('\t') + ['', '', ''])[:4]
         if not koloqua_text or not english_translation:
             continue
             
-        entry = {
+        # Lower-case once per entry for all classification helpers
+        koloqua_lower = koloqua_text.lower()
+        english_lower = english_translation.lower()
+        entry_type = determine_entry_type(koloqua_lower, english_lower)
+        tags, categories = classify(koloqua_lower, english_lower)
+        
+        yield {
             'koloqua_text': clean_text(koloqua_text),
             'english_translation': clean_text(english_translation),
             'example_sentence_koloqua': clean_text(example_koloqua),
             'example_sentence_english': clean_text(example_english),
-            'entry_type': determine_entry_type(koloqua_text, english_translation),
-            'context_explanation': generate_context_explanation(koloqua_text, english_translation),
-            'tags': generate_tags(koloqua_text, english_translation),
-            'categories': suggest_categories(koloqua_text, english_translation)
+            'entry_type': entry_type,
+            'context_explanation': generate_context_explanation(entry_type, english_lower),
+            'tags': list(tags),
+            'categories': list(categories)
         }
-        processed_entries.append(entry)
-    
-    return processed_entries
+
+def source_fingerprint() -> str:
+    """Hash of this module's source; a snapshot is only valid for the code that produced it."""
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+def freeze_hardcoded_entries(snapshot_path: Path = FROZEN_ENTRIES_PATH) -> None:
+    """Write the fully processed hardcoded entries to a JSON snapshot."""
+    snapshot = {
+        'fingerprint': source_fingerprint(),
+        'entries': list(iter_hardcoded_entries()),
+    }
+    with open(snapshot_path, 'w', encoding='utf-8') as snapshot_file:
+        json.dump(snapshot, snapshot_file, ensure_ascii=False, indent=1)
+        snapshot_file.write('\n')
+    print(f"Froze {len(snapshot['entries'])} entries: {snapshot_path}")
+
+def load_frozen_entries(snapshot_path: Path = FROZEN_ENTRIES_PATH) -> Optional[List[Dict[str, str]]]:
+    """Return the snapshot's entries, or None if it is missing or was built from other code."""
+    try:
+        with open(snapshot_path, 'r', encoding='utf-8') as snapshot_file:
+            snapshot = json.load(snapshot_file)
+    except (OSError, ValueError):
+        return None
+    if snapshot.get('fingerprint') != source_fingerprint():
+        return None
+    return snapshot['entries']
+
+def get_hardcoded_dictionary_data() -> List[Dict[str, str]]:
+    """Return hardcoded dictionary data extracted from the provided document."""
+    frozen_entries = load_frozen_entries()
+    if frozen_entries is not None:
+        return frozen_entries
+    return list(iter_hardcoded_entries())
 
 if __name__ == "__main__":
-    # Create CSV file with extracted data
-    create_csv_from_dictionary_text()
-    print("Dictionary extraction completed!")
\ No newline at end of file
+    if '--freeze' in sys.argv[1:]:
+        # Regenerate the processed snapshot after editing this module
+        freeze_hardcoded_entries()
+    else:
+        # Create CSV file with extracted data
+        create_csv_from_dictionary_text()
+        print("Dictionary extraction completed!")
@@ -2,17 +2,38 @@ import django_filters
 from .models import KoloquaEntry, WordCategory
 
 class KoloquaEntryFilter(django_filters.FilterSet):
+    # Columns read by KoloquaEntrySerializer, the list representation
+    LIST_FIELDS = (
+        'id', 'koloqua_text', 'english_translation', 'entry_type', 'status',
+        'upvotes', 'downvotes', 'contributor', 'contributor_username', 'contributor_level',
+    )
+    
     entry_type = django_filters.ChoiceFilter(choices=KoloquaEntry.ENTRY_TYPES)
     status = django_filters.ChoiceFilter(choices=KoloquaEntry.STATUS_CHOICES)
     categories = django_filters.ModelMultipleChoiceFilter(
         queryset=WordCategory.objects.all(),
-        field_name='categories__id',
-        to_field_name='id'
+        method='filter_categories'
     )
+    tag = django_filters.CharFilter(method='filter_tag')
     created_after = django_filters.DateTimeFilter(field_name='created_at', lookup_expr='gte')
     created_before = django_filters.DateTimeFilter(field_name='created_at', lookup_expr='lte')
     min_upvotes = django_filters.NumberFilter(field_name='upvotes', lookup_expr='gte')
     
     class Meta:
         model = KoloquaEntry
-        fields = ['entry_type', 'status', 'categories', 'contributor']
\ No newline at end of file
+        fields = ['entry_type', 'status', 'categories', 'contributor']
+    
+    @property
+    def qs(self):
+        # Skip the large text columns the list never shows; contributor details are denormalized
+        return super().qs.only(*self.LIST_FIELDS)
+    
+    def filter_categories(self, queryset, name, value):
+        # Any of the selected categories, via the GIN-indexed category_ids array (no M2M join)
+        if not value:
+            return queryset
+        return queryset.filter(category_ids__overlap=[category.pk for category in value])
+    
+    def filter_tag(self, queryset, name, value):
+        # Tags are stored lowercased; containment is answered from the kol_tags_gin index
+        return queryset.filter(tags__contains=[value.strip().lower()])
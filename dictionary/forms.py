@@ -1,12 +1,48 @@
+import re
+
 from django import forms
+from django.core.cache import cache
+from django.db.models.functions import Lower
 from django.urls import reverse
-from .models import KoloquaEntry, WordCategory, EntryVerification
+from .models import KoloquaEntry, WordCategory, EntryVerification, WORD_CATEGORIES_CACHE_KEY, DUPCHECK_CACHE_KEY
+
+WORD_CATEGORIES_TIMEOUT = 300
+DUPCHECK_TIMEOUT = 60
+
+# Shared widget attributes for the entry form's text inputs
+_FC_P4 = {'class': 'form-control p-4'}
+
+# One comma-separated tag, already trimmed of surrounding whitespace
+_TAG_RE = re.compile(r'[^,\s][^,]*[^,\s]|[^,\s]')
+
+
+def get_word_categories():
+    """Return all categories (id and name only), shared through the cache between requests"""
+    return cache.get_or_set(
+        WORD_CATEGORIES_CACHE_KEY,
+        lambda: list(WordCategory.objects.only('id', 'name').order_by('name')),
+        WORD_CATEGORIES_TIMEOUT,
+    )
+
+
+def _lookup_existing_entry(normalized_text):
+    """Return (status, contributor_id) of a non-rejected entry with this word, or None"""
+    # Case-insensitive match served by the kol_unique_active index
+    return KoloquaEntry.objects.annotate(
+        lower_text=Lower('koloqua_text')
+    ).filter(
+        lower_text=normalized_text
+    ).exclude(
+        status='rejected'  # Allow re-submission if previous was rejected
+    ).values_list('status', 'contributor_id').first()
+
 
 class KoloquaEntryForm(forms.ModelForm):
     """Form for submitting new Koloqua entries"""
     
-    categories = forms.ModelMultipleChoiceField(
-        queryset=WordCategory.objects.all(),
+    # Plain ids validated against the cached choices; kept out of Meta.fields and saved in _save_m2m
+    categories = forms.TypedMultipleChoiceField(
+        coerce=int,
         required=False,
         widget=forms.CheckboxSelectMultiple
     )
@@ -28,57 +64,56 @@ class KoloquaEntryForm(forms.ModelForm):
             'example_sentence_koloqua',
             'example_sentence_english',
             'cultural_notes',
-            'categories',
             'pronunciation_guide',
             'region_specific',
             'audio_pronunciation',
         ]
         widgets = {
             'koloqua_text': forms.TextInput(attrs={
-                'class': 'form-control p-4',
+                **_FC_P4,
                 'placeholder': 'Enter Koloqua word or phrase'
             }),
             'english_translation': forms.TextInput(attrs={
-                'class': 'form-control p-4',
+                **_FC_P4,
                 'placeholder': 'English translation'
             }),
             'literal_translation': forms.TextInput(attrs={
-                'class': 'form-control p-4',
+                **_FC_P4,
                 'placeholder': 'Literal word-for-word translation (optional)'
             }),
             'entry_type': forms.Select(attrs={'class': 'custom-select p-4'}),
             'context_explanation': forms.Textarea(attrs={
-                'class': 'form-control p-4',
+                **_FC_P4,
                 'rows': 3,
                 'placeholder': 'Explain when and how this is used'
             }),
             'example_sentence_koloqua': forms.TextInput(attrs={
-                'class': 'form-control p-4',
+                **_FC_P4,
                 'placeholder': 'Example sentence in Koloqua'
             }),
             'example_sentence_english': forms.TextInput(attrs={
-                'class': 'form-control p-4',
+                **_FC_P4,
                 'placeholder': 'Translation of example sentence'
             }),
             'cultural_notes': forms.Textarea(attrs={
-                'class': 'form-control p-4',
+                **_FC_P4,
                 'rows': 3,
                 'placeholder': 'Any cultural context or significance (optional)'
             }),
             'tags': forms.TextInput(attrs={
-                'class': 'form-control p-4',
+                **_FC_P4,
                 'placeholder': 'Tags (comma-separated, Optional)'
             }),
             'pronunciation_guide': forms.TextInput(attrs={
-                'class': 'form-control p-4',
+                **_FC_P4,
                 'placeholder': 'How to pronounce (optional)'
             }),
             'audio_pronunciation': forms.URLInput(attrs={
-                'class': 'form-control p-4',
+                **_FC_P4,
                 'placeholder': 'Audio URL (Optional)'
             }),
             'region_specific': forms.TextInput(attrs={
-                'class': 'form-control p-4',
+                **_FC_P4,
                 'placeholder': 'Specific region where used (optional)'
             }),
         }
@@ -86,28 +121,35 @@ class KoloquaEntryForm(forms.ModelForm):
     def __init__(self, *args, **kwargs):
         self.user = kwargs.pop('user', None)
         super().__init__(*args, **kwargs)
+        self.fields['categories'].choices = [(category.pk, category.name) for category in get_word_categories()]
+        if self.instance.pk:
+            self.initial.setdefault('categories', list(self.instance.category_ids))
     
     def clean_koloqua_text(self):
         """Prevent duplicate word entries in the system"""
-        koloqua_text = self.cleaned_data.get('koloqua_text')
+        koloqua_text = (self.cleaned_data.get('koloqua_text') or '').strip()
+        if not koloqua_text:
+            return koloqua_text
         
-        if koloqua_text and not self.instance.pk:  # Only check for new entries (not edits)
-            # Check if this word already exists (case-insensitive)
-            existing_entry = KoloquaEntry.objects.filter(
-                koloqua_text__iexact=koloqua_text
-            ).exclude(
-                status='rejected'  # Allow re-submission if previous was rejected
-            ).first()
+        if not self.instance.pk:  # Only check for new entries (not edits)
+            # Check if this word already exists; retries of the same word hit the cache
+            normalized_text = koloqua_text.lower()
+            existing_entry = cache.get_or_set(
+                DUPCHECK_CACHE_KEY.format(normalized_text),
+                lambda: _lookup_existing_entry(normalized_text),
+                DUPCHECK_TIMEOUT,
+            )
             
             if existing_entry:
+                status, contributor_id = existing_entry
                 # Build a helpful error message based on the entry status
-                if existing_entry.status == 'verified':
+                if status == 'verified':
                     raise forms.ValidationError(
                         f'The word "{koloqua_text}" already exists in the dictionary. '
                         f'Please search for it to view the existing entry.'
                     )
-                elif existing_entry.status == 'pending':
-                    if self.user and existing_entry.contributor == self.user:
+                elif status == 'pending':
+                    if self.user and contributor_id == self.user.pk:
                         raise forms.ValidationError(
                             f'You have already submitted "{koloqua_text}" and it is currently pending review. '
                             f'Please wait for verification before submitting again.'
@@ -121,31 +163,39 @@ class KoloquaEntryForm(forms.ModelForm):
         return koloqua_text
     
     def clean_tags(self):
-        """Convert comma-separated tags to list"""
+        """Convert comma-separated tags to a lowercased list without duplicates"""
         tags_str = self.cleaned_data.get('tags', '')
-        if tags_str:
-            return [tag.strip() for tag in tags_str.split(',') if tag.strip()]
-        return []
+        if not tags_str:
+            return []
+        return list(dict.fromkeys(tag.lower() for tag in _TAG_RE.findall(tags_str)))
     
     def save(self, commit=True):
         instance = super().save(commit=False)
+        # Set tags before the first save so they go out in the same INSERT/UPDATE
+        instance.tags = self.cleaned_data.get('tags') or []
         if commit:
             instance.save()
             self.save_m2m()
-            if self.cleaned_data.get('tags'):
-                instance.tags = self.cleaned_data['tags']
-                instance.save(update_fields=['tags'])
         return instance
+    
+    def _save_m2m(self):
+        super()._save_m2m()
+        self.instance.categories.set(self.cleaned_data.get('categories') or [])
 
 
 class EntryVerificationForm(forms.ModelForm):
     """Form for verifying entries"""
     
+    verification_type = forms.TypedChoiceField(
+        choices=EntryVerification.VERIFICATION_TYPES,
+        coerce=str,
+        widget=forms.RadioSelect
+    )
+    
     class Meta:
         model = EntryVerification
         fields = ['verification_type', 'comments']
         widgets = {
-            'verification_type': forms.RadioSelect(),
             'comments': forms.Textarea(attrs={
                 'class': 'form-control',
                 'rows': 3,
@@ -175,4 +225,8 @@ class SearchForm(forms.Form):
         choices=LANGUAGE_CHOICES,
         initial='auto',
         widget=forms.Select(attrs={'class': 'form-control'})
-    )
\ No newline at end of file
+    )
+    
+    def clean_query(self):
+        """Normalize to lowercase so lookups match the lower() expressions in kol_text_trgm"""
+        return self.cleaned_data.get('query', '').strip().lower()
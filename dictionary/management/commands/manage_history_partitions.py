@@ -0,0 +1,165 @@
+import re
+from datetime import date, datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+
+from dictionary.models import TranslationHistory, SiteStats, SITE_STATS_CACHE_KEY
+
+
+PARTITION_NAME = re.compile(r'^translation_history_(\d{4})_(\d{2})$')
+
+
+def add_months(month, count):
+    """First day of the month `count` months after (or before) `month`"""
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def month_start(month):
+    """UTC midnight on the first of `month`, the partition bound format"""
+    return datetime(month.year, month.month, 1, tzinfo=dt_timezone.utc)
+
+
+class Command(BaseCommand):
+    help = (
+        'Create upcoming monthly translation_history partitions and drop the ones '
+        'past the retention window. Safe to run repeatedly; schedule it daily.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--ahead', type=int, default=3, help='Months of partitions to keep ready ahead of now')
+        parser.add_argument(
+            '--retain-months', type=int,
+            default=settings.TRANSLATION_HISTORY_RETENTION_MONTHS,
+            help='Months of search history to keep (0 keeps everything)',
+        )
+        parser.add_argument('--dry-run', action='store_true', help='Show what would change without touching the database')
+
+    def existing_partitions(self):
+        with connection.cursor() as cursor:
+            cursor.execute("""
+                SELECT child.relname
+                FROM pg_inherits
+                JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+                JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                WHERE parent.relname = %s
+            """, [TranslationHistory._meta.db_table])
+            names = [row[0] for row in cursor.fetchall()]
+
+        partitions = {}
+        for name in names:
+            match = PARTITION_NAME.match(name)
+            if match:
+                partitions[date(int(match.group(1)), int(match.group(2)), 1)] = name
+        return partitions
+
+    def default_rows(self, default, start=None, end=None, found=False):
+        """Count rows in the default partition with searched_at in [start, end)"""
+        conditions, params = [], []
+        if start is not None:
+            conditions.append('searched_at >= %s')
+            params.append(start)
+        if end is not None:
+            conditions.append('searched_at < %s')
+            params.append(end)
+        if found:
+            conditions.append('found')
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT count(*) FROM {connection.ops.quote_name(default)} WHERE {" AND ".join(conditions)}',
+                params,
+            )
+            return cursor.fetchone()[0]
+
+    def report_creation(self, name, default, moved):
+        self.stdout.write(f'Creating {name}' + (f' (moving {moved} rows from {default})' if moved else ''))
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        table = TranslationHistory._meta.db_table
+        default = f'{table}_default'
+        this_month = timezone.now().date().replace(day=1)  # now() is UTC
+        partitions = self.existing_partitions()
+
+        for offset in range(options['ahead'] + 1):
+            month = add_months(this_month, offset)
+            if month in partitions:
+                continue
+            name = f'{table}_{month:%Y_%m}'
+            start, end = month_start(month), month_start(add_months(month, 1))
+            bounds = f"FOR VALUES FROM ('{start:%Y-%m-%d} 00:00:00+00') TO ('{end:%Y-%m-%d} 00:00:00+00')"
+            if dry_run:
+                self.report_creation(name, default, self.default_rows(default, start, end))
+                continue
+            with transaction.atomic(), connection.cursor() as cursor:
+                # Hold off inserts into the default partition until the month exists
+                cursor.execute(f'LOCK TABLE {connection.ops.quote_name(default)} IN EXCLUSIVE MODE')
+                moved = self.default_rows(default, start, end)
+                self.report_creation(name, default, moved)
+                if not moved:
+                    cursor.execute(
+                        f'CREATE TABLE IF NOT EXISTS {connection.ops.quote_name(name)} '
+                        f'PARTITION OF {connection.ops.quote_name(table)} {bounds}'
+                    )
+                    continue
+                # Postgres refuses to add a partition whose range already has rows in
+                # the default partition, so build the month as a plain table, move the
+                # rows over and attach it, all before anyone else sees the gap
+                cursor.execute(
+                    f'CREATE TABLE {connection.ops.quote_name(name)} '
+                    f'(LIKE {connection.ops.quote_name(table)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+                )
+                cursor.execute(
+                    f'WITH moved AS (DELETE FROM {connection.ops.quote_name(default)} '
+                    f'WHERE searched_at >= %s AND searched_at < %s RETURNING *) '
+                    f'INSERT INTO {connection.ops.quote_name(name)} SELECT * FROM moved',
+                    [start, end],
+                )
+                cursor.execute(
+                    f'ALTER TABLE {connection.ops.quote_name(table)} '
+                    f'ATTACH PARTITION {connection.ops.quote_name(name)} {bounds}'
+                )
+
+        # Whole partitions older than the window go with DROP TABLE, which frees the
+        # space at once instead of leaving DELETE bloat for vacuum
+        retain_months = options['retain_months']
+        cutoff = add_months(this_month, -retain_months)
+        for month, name in sorted(partitions.items()):
+            if retain_months <= 0 or month >= cutoff:
+                continue
+            quoted = connection.ops.quote_name(name)
+            self.stdout.write(f'Dropping {name}')
+            if dry_run:
+                continue
+            with transaction.atomic():
+                with connection.cursor() as cursor:
+                    # DROP TABLE skips the post_delete receivers, so settle the counter here
+                    cursor.execute(f'SELECT count(*) FROM {quoted} WHERE found')
+                    found = cursor.fetchone()[0]
+                    cursor.execute(f'ALTER TABLE {connection.ops.quote_name(table)} DETACH PARTITION {quoted}')
+                    cursor.execute(f'DROP TABLE {quoted}')
+                SiteStats.bump(translation_count=-found)
+            cache.delete(SITE_STATS_CACHE_KEY)
+
+        # Rows that landed in the default partition (a month with no partition yet)
+        # are never dropped with a partition, so expire them with a plain DELETE
+        expired = retain_months > 0 and self.default_rows(default, end=month_start(cutoff))
+        if expired:
+            self.stdout.write(f'Deleting {expired} rows before {cutoff:%Y-%m} from {default}')
+            if not dry_run:
+                with transaction.atomic():
+                    # Raw DELETE skips the post_delete receivers as well
+                    found = self.default_rows(default, end=month_start(cutoff), found=True)
+                    with connection.cursor() as cursor:
+                        cursor.execute(
+                            f'DELETE FROM {connection.ops.quote_name(default)} WHERE searched_at < %s',
+                            [month_start(cutoff)],
+                        )
+                    SiteStats.bump(translation_count=-found)
+                cache.delete(SITE_STATS_CACHE_KEY)
+
+        self.stdout.write(self.style.SUCCESS('Translation history partitions are up to date'))
@@ -1,16 +1,311 @@
 # management/commands/populate_koloqua_dictionary.py
 
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from django.contrib.auth import get_user_model
 from django.utils import timezone
-from django.db import transaction
-from dictionary.models import KoloquaEntry, WordCategory
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import F
+from dictionary.models import KoloquaEntry, WordCategory, SiteStats, WORD_CATEGORIES_CACHE_KEY
 from gamification.models import Badge, UserBadge, PointTransaction
+import contextlib
 import csv
 import io
+import itertools
+import multiprocessing
+import re
 
 User = get_user_model()
 
+CATEGORIES_DATA = (
+    ('Greetings & Social', 'Common greetings and social expressions'),
+    ('Food & Cooking', 'Food, cooking, and dining related terms'),
+    ('Family & Relationships', 'Family members and relationship terms'),
+    ('Slang & Informal', 'Informal language and slang expressions'),
+    ('Animals & Nature', 'Animals, plants, and natural phenomena'),
+    ('Body & Health', 'Body parts, health, and medical terms'),
+    ('Clothing & Appearance', 'Clothing, accessories, and appearance'),
+    ('Money & Business', 'Financial and business-related terms'),
+    ('Transportation', 'Vehicles and transportation'),
+    ('Technology & Modern', 'Modern technology and contemporary terms'),
+    ('Traditional & Cultural', 'Traditional practices and cultural terms'),
+    ('Emotions & Feelings', 'Expressions of emotions and feelings'),
+    ('Time & Weather', 'Time expressions and weather terms'),
+    ('Colors & Descriptions', 'Colors and descriptive adjectives'),
+    ('Actions & Verbs', 'Common actions and verbs'),
+)
+
+BADGES_DATA = (
+    {
+        'name': 'Dictionary Founder',
+        'description': 'Contributed to the initial dictionary population',
+        'badge_type': 'special',
+        'icon': 'trophy',
+        'points_required': 0,
+        'contributions_required': 1,
+    },
+    {
+        'name': 'First Steps',
+        'description': 'Made your first contribution',
+        'badge_type': 'contribution',
+        'icon': 'star',
+        'points_required': 0,
+        'contributions_required': 1,
+    },
+    {
+        'name': 'Word Collector',
+        'description': 'Contributed 10 verified entries',
+        'badge_type': 'contribution',
+        'icon': 'collection',
+        'points_required': 0,
+        'contributions_required': 10,
+    },
+)
+
+# Keyword mappings used by match_category_names
+CATEGORY_KEYWORDS = {
+    'Greetings & Social': ['morning', 'hello', 'goodbye', 'thank', 'please', 'sorry', 'welcome'],
+    'Food & Cooking': ['rice', 'fish', 'cook', 'eat', 'food', 'soup', 'meat', 'drink', 'palm', 'cassava'],
+    'Family & Relationships': ['father', 'mother', 'brother', 'sister', 'aunt', 'uncle', 'child', 'wife', 'husband', 'friend'],
+    'Animals & Nature': ['monkey', 'bird', 'fish', 'snake', 'elephant', 'tree', 'forest', 'river', 'mountain'],
+    'Body & Health': ['head', 'hand', 'foot', 'eye', 'medicine', 'sick', 'pain', 'blood', 'heart'],
+    'Clothing & Appearance': ['clothes', 'wear', 'dress', 'shirt', 'beautiful', 'ugly', 'hair', 'skin'],
+    'Money & Business': ['money', 'dollar', 'buy', 'sell', 'pay', 'business', 'work', 'job'],
+    'Transportation': ['car', 'taxi', 'road', 'walk', 'travel', 'motorcycle', 'bicycle'],
+    'Emotions & Feelings': ['happy', 'sad', 'angry', 'love', 'hate', 'fear', 'worry', 'excited'],
+    'Slang & Informal': ['crazy', 'stupid', 'fool', 'bluff', 'joke', 'tease'],
+}
+
+# Keyword -> every category listing it ('fish' is both food and nature)
+KEYWORD_TO_CATS = {}
+for _category_name, _keywords in CATEGORY_KEYWORDS.items():
+    for _keyword in _keywords:
+        KEYWORD_TO_CATS.setdefault(_keyword, []).append(_category_name)
+
+
+def trie_pattern(words):
+    """Regex source matching any of words, factored into a prefix trie.
+    
+    Shared prefixes are tested once ('f' then 'ish' / 'o(?:o(?:d|l|t)|rest)' ...), so the
+    engine walks a single branch per character instead of trying every keyword.
+    An optional tail is greedy, so longer keywords win over their own prefixes.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+    
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return '(?:' + body + ')?' if '' in node else body
+    
+    return build(trie)
+
+
+# All keywords in one pass; anchored at a word start so 'eat' no longer matches inside 'great'
+KEYWORD_RE = re.compile(r'\b(' + trie_pattern(KEYWORD_TO_CATS) + ')')
+
+# Columns written by Command.copy_entries; the rest are nullable and left empty
+COPY_COLUMNS = (
+    'koloqua_text', 'english_translation', 'literal_translation', 'entry_type', 'context_explanation',
+    'example_sentence_koloqua', 'example_sentence_english', 'cultural_notes', 'tags', 'contributor_id',
+    'contributor_username', 'contributor_level',
+    'status', 'verification_count', 'upvotes', 'downvotes', 'created_at', 'updated_at', 'verified_at',
+    'pronunciation_guide', 'region_specific', 'category_ids',
+)
+# NULL marker for COPY so empty strings stay empty strings
+COPY_NULL = '\\N'
+
+
+def copy_value(column, value):
+    """Render one KoloquaEntry column as a COPY ... WITH (FORMAT csv) field"""
+    if value is None:
+        return COPY_NULL
+    if column == 'tags':
+        return '{%s}' % ','.join('"%s"' % tag.replace('\\', '\\\\').replace('"', '\\"') for tag in value)
+    if column == 'category_ids':
+        return '{%s}' % ','.join(map(str, value))
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return value
+
+
+def chunks(iterable, size):
+    """Yield lists of up to size items from iterable without materializing it"""
+    iterator = iter(iterable)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+# Context explanation for each entry type in the hardcoded seed data
+SEED_CONTEXT_EXPLANATIONS = {
+    entry_type: f"Common {entry_type} used in Liberian Koloqua"
+    for entry_type in ('word', 'phrase', 'idiom', 'proverb')
+}
+
+# Substring hints for determine_entry_type, scanned in one regex pass each
+PROVERB_HINT_RE = re.compile('expression|saying|proverb')
+IDIOM_HINT_RE = re.compile('when|if|because')
+
+
+def determine_entry_type(words, english_lower, koloqua_lower):
+    """Determine if entry is word, phrase, idiom, or proverb"""
+    if len(words) == 1:
+        return 'word'
+    elif PROVERB_HINT_RE.search(english_lower):
+        return 'proverb'
+    elif len(words) > 4 or IDIOM_HINT_RE.search(koloqua_lower):
+        return 'idiom'
+    else:
+        return 'phrase'
+
+
+def match_category_names(text_lower):
+    """Names of the categories whose keywords appear in the lowercased entry text"""
+    return {name for keyword in KEYWORD_RE.findall(text_lower) for name in KEYWORD_TO_CATS[keyword]}
+
+
+def classify_entry(koloqua_text, english_translation):
+    """Entry type and matched category names, lowercasing and splitting each text once"""
+    koloqua_lower = koloqua_text.lower()
+    english_lower = english_translation.lower()
+    return (
+        determine_entry_type(koloqua_text.split(), english_lower, koloqua_lower),
+        match_category_names(koloqua_lower + ' ' + english_lower),
+    )
+
+
+def prepare_rows(rows):
+    """Drop rows missing text or translation and classify the rest.
+    
+    Module-level and DB-free so Pool workers can run it.
+    """
+    return [(row, *classify_entry(row[0], row[1])) for row in rows if row[0] and row[1]]
+
+
+# Read buffer for import CSVs
+CSV_READ_BUFFER_SIZE = 1 << 20
+
+# Columns read from an import CSV, in the order the import unpacks them
+CSV_COLUMNS = ('koloqua_text', 'english_translation', 'example_sentence_koloqua', 'example_sentence_english')
+
+# Columns rewritten when a CSV row repeats a word that is already stored
+CSV_UPDATE_FIELDS = (
+    'koloqua_text', 'english_translation', 'example_sentence_koloqua', 'example_sentence_english',
+    'entry_type', 'context_explanation', 'contributor', 'contributor_username', 'contributor_level',
+    'status', 'verification_count', 'verified_at', 'upvotes', 'tags',
+)
+
+# Sample of the dictionary data - you can expand this with the full dataset
+DICTIONARY_DATA = (
+    # A
+    ("Abuse", "To insult, ridicule", "Buh you na abuse the man bad way oh!", "You shouldn't insult the man badly!"),
+    ("Argo Oil", "Vegetable oil", "Wheh play ley argo oy (eh)?", "Where is the vegetable oil?"),
+    ("All two", "both", "Take all two to the papay deh", "Take both to the old man"),
+    ("Antay", "Aunt", "La ma antay (deh)", "That's my aunt (there)"),
+    
+    # B  
+    ("Ba", "A friend, buddy, peer", "Ba, come leh go", "Friend, come let's go"),
+    ("banjo", "To sell cheap, discount", "All de tinnen you selling yeh, la banjo?", "Everything you sell, are they cheap?"),
+    ("Beard-beard", "A longer beard on a man", "See beard-beard oh!", "Look at his beard!"),
+    ("Behind you", "To bother someone, nag", "Buh what you behind me for again?", "Why are you harassing me again?"),
+    ("belle", "Big stomach, pregnancy", "The woman geh belle for da man", "The woman was impregnated by that man"),
+    ("Bessa", "Busybody, gossip", "Do na believe dat ting, dat bessa", "Don't believe that, that's gossip"),
+    ("Big heart", "Arrogant, boastful", "You tink say you geh big heart?", "Do you think you're that bold?"),
+    ("Bluff", "To show off, flaunt", "Oh? So la me you bluffing so?", "Are you showing off for me?"),
+    ("Boiling", "Going out, having fun", "Today we boil!", "Today we're having fun!"),
+    ("Book people", "Educated class", "The book people na come oh", "The educated people are here"),
+    
+    # C
+    ("Call me dog", "Oath of contempt", "If I don't put one slap in your ear, call me dog!", "I would rather be called a dog than let you do that!"),
+    ("Che", "Expression of surprise", "Che! So this whole pot of rice y'all swallow all?", "So you mean you ate all this rice?"),
+    ("Chuck rice", "Rice with greens", "I coming eat my chuck rice", "I'm going to eat my chuck rice"),
+    ("Country ray", "Times are hard", "Since this man take the country, the country ray", "Since this president took office, times are tough"),
+    
+    # D
+    ("Da lie", "Not true, false", "Da ting you sayin da lie", "What you're saying is false"),
+    ("Dear", "Expensive, costly", "This thing too dear", "This is too expensive"),
+    ("Dokafleh", "Used clothes", "Please bi me dokafleh sneakor", "Please buy me used sneakers"),
+    
+    # F
+    ("Fine", "Beautiful, attractive", "This girl fine oh!", "This girl is beautiful!"),
+    ("Flakajay", "Foolish, stupid", "I do na like dat flakajay talk", "I don't like that foolish talk"),
+    ("Friskay", "Wild, rude", "Dis boy friskay-o", "This boy is wild!"),
+    
+    # G
+    ("Gapping", "Hungry, suffering", "The gapping rate is high", "The hunger rate is high"),
+    ("Gbelleh", "Foolish, stupid", "Dey gar dah gbelleh", "This guy is stupid"),
+    ("Gborku", "Plenty, many", "We have ri gborku", "We have plenty of rice"),
+    
+    # H  
+    ("Hala", "To shout, yell", "Why you hala so?", "Why are you shouting like that?"),
+    ("Haat clean", "Honest, good intentions", "This man haat clean", "This man has good intentions"),
+    ("Hellaba", "Stubborn", "This pekin hellaba", "This child is stubborn"),
+    
+    # J
+    ("Junk", "Inexperienced, ignorant", "This guy a junk", "This guy is inexperienced"),
+    ("Jus na", "Right away", "Come jus na", "Come right away"),
+    
+    # K
+    ("Kubba", "Cunning, experienced", "This girl da kuba", "This girl is cunning"),
+    ("Kwi", "Educated, modern", "Only kwi people live in the city", "Only educated people live in the city"),
+    
+    # L
+    ("La lie", "That's a lie", "La lie! I never say that", "That's a lie! I never said that"),
+    ("Level", "Empty talk, excuse", "Don't put me en level", "Don't give me empty talk"),
+    
+    # M
+    ("Make mouf", "To boast", "He like make mouf", "He likes to boast"),
+    ("Mean", "Selfish, stingy", "This man mean oh", "This man is stingy"),
+    
+    # N
+    ("Now-now", "Right now", "Come now-now", "Come right now"),
+    ("Nyan", "Naive, foolish", "Don't be nyan", "Don't be naive"),
+    
+    # P
+    ("Palava", "Argument, problem", "We get palava", "We have a problem"),
+    ("Papay", "Wealthy older man", "Go to the papay", "Go to the wealthy man"),
+    ("Pekin", "Young boy", "This pekin smart", "This boy is smart"),
+    ("Play low", "Forget about it", "Just play it low", "Just forget about it"),
+    
+    # R
+    ("Ray", "Red", "See the ray car", "See the red car"),
+    ("Rogue", "Thief", "That man is rogue", "That man is a thief"),
+    
+    # S
+    ("Sabi", "Cunning, crafty", "He sabi oh", "He's crafty"),
+    ("Small-small", "Gradually", "We go do it small-small", "We'll do it gradually"),
+    ("Sweet", "Delicious", "This food sweet", "This food is delicious"),
+    
+    # T
+    ("Today person", "Modern person", "She's a today person", "She's a modern person"),
+    ("Tote", "To carry", "Tote this bag", "Carry this bag"),
+    
+    # V
+    ("Vex", "Angry", "I vex with you", "I'm angry with you"),
+    ("Voke", "To tease", "Don't voke me", "Don't tease me"),
+    
+    # W
+    ("Wahala", "Problem, trouble", "We get wahala", "We have trouble"),
+    ("Woking", "Food", "I want woking", "I want food"),
+    
+    # Y
+    ("Yana", "Street vendor", "Go to the yana boy", "Go to the street vendor"),
+    ("Yute", "Youth, young person", "All the yute dem", "All the young people"),
+    
+    # Z
+    ("Zoko", "Young criminal", "That boy is zoko", "That boy is a petty thief"),
+    ("Zepsay", "Crazy, insane", "He zepsay oh", "He's crazy"),
+)
+
 
 class Command(BaseCommand):
     help = 'Populate the Koloqua dictionary with initial data and auto-verify entries'
@@ -39,6 +334,23 @@ class Command(BaseCommand):
             default=100,
             help='Number of entries to process in each batch'
         )
+        parser.add_argument(
+            '--drop-indexes',
+            action='store_true',
+            help='Drop secondary entry indexes during the import and rebuild them afterwards (PostgreSQL only)'
+        )
+        parser.add_argument(
+            '--n-procs',
+            type=int,
+            default=1,
+            help='Worker processes for classifying CSV rows (1 classifies in-process)'
+        )
+        parser.add_argument(
+            '--chunksize',
+            type=int,
+            default=1,
+            help='Batches handed to each CSV worker per dispatch'
+        )
     
     def handle(self, *args, **options):
         self.stdout.write(self.style.SUCCESS('Starting Koloqua Dictionary population...'))
@@ -53,18 +365,65 @@ class Command(BaseCommand):
         
         # Create categories
         self.create_categories()
+        self._cat_map = {category.name: category for category in WordCategory.objects.only('id', 'name')}
         
         # Create initial badges
         self.create_initial_badges()
         
-        # Import dictionary data
-        if options['source'] == 'csv':
-            self.import_from_csv(options['csv_file'], admin_user, options['batch_size'])
-        else:
-            self.import_hardcoded_data(admin_user, options['batch_size'])
+        # Import dictionary data in one transaction; the per-batch atomic blocks become savepoints
+        with transaction.atomic(), self.dropped_indexes(options['drop_indexes']):
+            if options['source'] == 'csv':
+                self.import_from_csv(
+                    options['csv_file'], admin_user, options['batch_size'], options['n_procs'], options['chunksize']
+                )
+            else:
+                self.import_hardcoded_data(admin_user, options['batch_size'])
+        
+        # Rebuild the denormalized home/about counters after the bulk changes
+        SiteStats.recount()
         
         self.stdout.write(self.style.SUCCESS('Dictionary population completed!'))
     
+    @contextlib.contextmanager
+    def dropped_indexes(self, enabled):
+        """Drop the entry table's non-unique indexes for the duration of the block.
+        
+        Unique indexes (the primary key, kol_unique_active and any other unique
+        index) and indexes backing constraints are kept, so duplicate protection
+        stays on during the import. The saved definitions of the dropped indexes
+        are replayed once the block succeeds, so each is built in one pass
+        instead of being maintained row by row. If the import fails, the outer
+        transaction rolls the DROPs back instead.
+        """
+        if not enabled or connection.vendor != 'postgresql':
+            yield
+            return
+        
+        table = KoloquaEntry._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT i.relname, pg_get_indexdef(i.oid)
+                FROM pg_index x
+                JOIN pg_class i ON i.oid = x.indexrelid
+                WHERE x.indrelid = %s::regclass
+                AND NOT x.indisunique
+                AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = x.indexrelid)
+                """,
+                [table]
+            )
+            indexes = cursor.fetchall()
+            for name, _ in indexes:
+                cursor.execute(f'DROP INDEX {connection.ops.quote_name(name)}')
+        self.stdout.write(f"Dropped {len(indexes)} indexes on {table}")
+        
+        yield
+        
+        with connection.cursor() as cursor:
+            for _, definition in indexes:
+                cursor.execute(definition)
+        self.stdout.write(f"Rebuilt {len(indexes)} indexes on {table}")
+    
     def get_or_create_admin_user(self, create_admin):
         """Get or create admin user for contributions"""
         try:
@@ -96,372 +455,252 @@ class Command(BaseCommand):
     
     def create_categories(self):
         """Create word categories"""
-        categories_data = [
-            ('Greetings & Social', 'Common greetings and social expressions'),
-            ('Food & Cooking', 'Food, cooking, and dining related terms'),
-            ('Family & Relationships', 'Family members and relationship terms'),
-            ('Slang & Informal', 'Informal language and slang expressions'),
-            ('Animals & Nature', 'Animals, plants, and natural phenomena'),
-            ('Body & Health', 'Body parts, health, and medical terms'),
-            ('Clothing & Appearance', 'Clothing, accessories, and appearance'),
-            ('Money & Business', 'Financial and business-related terms'),
-            ('Transportation', 'Vehicles and transportation'),
-            ('Technology & Modern', 'Modern technology and contemporary terms'),
-            ('Traditional & Cultural', 'Traditional practices and cultural terms'),
-            ('Emotions & Feelings', 'Expressions of emotions and feelings'),
-            ('Time & Weather', 'Time expressions and weather terms'),
-            ('Colors & Descriptions', 'Colors and descriptive adjectives'),
-            ('Actions & Verbs', 'Common actions and verbs'),
-        ]
         
-        created_count = 0
-        for name, description in categories_data:
-            category, created = WordCategory.objects.get_or_create(
-                name=name,
-                defaults={'description': description}
-            )
-            if created:
-                created_count += 1
+        # Existing names are skipped by the unique constraint; the count difference is what got added
+        before = WordCategory.objects.count()
+        WordCategory.objects.bulk_create(
+            [WordCategory(name=name, description=description) for name, description in CATEGORIES_DATA],
+            ignore_conflicts=True
+        )
+        created_count = WordCategory.objects.count() - before
+        # bulk_create skips post_save, so drop the cached category list by hand
+        cache.delete(WORD_CATEGORIES_CACHE_KEY)
         
         self.stdout.write(f"Created {created_count} new categories")
     
     def create_initial_badges(self):
         """Create initial gamification badges"""
-        badges_data = [
-            {
-                'name': 'Dictionary Founder',
-                'description': 'Contributed to the initial dictionary population',
-                'badge_type': 'special',
-                'icon': 'trophy',
-                'points_required': 0,
-                'contributions_required': 1,
-            },
-            {
-                'name': 'First Steps',
-                'description': 'Made your first contribution',
-                'badge_type': 'contribution',
-                'icon': 'star',
-                'points_required': 0,
-                'contributions_required': 1,
-            },
-            {
-                'name': 'Word Collector',
-                'description': 'Contributed 10 verified entries',
-                'badge_type': 'contribution',
-                'icon': 'collection',
-                'points_required': 0,
-                'contributions_required': 10,
-            },
-        ]
         
-        created_count = 0
-        for badge_data in badges_data:
-            badge, created = Badge.objects.get_or_create(
-                name=badge_data['name'],
-                defaults=badge_data
-            )
-            if created:
-                created_count += 1
+        before = Badge.objects.count()
+        Badge.objects.bulk_create([Badge(**badge_data) for badge_data in BADGES_DATA], ignore_conflicts=True)
+        created_count = Badge.objects.count() - before
         
         self.stdout.write(f"Created {created_count} new badges")
     
-    def categorize_entry(self, koloqua_text, english_translation):
-        """Automatically categorize entries based on content"""
-        text_lower = (koloqua_text + ' ' + english_translation).lower()
-        
-        # Define keyword mappings
-        category_keywords = {
-            'Greetings & Social': ['morning', 'hello', 'goodbye', 'thank', 'please', 'sorry', 'welcome'],
-            'Food & Cooking': ['rice', 'fish', 'cook', 'eat', 'food', 'soup', 'meat', 'drink', 'palm', 'cassava'],
-            'Family & Relationships': ['father', 'mother', 'brother', 'sister', 'aunt', 'uncle', 'child', 'wife', 'husband', 'friend'],
-            'Animals & Nature': ['monkey', 'bird', 'fish', 'snake', 'elephant', 'tree', 'forest', 'river', 'mountain'],
-            'Body & Health': ['head', 'hand', 'foot', 'eye', 'medicine', 'sick', 'pain', 'blood', 'heart'],
-            'Clothing & Appearance': ['clothes', 'wear', 'dress', 'shirt', 'beautiful', 'ugly', 'hair', 'skin'],
-            'Money & Business': ['money', 'dollar', 'buy', 'sell', 'pay', 'business', 'work', 'job'],
-            'Transportation': ['car', 'taxi', 'road', 'walk', 'travel', 'motorcycle', 'bicycle'],
-            'Emotions & Feelings': ['happy', 'sad', 'angry', 'love', 'hate', 'fear', 'worry', 'excited'],
-            'Slang & Informal': ['crazy', 'stupid', 'fool', 'bluff', 'joke', 'tease'],
-        }
-        
-        # Find matching categories
-        matching_categories = []
-        for category_name, keywords in category_keywords.items():
-            if any(keyword in text_lower for keyword in keywords):
-                try:
-                    category = WordCategory.objects.get(name=category_name)
-                    matching_categories.append(category)
-                except WordCategory.DoesNotExist:
-                    continue
+    def categories_for_names(self, matching_names, cat_map):
+        """Automatically categorize entries from their matched category names"""
+        matching_categories = [
+            cat_map[name] for name in CATEGORY_KEYWORDS if name in matching_names and name in cat_map
+        ]
         
         # Default to general if no specific category found
         if not matching_categories:
-            try:
-                general_category = WordCategory.objects.get(name='Slang & Informal')
+            general_category = cat_map.get('Slang & Informal')
+            if general_category:
                 matching_categories.append(general_category)
-            except WordCategory.DoesNotExist:
-                pass
         
         return matching_categories
     
-    def determine_entry_type(self, koloqua_text, english_translation):
-        """Determine if entry is word, phrase, idiom, or proverb"""
-        if len(koloqua_text.split()) == 1:
-            return 'word'
-        elif any(word in english_translation.lower() for word in ['expression', 'saying', 'proverb']):
-            return 'proverb'
-        elif len(koloqua_text.split()) > 4 or any(word in koloqua_text.lower() for word in ['when', 'if', 'because']):
-            return 'idiom'
+    def bulk_create_entries(self, entries, entry_categories, batch_size, use_copy=False):
+        """Insert entries and their category links in bulk.
+        
+        bulk_create() skips post_save and m2m_changed, so the search vectors are
+        filled in here and category_ids must already be set on each entry.
+        Embeddings are left to the generate_embeddings command.
+        """
+        if use_copy and connection.vendor == 'postgresql':
+            self.copy_entries(entries)
         else:
-            return 'phrase'
+            KoloquaEntry.objects.bulk_create(entries, batch_size=batch_size)
+        
+        Through = KoloquaEntry.categories.through
+        Through.objects.bulk_create([
+            Through(koloquaentry_id=entry.pk, wordcategory_id=category.pk)
+            for entry, categories in zip(entries, entry_categories)
+            for category in categories
+        ], batch_size=batch_size, ignore_conflicts=True)
+        
+        KoloquaEntry.objects.filter(pk__in=[entry.pk for entry in entries]).update(
+            search_vector=KoloquaEntry.build_search_vector()
+        )
+    
+    def copy_entries(self, entries):
+        """Stream new entries to PostgreSQL with COPY FROM STDIN and set their pks.
+        
+        Entry texts must be unique within the call; COPY returns no ids, so they
+        are read back by koloqua_text afterwards.
+        """
+        now = timezone.now()
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for entry in entries:
+            entry.created_at = entry.updated_at = now
+            writer.writerow([copy_value(column, getattr(entry, column)) for column in COPY_COLUMNS])
+        
+        sql = "COPY {} ({}) FROM STDIN WITH (FORMAT csv, NULL '{}')".format(
+            connection.ops.quote_name(KoloquaEntry._meta.db_table),
+            ', '.join(connection.ops.quote_name(column) for column in COPY_COLUMNS),
+            COPY_NULL,
+        )
+        with connection.cursor() as cursor:
+            with cursor.copy(sql) as copy:
+                copy.write(buffer.getvalue())
+        
+        pks = dict(KoloquaEntry.objects.filter(
+            koloqua_text__in=[entry.koloqua_text for entry in entries]
+        ).exclude(status='rejected').values_list('koloqua_text', 'id'))
+        for entry in entries:
+            entry.pk = pks[entry.koloqua_text]
+            entry._state.adding = False
     
     def import_hardcoded_data(self, admin_user, batch_size):
         """Import hardcoded dictionary data"""
         
-        # Sample of the dictionary data - you can expand this with the full dataset
-        dictionary_data = [
-            # A
-            ("Abuse", "To insult, ridicule", "Buh you na abuse the man bad way oh!", "You shouldn't insult the man badly!"),
-            ("Argo Oil", "Vegetable oil", "Wheh play ley argo oy (eh)?", "Where is the vegetable oil?"),
-            ("All two", "both", "Take all two to the papay deh", "Take both to the old man"),
-            ("Antay", "Aunt", "La ma antay (deh)", "That's my aunt (there)"),
-            
-            # B  
-            ("Ba", "A friend, buddy, peer", "Ba, come leh go", "Friend, come let's go"),
-            ("banjo", "To sell cheap, discount", "All de tinnen you selling yeh, la banjo?", "Everything you sell, are they cheap?"),
-            ("Beard-beard", "A longer beard on a man", "See beard-beard oh!", "Look at his beard!"),
-            ("Behind you", "To bother someone, nag", "Buh what you behind me for again?", "Why are you harassing me again?"),
-            ("belle", "Big stomach, pregnancy", "The woman geh belle for da man", "The woman was impregnated by that man"),
-            ("Bessa", "Busybody, gossip", "Do na believe dat ting, dat bessa", "Don't believe that, that's gossip"),
-            ("Big heart", "Arrogant, boastful", "You tink say you geh big heart?", "Do you think you're that bold?"),
-            ("Bluff", "To show off, flaunt", "Oh? So la me you bluffing so?", "Are you showing off for me?"),
-            ("Boiling", "Going out, having fun", "Today we boil!", "Today we're having fun!"),
-            ("Book people", "Educated class", "The book people na come oh", "The educated people are here"),
-            
-            # C
-            ("Call me dog", "Oath of contempt", "If I don't put one slap in your ear, call me dog!", "I would rather be called a dog than let you do that!"),
-            ("Che", "Expression of surprise", "Che! So this whole pot of rice y'all swallow all?", "So you mean you ate all this rice?"),
-            ("Chuck rice", "Rice with greens", "I coming eat my chuck rice", "I'm going to eat my chuck rice"),
-            ("Country ray", "Times are hard", "Since this man take the country, the country ray", "Since this president took office, times are tough"),
-            
-            # D
-            ("Da lie", "Not true, false", "Da ting you sayin da lie", "What you're saying is false"),
-            ("Dear", "Expensive, costly", "This thing too dear", "This is too expensive"),
-            ("Dokafleh", "Used clothes", "Please bi me dokafleh sneakor", "Please buy me used sneakers"),
-            
-            # F
-            ("Fine", "Beautiful, attractive", "This girl fine oh!", "This girl is beautiful!"),
-            ("Flakajay", "Foolish, stupid", "I do na like dat flakajay talk", "I don't like that foolish talk"),
-            ("Friskay", "Wild, rude", "Dis boy friskay-o", "This boy is wild!"),
-            
-            # G
-            ("Gapping", "Hungry, suffering", "The gapping rate is high", "The hunger rate is high"),
-            ("Gbelleh", "Foolish, stupid", "Dey gar dah gbelleh", "This guy is stupid"),
-            ("Gborku", "Plenty, many", "We have ri gborku", "We have plenty of rice"),
-            
-            # H  
-            ("Hala", "To shout, yell", "Why you hala so?", "Why are you shouting like that?"),
-            ("Haat clean", "Honest, good intentions", "This man haat clean", "This man has good intentions"),
-            ("Hellaba", "Stubborn", "This pekin hellaba", "This child is stubborn"),
-            
-            # J
-            ("Junk", "Inexperienced, ignorant", "This guy a junk", "This guy is inexperienced"),
-            ("Jus na", "Right away", "Come jus na", "Come right away"),
-            
-            # K
-            ("Kubba", "Cunning, experienced", "This girl da kuba", "This girl is cunning"),
-            ("Kwi", "Educated, modern", "Only kwi people live in the city", "Only educated people live in the city"),
-            
-            # L
-            ("La lie", "That's a lie", "La lie! I never say that", "That's a lie! I never said that"),
-            ("Level", "Empty talk, excuse", "Don't put me en level", "Don't give me empty talk"),
-            
-            # M
-            ("Make mouf", "To boast", "He like make mouf", "He likes to boast"),
-            ("Mean", "Selfish, stingy", "This man mean oh", "This man is stingy"),
-            
-            # N
-            ("Now-now", "Right now", "Come now-now", "Come right now"),
-            ("Nyan", "Naive, foolish", "Don't be nyan", "Don't be naive"),
-            
-            # P
-            ("Palava", "Argument, problem", "We get palava", "We have a problem"),
-            ("Papay", "Wealthy older man", "Go to the papay", "Go to the wealthy man"),
-            ("Pekin", "Young boy", "This pekin smart", "This boy is smart"),
-            ("Play low", "Forget about it", "Just play it low", "Just forget about it"),
-            
-            # R
-            ("Ray", "Red", "See the ray car", "See the red car"),
-            ("Rogue", "Thief", "That man is rogue", "That man is a thief"),
-            
-            # S
-            ("Sabi", "Cunning, crafty", "He sabi oh", "He's crafty"),
-            ("Small-small", "Gradually", "We go do it small-small", "We'll do it gradually"),
-            ("Sweet", "Delicious", "This food sweet", "This food is delicious"),
-            
-            # T
-            ("Today person", "Modern person", "She's a today person", "She's a modern person"),
-            ("Tote", "To carry", "Tote this bag", "Carry this bag"),
-            
-            # V
-            ("Vex", "Angry", "I vex with you", "I'm angry with you"),
-            ("Voke", "To tease", "Don't voke me", "Don't tease me"),
-            
-            # W
-            ("Wahala", "Problem, trouble", "We get wahala", "We have trouble"),
-            ("Woking", "Food", "I want woking", "I want food"),
-            
-            # Y
-            ("Yana", "Street vendor", "Go to the yana boy", "Go to the street vendor"),
-            ("Yute", "Youth, young person", "All the yute dem", "All the young people"),
-            
-            # Z
-            ("Zoko", "Young criminal", "That boy is zoko", "That boy is a petty thief"),
-            ("Zepsay", "Crazy, insane", "He zepsay oh", "He's crazy"),
-        ]
-        
-        self.stdout.write(f"Processing {len(dictionary_data)} entries...")
+        self.stdout.write(f"Processing {len(DICTIONARY_DATA)} entries...")
         
+        # The table was emptied in handle(), so every row is a plain insert
         created_count = 0
-        updated_count = 0
         
         # Process in batches
-        for i in range(0, len(dictionary_data), batch_size):
-            batch = dictionary_data[i:i + batch_size]
+        for i in range(0, len(DICTIONARY_DATA), batch_size):
+            batch = DICTIONARY_DATA[i:i + batch_size]
+            
+            batch_now = timezone.now()
+            entries = []
+            entry_categories = []
+            for koloqua_text, english_translation, example_koloqua, example_english in batch:
+                entry_type, category_names = classify_entry(koloqua_text, english_translation)
+                categories = self.categories_for_names(category_names, self._cat_map)
+                entries.append(KoloquaEntry(
+                    koloqua_text=koloqua_text.strip(),
+                    english_translation=english_translation.strip(),
+                    example_sentence_koloqua=example_koloqua.strip(),
+                    example_sentence_english=example_english.strip(),
+                    entry_type=entry_type,
+                    context_explanation=SEED_CONTEXT_EXPLANATIONS[entry_type],
+                    contributor=admin_user,
+                    contributor_username=admin_user.username,
+                    contributor_level=admin_user.level,
+                    status='verified',  # Auto-verify initial data
+                    verification_count=5,  # Set high verification count
+                    verified_at=batch_now,
+                    upvotes=3,  # Give initial positive votes
+                    tags=['initial-data', 'verified'],
+                    category_ids=sorted(category.pk for category in categories),
+                ))
+                entry_categories.append(categories)
             
             with transaction.atomic():
-                for koloqua_text, english_translation, example_koloqua, example_english in batch:
-                    try:
-                        # Check if entry already exists
-                        existing_entry = KoloquaEntry.objects.filter(
-                            koloqua_text__iexact=koloqua_text.strip()
-                        ).first()
-                        
-                        if existing_entry:
-                            # Update if not verified
-                            if existing_entry.status != 'verified':
-                                existing_entry.english_translation = english_translation.strip()
-                                existing_entry.example_sentence_koloqua = example_koloqua.strip()
-                                existing_entry.example_sentence_english = example_english.strip()
-                                existing_entry.status = 'verified'
-                                existing_entry.verification_count = 5
-                                existing_entry.verified_at = timezone.now()
-                                existing_entry.save()
-                                updated_count += 1
-                        else:
-                            # Create new entry
-                            entry_type = self.determine_entry_type(koloqua_text, english_translation)
-                            
-                            entry = KoloquaEntry.objects.create(
-                                koloqua_text=koloqua_text.strip(),
-                                english_translation=english_translation.strip(),
-                                example_sentence_koloqua=example_koloqua.strip(),
-                                example_sentence_english=example_english.strip(),
-                                entry_type=entry_type,
-                                context_explanation=f"Common {entry_type} used in Liberian Koloqua",
-                                contributor=admin_user,
-                                status='verified',  # Auto-verify initial data
-                                verification_count=5,  # Set high verification count
-                                verified_at=timezone.now(),
-                                upvotes=3,  # Give initial positive votes
-                                tags=['initial-data', 'verified']
-                            )
-                            
-                            # Add categories
-                            categories = self.categorize_entry(koloqua_text, english_translation)
-                            if categories:
-                                entry.categories.set(categories)
-                            
-                            created_count += 1
-                            
-                    except Exception as e:
-                        self.stdout.write(
-                            self.style.ERROR(f"Error processing '{koloqua_text}': {str(e)}")
-                        )
-                        continue
+                self.bulk_create_entries(entries, entry_categories, batch_size)
+            created_count += len(entries)
             
             # Show progress
-            self.stdout.write(f"Processed batch {i//batch_size + 1}/{len(dictionary_data)//batch_size + 1}")
+            self.stdout.write(f"Processed batch {i//batch_size + 1}/{len(DICTIONARY_DATA)//batch_size + 1}")
         
-        # Award badge to admin user
-        try:
-            founder_badge = Badge.objects.get(name='Dictionary Founder')
-            UserBadge.objects.get_or_create(user=admin_user, badge=founder_badge)
-        except Badge.DoesNotExist:
-            pass
+        # Award badge to admin user; an existing award is skipped by unique_together
+        founder_badge_id = Badge.objects.filter(name='Dictionary Founder').values_list('pk', flat=True).first()
+        if founder_badge_id:
+            UserBadge.objects.bulk_create([UserBadge(user=admin_user, badge_id=founder_badge_id)], ignore_conflicts=True)
         
-        # Update admin user points
-        admin_user.points += created_count * 10  # 10 points per contribution
-        admin_user.save()
+        # Update admin user points in the database, without rewriting the rest of the row
+        User.objects.filter(pk=admin_user.pk).update(points=F('points') + created_count * 10)  # 10 points per contribution
         
         self.stdout.write(
             self.style.SUCCESS(
-                f"Import completed! Created: {created_count}, Updated: {updated_count}"
+                f"Import completed! Created: {created_count}"
             )
         )
     
-    def import_from_csv(self, csv_file_path, admin_user, batch_size):
+    def import_from_csv(self, csv_file_path, admin_user, batch_size, n_procs=1, chunksize=1):
         """Import from CSV file"""
         if not csv_file_path:
             self.stdout.write(self.style.ERROR("CSV file path required for CSV import"))
             return
         
         try:
-            with open(csv_file_path, 'r', encoding='utf-8') as file:
-                # Try to detect CSV format
-                sample = file.read(1024)
-                file.seek(0)
-                
+            # newline='' lets csv handle line breaks inside quoted fields; large buffer for big files
+            with open(csv_file_path, 'r', encoding='utf-8', newline='', buffering=CSV_READ_BUFFER_SIZE) as file:
                 # Assume CSV format: Koloqua,English,Example_Koloqua,Example_English
-                reader = csv.DictReader(file)
+                reader = csv.reader(file)
+                header = next(reader, [])
+                # Position of each expected column; missing columns (and short rows) read as ''
+                positions = [header.index(name) if name in header else None for name in CSV_COLUMNS]
                 
-                entries_data = []
-                for row in reader:
-                    entries_data.append((
-                        row.get('koloqua_text', '').strip(),
-                        row.get('english_translation', '').strip(),
-                        row.get('example_sentence_koloqua', '').strip(),
-                        row.get('example_sentence_english', '').strip()
-                    ))
+                # Rows are read lazily; only one batch is held in memory at a time
+                entries_data = (
+                    tuple(row[i].strip() if i is not None and i < len(row) else '' for i in positions)
+                    for row in reader
+                )
                 
-                self.stdout.write(f"Found {len(entries_data)} entries in CSV")
+                # One query for the stored words (case-insensitive); words created below are added
+                # as we go so a later row repeating a word updates it instead of inserting twice.
+                # A live entry wins over rejected ones: verifying a rejected duplicate of a live
+                # word would break kol_unique_active.
+                existing = {}
+                for text, pk, status in KoloquaEntry.objects.values_list('koloqua_text', 'id', 'status'):
+                    key = text.lower()
+                    if status != 'rejected' or key not in existing:
+                        existing[key] = pk
                 
                 # Process similar to hardcoded data
                 created_count = 0
-                for i in range(0, len(entries_data), batch_size):
-                    batch = entries_data[i:i + batch_size]
+                updated_count = 0
+                row_count = 0
+                with contextlib.ExitStack() as stack:
+                    # Workers only classify rows; every database write stays in this process.
+                    # imap keeps batch order so a word repeated later in the file still wins.
+                    if n_procs > 1:
+                        pool = stack.enter_context(multiprocessing.Pool(n_procs))
+                        prepared_batches = pool.imap(prepare_rows, chunks(entries_data, batch_size), chunksize=chunksize)
+                    else:
+                        prepared_batches = map(prepare_rows, chunks(entries_data, batch_size))
                     
-                    with transaction.atomic():
-                        for koloqua_text, english_translation, example_koloqua, example_english in batch:
-                            if not koloqua_text or not english_translation:
-                                continue
+                    for batch in prepared_batches:
+                        row_count += len(batch)
+                        
+                        # Keyed by pk / lowercased word so a word repeated within the batch keeps its last row
+                        updates = {}
+                        creates = {}
+                        with transaction.atomic():
+                            batch_now = timezone.now()
+                            for row, entry_type, category_names in batch:
+                                koloqua_text, english_translation, example_koloqua, example_english = row
                                 
-                            entry, created = KoloquaEntry.objects.update_or_create(
-                                koloqua_text__iexact=koloqua_text,
-                                defaults={
+                                fields = {
                                     'koloqua_text': koloqua_text,
                                     'english_translation': english_translation,
                                     'example_sentence_koloqua': example_koloqua,
                                     'example_sentence_english': example_english,
-                                    'entry_type': self.determine_entry_type(koloqua_text, english_translation),
-                                    'context_explanation': f"Imported from CSV data",
+                                    'entry_type': entry_type,
+                                    'context_explanation': "Imported from CSV data",
                                     'contributor': admin_user,
+                                    'contributor_username': admin_user.username,
+                                    'contributor_level': admin_user.level,
                                     'status': 'verified',
                                     'verification_count': 5,
-                                    'verified_at': timezone.now(),
+                                    'verified_at': batch_now,
                                     'upvotes': 2,
                                     'tags': ['csv-import', 'verified']
                                 }
-                            )
+                                
+                                key = koloqua_text.lower()
+                                pk = existing.get(key)
+                                if pk:
+                                    updates[pk] = KoloquaEntry(pk=pk, **fields)
+                                else:
+                                    categories = self.categories_for_names(category_names, self._cat_map)
+                                    entry = KoloquaEntry(**fields, category_ids=sorted(category.pk for category in categories))
+                                    creates[key] = (entry, categories)
+                            
+                            if creates:
+                                entries = [entry for entry, _ in creates.values()]
+                                self.bulk_create_entries(
+                                    entries, [categories for _, categories in creates.values()], batch_size, use_copy=True
+                                )
+                                existing.update((key, entry.pk) for key, (entry, _) in creates.items())
+                                created_count += len(entries)
                             
-                            if created:
-                                categories = self.categorize_entry(koloqua_text, english_translation)
-                                if categories:
-                                    entry.categories.set(categories)
-                                created_count += 1
+                            if updates:
+                                # bulk_update skips post_save, so refresh the search vectors alongside it
+                                KoloquaEntry.objects.bulk_update(updates.values(), fields=CSV_UPDATE_FIELDS, batch_size=batch_size)
+                                KoloquaEntry.objects.filter(pk__in=updates).update(
+                                    search_vector=KoloquaEntry.build_search_vector()
+                                )
+                                updated_count += len(updates)
                 
-                self.stdout.write(self.style.SUCCESS(f"CSV import completed! Created: {created_count} entries"))
+                self.stdout.write(f"Read {row_count} complete entries from CSV")
+                self.stdout.write(self.style.SUCCESS(f"CSV import completed! Created: {created_count}, Updated: {updated_count}"))
                 
-        except FileNotFoundError:
-            self.stdout.write(self.style.ERROR(f"CSV file not found: {csv_file_path}"))
-        except Exception as e:
-            self.stdout.write(self.style.ERROR(f"Error importing CSV: {str(e)}"))
\ No newline at end of file
+        except FileNotFoundError as e:
+            # Raised rather than printed so the surrounding transaction rolls back
+            raise CommandError(f"CSV file not found: {csv_file_path}") from e
\ No newline at end of file
@@ -0,0 +1,36 @@
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations, models
+from django.db.models.functions import Cast
+
+
+def populate_search_vector(apps, schema_editor):
+    KoloquaEntry = apps.get_model('dictionary', 'KoloquaEntry')
+    KoloquaEntry.objects.update(search_vector=(
+        SearchVector('koloqua_text', weight='A', config='simple') +
+        SearchVector('english_translation', weight='B', config='english') +
+        SearchVector('entry_type', Cast('tags', models.TextField()), weight='C', config='simple') +
+        SearchVector('example_sentence_koloqua', weight='D', config='simple') +
+        SearchVector('example_sentence_english', weight='D', config='english')
+    ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0002_koloquaentry_embedding_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='koloquaentry',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='koloquaentry',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='koloqua_ent_search_gin'),
+        ),
+        migrations.RunPython(populate_search_vector, migrations.RunPython.noop),
+    ]
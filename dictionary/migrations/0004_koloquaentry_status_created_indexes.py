@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0003_koloquaentry_search_vector'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='koloquaentry',
+            name='koloqua_ent_status_ee4855_idx',
+        ),
+        migrations.AddIndex(
+            model_name='koloquaentry',
+            index=models.Index(fields=['status', '-created_at'], name='kol_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='koloquaentry',
+            index=models.Index(condition=models.Q(('status', 'verified')), fields=['-created_at'], name='kol_verified_recent_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0004_koloquaentry_status_created_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SiteStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('word_count', models.IntegerField(default=0)),
+                ('example_count', models.IntegerField(default=0)),
+                ('pending_entries', models.IntegerField(default=0)),
+                ('total_entries', models.IntegerField(default=0)),
+                ('total_users', models.IntegerField(default=0)),
+                ('contributor_count', models.IntegerField(default=0)),
+                ('translation_count', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Site Stats',
+                'db_table': 'site_stats',
+            },
+        ),
+    ]
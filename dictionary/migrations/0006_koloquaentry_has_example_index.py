@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0005_sitestats'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='koloquaentry',
+            index=models.Index(condition=models.Q(('example_sentence_koloqua__gt', '')), fields=['id'], name='kol_has_example_idx'),
+        ),
+    ]
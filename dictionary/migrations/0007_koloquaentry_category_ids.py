@@ -0,0 +1,39 @@
+from collections import defaultdict
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+def populate_category_ids(apps, schema_editor):
+    KoloquaEntry = apps.get_model('dictionary', 'KoloquaEntry')
+    category_ids = defaultdict(list)
+    links = KoloquaEntry.categories.through.objects.order_by('wordcategory_id')
+    for entry_id, category_id in links.values_list('koloquaentry_id', 'wordcategory_id'):
+        category_ids[entry_id].append(category_id)
+    for entry_id, ids in category_ids.items():
+        KoloquaEntry.objects.filter(pk=entry_id).update(category_ids=ids)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0006_koloquaentry_has_example_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='koloquaentry',
+            name='category_ids',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), blank=True, default=list, editable=False, size=None),
+        ),
+        migrations.AddIndex(
+            model_name='koloquaentry',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['category_ids'], name='kol_category_ids_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='koloquaentry',
+            index=models.Index(fields=['status', 'entry_type', '-upvotes'], name='kol_status_type_votes_idx'),
+        ),
+        migrations.RunPython(populate_category_ids, migrations.RunPython.noop),
+    ]
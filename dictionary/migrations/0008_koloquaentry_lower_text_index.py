@@ -0,0 +1,16 @@
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0007_koloquaentry_category_ids'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='koloquaentry',
+            index=models.Index(django.db.models.functions.text.Lower('koloqua_text'), condition=models.Q(('status', 'rejected'), _negated=True), name='kol_lower_idx'),
+        ),
+    ]
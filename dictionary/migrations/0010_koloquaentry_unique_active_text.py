@@ -0,0 +1,109 @@
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models import Case, F, Value, When, Window
+from django.db.models.functions import Lower, RowNumber
+
+
+# Original statuses of the entries rejected below, kept so the migration can be
+# reversed; drop the table by hand once the change has settled
+BACKUP_TABLE = 'dictionary_0010_rejected_duplicates'
+
+
+def adjust_counters(SiteStats, statuses, sign):
+    # .update() skips the counter receivers
+    SiteStats.objects.filter(pk=1).update(
+        word_count=F('word_count') + sign * statuses.count('verified'),
+        pending_entries=F('pending_entries') + sign * statuses.count('pending'),
+    )
+
+
+def reject_duplicate_live_entries(apps, schema_editor):
+    """Keep one live entry per lower(koloqua_text) so kol_unique_active can be built.
+
+    The survivor is the verified entry if there is one, otherwise the oldest;
+    the rest are marked rejected, which keeps their votes and history around.
+    Two verified entries for the same word are left for a person to merge: the
+    migration stops and lists them instead of rejecting one.
+    """
+    KoloquaEntry = apps.get_model('dictionary', 'KoloquaEntry')
+    SiteStats = apps.get_model('dictionary', 'SiteStats')
+
+    ranked = KoloquaEntry.objects.exclude(status='rejected').annotate(
+        rank=Window(
+            RowNumber(),
+            partition_by=[Lower('koloqua_text')],
+            order_by=[
+                Case(When(status='verified', then=Value(0)), default=Value(1)),
+                'created_at',
+                'pk',
+            ],
+        )
+    )
+    duplicates = [
+        (pk, koloqua_text, status)
+        for pk, koloqua_text, status, rank in ranked.values_list('pk', 'koloqua_text', 'status', 'rank')
+        if rank > 1
+    ]
+    if not duplicates:
+        return
+
+    listing = '\n'.join(f'  {pk}  {koloqua_text!r}  {status}' for pk, koloqua_text, status in duplicates)
+    if any(status == 'verified' for _, _, status in duplicates):
+        raise RuntimeError(
+            'Several verified entries share a word; merge or reject them before migrating '
+            '(pk, word, status of the entries that would be rejected):\n' + listing
+        )
+    print(f'\n  Rejecting {len(duplicates)} duplicate entries (pk, word, old status):\n{listing}')
+
+    quoted = schema_editor.quote_name(BACKUP_TABLE)
+    schema_editor.execute(f'CREATE TABLE {quoted} (entry_id bigint PRIMARY KEY, status varchar(20) NOT NULL)')
+    with schema_editor.connection.cursor() as cursor:
+        cursor.executemany(
+            f'INSERT INTO {quoted} (entry_id, status) VALUES (%s, %s)',
+            [(pk, status) for pk, _, status in duplicates],
+        )
+
+    KoloquaEntry.objects.filter(pk__in=[pk for pk, _, _ in duplicates]).update(status='rejected')
+    adjust_counters(SiteStats, [status for _, _, status in duplicates], -1)
+
+
+def restore_duplicate_live_entries(apps, schema_editor):
+    KoloquaEntry = apps.get_model('dictionary', 'KoloquaEntry')
+    SiteStats = apps.get_model('dictionary', 'SiteStats')
+
+    quoted = schema_editor.quote_name(BACKUP_TABLE)
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute('SELECT to_regclass(%s) IS NOT NULL', [BACKUP_TABLE])
+        if not cursor.fetchone()[0]:
+            return
+        cursor.execute(f'SELECT entry_id, status FROM {quoted}')
+        saved = cursor.fetchall()
+
+    restored = []
+    for status in {status for _, status in saved}:
+        # Entries someone has since moved out of rejected keep their new status
+        restored += [status] * KoloquaEntry.objects.filter(
+            pk__in=[pk for pk, saved_status in saved if saved_status == status],
+            status='rejected',
+        ).update(status=status)
+    adjust_counters(SiteStats, restored, 1)
+    schema_editor.execute(f'DROP TABLE {quoted}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0009_koloquaentry_text_trigram_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(reject_duplicate_live_entries, restore_duplicate_live_entries),
+        migrations.RemoveIndex(
+            model_name='koloquaentry',
+            name='kol_lower_idx',
+        ),
+        migrations.AddConstraint(
+            model_name='koloquaentry',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('koloqua_text'), condition=models.Q(('status', 'rejected'), _negated=True), name='kol_unique_active'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+import pgvector.django
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0010_koloquaentry_unique_active_text'),
+    ]
+
+    operations = [
+        pgvector.django.VectorExtension(),
+        # float8[] -> vector(1536): existing embeddings are cast in place rather than regenerated
+        migrations.RunSQL(
+            sql='ALTER TABLE koloqua_entries ALTER COLUMN embedding TYPE vector(1536) USING embedding::vector(1536)',
+            reverse_sql='ALTER TABLE koloqua_entries ALTER COLUMN embedding TYPE double precision[] USING embedding::real[]::double precision[]',
+            state_operations=[
+                migrations.AlterField(
+                    model_name='koloquaentry',
+                    name='embedding',
+                    field=pgvector.django.VectorField(blank=True, dimensions=1536, help_text='Vector embedding for semantic search', null=True),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='koloquaentry',
+            index=pgvector.django.HnswIndex(ef_construction=64, fields=['embedding'], m=16, name='kol_embedding_hnsw', opclasses=['vector_cosine_ops']),
+        ),
+    ]
@@ -0,0 +1,20 @@
+import pgvector.django
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0011_koloquaentry_embedding_vector'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='koloquaentry',
+            name='kol_embedding_hnsw',
+        ),
+        migrations.AddIndex(
+            model_name='koloquaentry',
+            index=pgvector.django.HnswIndex(ef_construction=128, fields=['embedding'], m=24, name='kol_embedding_hnsw', opclasses=['vector_cosine_ops']),
+        ),
+    ]
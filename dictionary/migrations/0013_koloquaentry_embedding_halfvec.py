@@ -0,0 +1,32 @@
+import pgvector.django
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0012_koloquaentry_embedding_hnsw_tuning'),
+    ]
+
+    operations = [
+        # The HNSW opclass is tied to the column type, so drop it before the rewrite
+        migrations.RemoveIndex(
+            model_name='koloquaentry',
+            name='kol_embedding_hnsw',
+        ),
+        migrations.RunSQL(
+            sql='ALTER TABLE koloqua_entries ALTER COLUMN embedding TYPE halfvec(1536) USING embedding::halfvec(1536)',
+            reverse_sql='ALTER TABLE koloqua_entries ALTER COLUMN embedding TYPE vector(1536) USING embedding::vector(1536)',
+            state_operations=[
+                migrations.AlterField(
+                    model_name='koloquaentry',
+                    name='embedding',
+                    field=pgvector.django.HalfVectorField(blank=True, dimensions=1536, help_text='Vector embedding for semantic search', null=True),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='koloquaentry',
+            index=pgvector.django.HnswIndex(ef_construction=128, fields=['embedding'], m=24, name='kol_embedding_hnsw', opclasses=['halfvec_cosine_ops']),
+        ),
+    ]
@@ -0,0 +1,20 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0013_koloquaentry_embedding_halfvec'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='koloquaentry',
+            name='score',
+            field=models.GeneratedField(db_persist=True, expression=models.F('upvotes') - models.F('downvotes') + models.F('verification_count') * 2, output_field=models.IntegerField()),
+        ),
+        migrations.AddIndex(
+            model_name='koloquaentry',
+            index=models.Index(fields=['status', '-score'], name='kol_status_score_idx'),
+        ),
+    ]
@@ -0,0 +1,46 @@
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0014_koloquaentry_score'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='koloquaentry',
+            name='tags_arr',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=64), blank=True, default=list, size=None),
+        ),
+        # jsonb list -> text[]; anything that isn't a JSON array becomes an empty list
+        migrations.RunSQL(
+            sql="""
+                UPDATE koloqua_entries SET tags_arr = ARRAY(
+                    SELECT left(tag, 64) FROM jsonb_array_elements_text(tags) AS tag
+                )
+                WHERE jsonb_typeof(tags) = 'array'
+            """,
+            reverse_sql="UPDATE koloqua_entries SET tags = to_jsonb(tags_arr)",
+        ),
+        migrations.RemoveField(
+            model_name='koloquaentry',
+            name='tags',
+        ),
+        migrations.RenameField(
+            model_name='koloquaentry',
+            old_name='tags_arr',
+            new_name='tags',
+        ),
+        migrations.AlterField(
+            model_name='koloquaentry',
+            name='tags',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=64), blank=True, default=list, help_text='List of tags for easier searching', size=None),
+        ),
+        migrations.AddIndex(
+            model_name='koloquaentry',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['tags'], name='kol_tags_gin'),
+        ),
+    ]
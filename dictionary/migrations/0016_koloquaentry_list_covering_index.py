@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0015_koloquaentry_tags_array'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='koloquaentry',
+            name='kol_status_created_idx',
+        ),
+        migrations.AddIndex(
+            model_name='koloquaentry',
+            index=models.Index(fields=['status', '-created_at'], include=('id', 'koloqua_text', 'entry_type', 'upvotes', 'downvotes', 'contributor'), name='kol_list_covering_idx'),
+        ),
+    ]
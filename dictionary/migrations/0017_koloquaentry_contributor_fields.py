@@ -0,0 +1,40 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0016_koloquaentry_list_covering_index'),
+        ('users', '0003_user_active_contributor_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='koloquaentry',
+            name='contributor_username',
+            field=models.CharField(blank=True, editable=False, max_length=150),
+        ),
+        migrations.AddField(
+            model_name='koloquaentry',
+            name='contributor_level',
+            field=models.CharField(blank=True, editable=False, max_length=20),
+        ),
+        migrations.RunSQL(
+            sql="""
+                UPDATE koloqua_entries AS e
+                SET contributor_username = u.username, contributor_level = u.level
+                FROM users AS u
+                WHERE u.id = e.contributor_id
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        # Let the list's covering index answer the contributor details as well
+        migrations.RemoveIndex(
+            model_name='koloquaentry',
+            name='kol_list_covering_idx',
+        ),
+        migrations.AddIndex(
+            model_name='koloquaentry',
+            index=models.Index(fields=['status', '-created_at'], include=('id', 'koloqua_text', 'entry_type', 'upvotes', 'downvotes', 'contributor', 'contributor_username', 'contributor_level'), name='kol_list_covering_idx'),
+        ),
+    ]
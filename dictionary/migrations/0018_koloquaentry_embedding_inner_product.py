@@ -0,0 +1,26 @@
+import pgvector.django
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0017_koloquaentry_contributor_fields'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='koloquaentry',
+            name='kol_embedding_hnsw',
+        ),
+        # Inner product only equals cosine similarity for unit vectors. Reversing keeps the
+        # normalized values, which rank identically under cosine distance
+        migrations.RunSQL(
+            sql='UPDATE koloqua_entries SET embedding = l2_normalize(embedding) WHERE embedding IS NOT NULL',
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name='koloquaentry',
+            index=pgvector.django.HnswIndex(ef_construction=128, fields=['embedding'], m=24, name='kol_embedding_hnsw', opclasses=['halfvec_ip_ops']),
+        ),
+    ]
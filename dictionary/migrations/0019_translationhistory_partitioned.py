@@ -0,0 +1,110 @@
+from django.db import migrations, models
+
+
+# translation_history becomes PARTITION BY RANGE (searched_at) with one partition
+# per UTC month. Postgres requires the partition key in the primary key, so it
+# is (id, searched_at); id stays unique through its sequence. Partitions are
+# created from the oldest existing row up to three months ahead, plus a default
+# partition so inserts never fail if the maintenance command falls behind.
+# Later partitions and retention are handled by manage_history_partitions.
+PARTITION_SQL = """
+    CREATE TABLE translation_history_partitioned (
+        id bigserial NOT NULL,
+        search_text varchar(255) NOT NULL,
+        search_language varchar(10) NOT NULL,
+        found boolean NOT NULL,
+        searched_at timestamp with time zone NOT NULL,
+        result_entry_id bigint NULL,
+        user_id bigint NULL
+    ) PARTITION BY RANGE (searched_at);
+
+    DO $$
+    DECLARE
+        month_start date := date_trunc('month', LEAST(
+            COALESCE((SELECT min(searched_at) FROM translation_history), now()), now()
+        ) AT TIME ZONE 'UTC')::date;
+        last_month date := (date_trunc('month', now() AT TIME ZONE 'UTC') + interval '3 months')::date;
+    BEGIN
+        WHILE month_start <= last_month LOOP
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF translation_history_partitioned FOR VALUES FROM (%L) TO (%L)',
+                'translation_history_' || to_char(month_start, 'YYYY_MM'),
+                to_char(month_start, 'YYYY-MM-DD') || ' 00:00:00+00',
+                to_char(month_start + interval '1 month', 'YYYY-MM-DD') || ' 00:00:00+00'
+            );
+            month_start := (month_start + interval '1 month')::date;
+        END LOOP;
+    END $$;
+
+    CREATE TABLE translation_history_default PARTITION OF translation_history_partitioned DEFAULT;
+
+    INSERT INTO translation_history_partitioned
+        (id, search_text, search_language, found, searched_at, result_entry_id, user_id)
+    SELECT id, search_text, search_language, found, searched_at, result_entry_id, user_id
+    FROM translation_history;
+
+    DROP TABLE translation_history;
+    ALTER TABLE translation_history_partitioned RENAME TO translation_history;
+    ALTER SEQUENCE translation_history_partitioned_id_seq RENAME TO translation_history_id_seq;
+    SELECT setval('translation_history_id_seq', COALESCE((SELECT max(id) FROM translation_history), 0) + 1, false);
+
+    ALTER TABLE translation_history ADD CONSTRAINT translation_history_pkey PRIMARY KEY (id, searched_at);
+    ALTER TABLE translation_history
+        ADD CONSTRAINT translation_history_result_entry_id_d6412133_fk_koloqua_entries_id
+        FOREIGN KEY (result_entry_id) REFERENCES koloqua_entries (id)
+        ON DELETE SET NULL DEFERRABLE INITIALLY DEFERRED;
+    ALTER TABLE translation_history
+        ADD CONSTRAINT translation_history_user_id_ef82ea10_fk_users_id
+        FOREIGN KEY (user_id) REFERENCES users (id)
+        ON DELETE SET NULL DEFERRABLE INITIALLY DEFERRED;
+    CREATE INDEX translation_history_result_entry_id_f26697ce ON translation_history (result_entry_id);
+    CREATE INDEX translation_history_user_id_3fbf2066 ON translation_history (user_id);
+"""
+
+UNPARTITION_SQL = """
+    CREATE TABLE translation_history_flat (
+        id bigint NOT NULL GENERATED BY DEFAULT AS IDENTITY,
+        search_text varchar(255) NOT NULL,
+        search_language varchar(10) NOT NULL,
+        found boolean NOT NULL,
+        searched_at timestamp with time zone NOT NULL,
+        result_entry_id bigint NULL,
+        user_id bigint NULL
+    );
+
+    INSERT INTO translation_history_flat
+        (id, search_text, search_language, found, searched_at, result_entry_id, user_id)
+    SELECT id, search_text, search_language, found, searched_at, result_entry_id, user_id
+    FROM translation_history;
+
+    DROP TABLE translation_history CASCADE;
+    ALTER TABLE translation_history_flat RENAME TO translation_history;
+    ALTER SEQUENCE translation_history_flat_id_seq RENAME TO translation_history_id_seq;
+    SELECT setval('translation_history_id_seq', COALESCE((SELECT max(id) FROM translation_history), 0) + 1, false);
+
+    ALTER TABLE translation_history ADD CONSTRAINT translation_history_pkey PRIMARY KEY (id);
+    ALTER TABLE translation_history
+        ADD CONSTRAINT translation_history_result_entry_id_d6412133_fk_koloqua_entries_id
+        FOREIGN KEY (result_entry_id) REFERENCES koloqua_entries (id) DEFERRABLE INITIALLY DEFERRED;
+    ALTER TABLE translation_history
+        ADD CONSTRAINT translation_history_user_id_ef82ea10_fk_users_id
+        FOREIGN KEY (user_id) REFERENCES users (id) DEFERRABLE INITIALLY DEFERRED;
+    CREATE INDEX translation_history_result_entry_id_f26697ce ON translation_history (result_entry_id);
+    CREATE INDEX translation_history_user_id_3fbf2066 ON translation_history (user_id);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0018_koloquaentry_embedding_inner_product'),
+        ('users', '0003_user_active_contributor_index'),
+    ]
+
+    operations = [
+        migrations.RunSQL(sql=PARTITION_SQL, reverse_sql=UNPARTITION_SQL),
+        migrations.AddIndex(
+            model_name='translationhistory',
+            index=models.Index(fields=['-searched_at'], name='th_searched_at_idx'),
+        ),
+    ]
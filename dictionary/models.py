@@ -1,10 +1,20 @@
+import logging
 import os
+import time
+from collections import defaultdict
 from django.db import models
-from django.db import models
+from django.db import transaction
 from django.conf import settings
 from django.utils import timezone
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVector, SearchVectorField, TrigramSimilarity
+from django.db.models import F, Q, Count, OuterRef, Subquery
+from django.db.models.functions import Cast, Coalesce, Greatest, Lower
+from pgvector.django import HalfVectorField, HnswIndex
+
+logger = logging.getLogger(__name__)
 
 
 
@@ -23,6 +33,48 @@ class WordCategory(models.Model):
         return self.name
 
 
+TEXT_SEARCH_FIELDS = ('koloqua_text', 'english_translation')
+
+
+class KoloquaEntryQuerySet(models.QuerySet):
+    """Lexical search helpers shaped to hit the kol_text_trgm index"""
+
+    def _lowered(self, fields):
+        # lower(col) LIKE '%q%' matches the indexed expression; icontains compiles
+        # to upper(col::text) LIKE and falls back to a sequential scan
+        return self.alias(**{f'{field}_lower': Lower(field) for field in fields})
+
+    def text_contains(self, query, fields=TEXT_SEARCH_FIELDS):
+        """Case-insensitive substring match on the given text fields"""
+        query = query.strip().lower()
+        condition = Q()
+        for field in fields:
+            condition |= Q(**{f'{field}_lower__contains': query})
+        return self._lowered(fields).filter(condition)
+
+    def text_search(self, query, fields=TEXT_SEARCH_FIELDS):
+        """Substring or fuzzy (pg_trgm %) match, annotated with `similarity` for ranking.
+        
+        Both predicates probe the kol_text_trgm index, so Postgres answers the OR
+        with a BitmapOr instead of scanning the table.
+        """
+        query = query.strip().lower()
+        condition = Q()
+        for field in fields:
+            condition |= Q(**{f'{field}_lower__contains': query})
+            condition |= Q(**{f'{field}_lower__trigram_similar': query})
+        similarities = [TrigramSimilarity(Lower(field), query) for field in fields]
+        similarity = Greatest(*similarities) if len(similarities) > 1 else similarities[0]
+        return self._lowered(fields).filter(condition).annotate(similarity=similarity)
+
+
+class KoloquaEntryManager(models.Manager.from_queryset(KoloquaEntryQuerySet)):
+    """Default manager that leaves the 1536-d embedding in the database unless asked for"""
+    
+    def get_queryset(self):
+        return super().get_queryset().defer('embedding')
+
+
 class KoloquaEntry(models.Model):
     """Main model for Koloqua words and phrases"""
     
@@ -39,9 +91,10 @@ class KoloquaEntry(models.Model):
         ('rejected', 'Rejected'),
         ('needs_revision', 'Needs Revision'),
     ]
-    embedding = ArrayField(
-        models.FloatField(),
-        size=1536,
+    # Stored as unit-length FP16 (halfvec): half the heap and index footprint of vector(1536),
+    # and cosine similarity reduces to the inner product
+    embedding = HalfVectorField(
+        dimensions=1536,
         null=True,
         blank=True,
         help_text="Vector embedding for semantic search"
@@ -62,14 +115,24 @@ class KoloquaEntry(models.Model):
     
     # Classification
     categories = models.ManyToManyField(WordCategory, related_name='entries', blank=True)
-    tags = models.JSONField(default=list, blank=True, help_text="List of tags for easier searching")
+    tags = ArrayField(models.CharField(max_length=64), default=list, blank=True, help_text="List of tags for easier searching")
     
     # Metadata
     contributor = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, related_name='contributions')
+    # Denormalized from the contributor so list responses need no users join; kept in step by
+    # save() and the sync_contributor_fields signal in users.signals
+    contributor_username = models.CharField(max_length=150, blank=True, editable=False)
+    contributor_level = models.CharField(max_length=20, blank=True, editable=False)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
     verification_count = models.IntegerField(default=0)
     upvotes = models.IntegerField(default=0)
     downvotes = models.IntegerField(default=0)
+    # Ranking score (see calculate_score), computed and stored by Postgres so popularity sorts can use an index
+    score = models.GeneratedField(
+        expression=F('upvotes') - F('downvotes') + F('verification_count') * 2,
+        output_field=models.IntegerField(),
+        db_persist=True,
+    )
     
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
@@ -81,6 +144,25 @@ class KoloquaEntry(models.Model):
     audio_pronunciation = models.FileField(upload_to='pronunciations/', blank=True, null=True)
     region_specific = models.CharField(max_length=100, blank=True, help_text="Specific region where this is used")
     
+    # Denormalized categories__id for indexed overlap filtering, maintained by the sync_entry_category_ids signal
+    category_ids = ArrayField(models.BigIntegerField(), default=list, blank=True, editable=False)
+    
+    # Full-text search document, maintained by the update_search_vector signal
+    search_vector = SearchVectorField(null=True, editable=False)
+    
+    objects = KoloquaEntryManager()
+    # Loads the embedding too, for code that needs the vectors in Python
+    objects_full = models.Manager()
+    
+    # 'accurate' verifications needed before a pending entry is auto-verified
+    AUTO_VERIFY_THRESHOLD = 3
+    
+    # Fields that feed search_vector; saves touching none of these skip the refresh
+    SEARCH_FIELDS = (
+        'koloqua_text', 'english_translation', 'entry_type', 'tags',
+        'example_sentence_koloqua', 'example_sentence_english',
+    )
+    
     class Meta:
         db_table = 'koloqua_entries'
         verbose_name = 'Koloqua Entry'
@@ -88,27 +170,134 @@ class KoloquaEntry(models.Model):
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['koloqua_text', 'status']),
-            models.Index(fields=['status', 'created_at']),
+            # Carries the list's narrow columns; english_translation is unbounded text and
+            # would push long rows past the btree tuple limit, so it is read from the heap
+            models.Index(
+                fields=['status', '-created_at'], name='kol_list_covering_idx',
+                include=[
+                    'id', 'koloqua_text', 'entry_type', 'upvotes', 'downvotes',
+                    'contributor', 'contributor_username', 'contributor_level',
+                ],
+            ),
+            models.Index(fields=['-created_at'], condition=models.Q(status='verified'), name='kol_verified_recent_idx'),
+            GinIndex(fields=['search_vector'], name='koloqua_ent_search_gin'),
+            models.Index(fields=['id'], condition=models.Q(example_sentence_koloqua__gt=''), name='kol_has_example_idx'),
+            GinIndex(fields=['category_ids'], name='kol_category_ids_gin'),
+            GinIndex(fields=['tags'], name='kol_tags_gin'),
+            models.Index(fields=['status', 'entry_type', '-upvotes'], name='kol_status_type_votes_idx'),
+            models.Index(fields=['status', '-score'], name='kol_status_score_idx'),
+            GinIndex(
+                OpClass(Lower('koloqua_text'), name='gin_trgm_ops'),
+                OpClass(Lower('english_translation'), name='gin_trgm_ops'),
+                name='kol_text_trgm',
+            ),
+            # Approximate nearest-neighbour index for semantic search (ORDER BY embedding <#> query);
+            # built with the 100K-1M tier of nl_interact.utils.configure_hnsw_params
+            HnswIndex(
+                fields=['embedding'], name='kol_embedding_hnsw',
+                m=24, ef_construction=128, opclasses=['halfvec_ip_ops'],
+            ),
         ]
         unique_together = [['koloqua_text', 'contributor']]
+        constraints = [
+            # One live entry per word (case-insensitive); rejected entries may be resubmitted
+            models.UniqueConstraint(Lower('koloqua_text'), condition=~models.Q(status='rejected'), name='kol_unique_active'),
+        ]
 
 
     
     def __str__(self):
         return f"{self.koloqua_text} - {self.english_translation[:50]}"
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the counted state so SiteStats can apply deltas on save/delete
+        if 'status' in field_names and 'example_sentence_koloqua' in field_names:
+            instance._stats_state = instance.get_stats_state()
+        if 'contributor_id' in field_names:
+            instance._synced_contributor_id = instance.contributor_id
+        return instance
+    
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'contributor' in update_fields or 'contributor_id' in update_fields:
+            self.sync_contributor_fields()
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'contributor_username', 'contributor_level'}
+        super().save(*args, **kwargs)
+    
+    def sync_contributor_fields(self):
+        """Copy the contributor's username/level when the contributor is new or changed"""
+        if self.contributor_id is None:
+            self.contributor_username = self.contributor_level = ''
+        elif (KoloquaEntry.contributor.is_cached(self)
+              or getattr(self, '_synced_contributor_id', None) != self.contributor_id):
+            self.contributor_username = self.contributor.username
+            self.contributor_level = self.contributor.level
+        self._synced_contributor_id = self.contributor_id
+    
+    def get_stats_state(self):
+        """SiteStats counters this entry contributes to (1 or 0 each)"""
+        return {
+            'total_entries': 1,
+            'word_count': int(self.status == 'verified'),
+            'pending_entries': int(self.status == 'pending'),
+            'example_count': int(bool(self.example_sentence_koloqua)),
+        }
+    
+    @staticmethod
+    def build_search_vector():
+        """Weighted search document: Koloqua text first, then meaning, then examples"""
+        return (
+            SearchVector('koloqua_text', weight='A', config='simple') +
+            SearchVector('english_translation', weight='B', config='english') +
+            SearchVector('entry_type', Cast('tags', models.TextField()), weight='C', config='simple') +
+            SearchVector('example_sentence_koloqua', weight='D', config='simple') +
+            SearchVector('example_sentence_english', weight='D', config='english')
+        )
+    
     def calculate_score(self):
-        """Calculate entry score for ranking"""
+        """Calculate entry score for ranking from in-memory counts (mirrors the score column)"""
         return self.upvotes - self.downvotes + (self.verification_count * 2)
     
+    @classmethod
+    def sync_category_ids(cls, entry_ids):
+        """Rewrite category_ids for the given entries from the categories M2M table"""
+        entry_ids = list(entry_ids)
+        category_ids = defaultdict(list)
+        links = cls.categories.through.objects.filter(koloquaentry_id__in=entry_ids).order_by('wordcategory_id')
+        for entry_id, category_id in links.values_list('koloquaentry_id', 'wordcategory_id'):
+            category_ids[entry_id].append(category_id)
+        for entry_id in entry_ids:
+            cls.objects.filter(pk=entry_id).update(category_ids=category_ids[entry_id])
+        return category_ids
+    
+    def refresh_verification_count(self):
+        """Recount 'accurate' verifications in one UPDATE ... SET = (SELECT COUNT(*)) and reload it"""
+        accurate = (
+            EntryVerification.objects.filter(entry=OuterRef('pk'), verification_type='accurate')
+            .order_by().values('entry').annotate(count=Count('pk')).values('count')
+        )
+        KoloquaEntry.objects.filter(pk=self.pk).update(verification_count=Coalesce(Subquery(accurate), 0))
+        self.refresh_from_db(fields=['verification_count'])
+    
     def verify(self):
-        """Mark entry as verified after enough community validation"""
-        if self.verification_count >= 5:
+        """
+        Mark a pending entry as verified after enough community validation.
+        
+        The pending row is locked first, so of several concurrent verifiers only one
+        sees True (and awards the verification points).
+        """
+        if self.status != 'pending' or self.verification_count < self.AUTO_VERIFY_THRESHOLD:
+            return False
+        with transaction.atomic():
+            if not KoloquaEntry.objects.select_for_update().filter(pk=self.pk, status='pending').exists():
+                return False
             self.status = 'verified'
             self.verified_at = timezone.now()
             self.save(update_fields=['status', 'verified_at'])
-            return True
-        return False
+        return True
 
 
 class EntryVerification(models.Model):
@@ -152,30 +341,36 @@ class EntryVote(models.Model):
         db_table = 'entry_votes'
         unique_together = [['entry', 'voter']]
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored vote so save() can diff against it without re-reading the row
+        if 'vote_type' in field_names:
+            instance._loaded_vote_type = instance.vote_type
+        return instance
+    
     def save(self, *args, **kwargs):
         is_new = self.pk is None
-        old_vote = None
-        
-        if not is_new:
-            old_vote = EntryVote.objects.get(pk=self.pk).vote_type
         
-        super().save(*args, **kwargs)
-        
-        # Update entry vote counts
-        if is_new:
-            if self.vote_type == 1:
-                self.entry.upvotes += 1
-            else:
-                self.entry.downvotes += 1
-        elif old_vote != self.vote_type:
-            if old_vote == 1:
-                self.entry.upvotes -= 1
-                self.entry.downvotes += 1
-            else:
-                self.entry.downvotes -= 1
-                self.entry.upvotes += 1
-        
-        self.entry.save(update_fields=['upvotes', 'downvotes'])
+        with transaction.atomic():
+            old_vote = None
+            if not is_new:
+                if hasattr(self, '_loaded_vote_type'):
+                    old_vote = self._loaded_vote_type
+                else:
+                    old_vote = EntryVote.objects.filter(pk=self.pk).values_list('vote_type', flat=True).first()
+            
+            super().save(*args, **kwargs)
+            self._loaded_vote_type = self.vote_type
+            
+            # Update entry vote counts in SQL: a new vote adds one, a changed vote moves one across
+            if old_vote != self.vote_type:
+                up = int(self.vote_type == 1) - int(old_vote == 1)
+                down = int(self.vote_type == -1) - int(old_vote == -1)
+                KoloquaEntry.objects.filter(pk=self.entry_id).update(
+                    upvotes=F('upvotes') + up,
+                    downvotes=F('downvotes') + down,
+                )
 
 
 class TranslationHistory(models.Model):
@@ -191,40 +386,253 @@ class TranslationHistory(models.Model):
         db_table = 'translation_history'
         verbose_name_plural = 'Translation Histories'
         ordering = ['-searched_at']
+        # The table is range-partitioned by month on searched_at (migration 0019);
+        # see the manage_history_partitions command for creation and retention
+        indexes = [
+            models.Index(fields=['-searched_at'], name='th_searched_at_idx'),
+        ]
+
+
 
 
+class SiteStats(models.Model):
+    """Single-row table of denormalized platform counters shown on home/about"""
+    word_count = models.IntegerField(default=0)
+    example_count = models.IntegerField(default=0)
+    pending_entries = models.IntegerField(default=0)
+    total_entries = models.IntegerField(default=0)
+    total_users = models.IntegerField(default=0)
+    contributor_count = models.IntegerField(default=0)
+    translation_count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    COUNTER_FIELDS = (
+        'word_count', 'example_count', 'pending_entries', 'total_entries',
+        'total_users', 'contributor_count', 'translation_count',
+    )
+    
+    class Meta:
+        db_table = 'site_stats'
+        verbose_name_plural = 'Site Stats'
+    
+    def as_dict(self):
+        return {field: getattr(self, field) for field in self.COUNTER_FIELDS}
+    
+    @classmethod
+    def load(cls):
+        """Return the counters row, building it from a full recount on first use"""
+        stats = cls.objects.filter(pk=1).first()
+        if stats is None:
+            stats = cls.recount()
+        return stats
+    
+    @classmethod
+    def recount(cls):
+        """Recompute every counter from scratch (e.g. after bulk updates that skip signals)"""
+        from django.contrib.auth import get_user_model
+        
+        # Entry counts (verified words, examples, pending, total) in one round-trip
+        counts = KoloquaEntry.objects.aggregate(
+            word_count=Count('pk', filter=Q(status='verified')),
+            example_count=Count('pk', filter=Q(example_sentence_koloqua__gt='')),
+            pending_entries=Count('pk', filter=Q(status='pending')),
+            total_entries=Count('pk'),
+        )
+        
+        # Registered users and active contributors (users with at least one contribution);
+        # the contributor count is answered from the u_active_contrib_idx partial index
+        users = get_user_model().objects.filter(is_active=True)
+        counts['total_users'] = users.count()
+        counts['contributor_count'] = users.filter(contributions_count__gt=0).count()
+        
+        # Total translations found
+        counts.update(TranslationHistory.objects.aggregate(
+            translation_count=Count('pk', filter=Q(found=True)),
+        ))
+        
+        stats, _ = cls.objects.update_or_create(pk=1, defaults=counts)
+        cache.delete(SITE_STATS_CACHE_KEY)
+        return stats
+    
+    @classmethod
+    def bump(cls, **deltas):
+        """Apply counter deltas with a single UPDATE"""
+        changes = {field: F(field) + delta for field, delta in deltas.items() if delta}
+        if changes:
+            cls.objects.filter(pk=1).update(**changes)
 
 
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete, m2m_changed
 from django.dispatch import receiver
+from django.core.cache import cache
 from django.utils import timezone
 
+# Cache key for the home/about page statistics (see Kolokwa_connect.views.get_site_stats)
+SITE_STATS_CACHE_KEY = 'site_stats'
+
+# Cache key for the category list shown on the entry form (see dictionary.forms.get_word_categories)
+WORD_CATEGORIES_CACHE_KEY = 'wordcat:all:v1'
+
+# Per-word duplicate-check result used by KoloquaEntryForm.clean_koloqua_text
+DUPCHECK_CACHE_KEY = 'dupcheck:{}'
+
+# Generation marker folded into nl_interact semantic-search result cache keys
+SEMANTIC_SEARCH_VERSION_KEY = 'semsearch:version'
+
+
+def bump_semantic_search_version():
+    """Orphan every cached semantic-search result (entries or embeddings changed)."""
+    cache.set(SEMANTIC_SEARCH_VERSION_KEY, time.time_ns(), timeout=None)
+
+
+@receiver([post_save, post_delete], sender=KoloquaEntry)
+@receiver([post_save, post_delete], sender=TranslationHistory)
+def invalidate_site_stats(sender, **kwargs):
+    """Drop cached platform statistics when entries or translations change."""
+    cache.delete(SITE_STATS_CACHE_KEY)
+
+
+@receiver([post_save, post_delete], sender=WordCategory)
+def invalidate_word_categories(sender, **kwargs):
+    """Drop the cached category list when a category is added, renamed or removed."""
+    cache.delete(WORD_CATEGORIES_CACHE_KEY)
+
+
+@receiver([post_save, post_delete], sender=KoloquaEntry)
+def invalidate_duplicate_check(sender, instance, **kwargs):
+    """Forget the cached duplicate-check result for this entry's word."""
+    cache.delete(DUPCHECK_CACHE_KEY.format(instance.koloqua_text.strip().lower()))
+
+
+@receiver([post_save, post_delete], sender=KoloquaEntry)
+def invalidate_semantic_search(sender, **kwargs):
+    """Cached semantic-search hits may now be stale or point at a deleted entry."""
+    bump_semantic_search_version()
+
+
+@receiver(post_save, sender=KoloquaEntry)
+def update_entry_counters(sender, instance, created, update_fields=None, **kwargs):
+    """Keep SiteStats entry counters in step with status/example changes."""
+    if update_fields and not {'status', 'example_sentence_koloqua'} & set(update_fields):
+        return
+    
+    old_state = {} if created else getattr(instance, '_stats_state', None)
+    if old_state is None:
+        # Loaded without the counted columns, nothing reliable to diff against
+        return
+    
+    new_state = instance.get_stats_state()
+    SiteStats.bump(**{field: value - old_state.get(field, 0) for field, value in new_state.items()})
+    instance._stats_state = new_state
+
+
+@receiver(post_delete, sender=KoloquaEntry)
+def remove_entry_counters(sender, instance, **kwargs):
+    state = getattr(instance, '_stats_state', None)
+    if state is None and not instance.get_deferred_fields():
+        state = instance.get_stats_state()
+    if state:
+        SiteStats.bump(**{field: -value for field, value in state.items()})
+
+
+@receiver(post_save, sender=TranslationHistory)
+def add_translation_counter(sender, instance, created, **kwargs):
+    if created and instance.found:
+        SiteStats.bump(translation_count=1)
+
+
+@receiver(post_delete, sender=TranslationHistory)
+def remove_translation_counter(sender, instance, **kwargs):
+    if instance.found:
+        SiteStats.bump(translation_count=-1)
+
+
+@receiver(m2m_changed, sender=KoloquaEntry.categories.through)
+def sync_entry_category_ids(sender, instance, action, reverse, pk_set, **kwargs):
+    """Keep KoloquaEntry.category_ids in step with the categories M2M table."""
+    if not action.startswith('post_'):
+        return
+    
+    if not reverse:
+        # Also refresh the in-memory copy so a later save() doesn't write back stale ids
+        instance.category_ids = KoloquaEntry.sync_category_ids([instance.pk])[instance.pk]
+        return
+    
+    if pk_set:
+        entry_ids = pk_set
+    else:
+        # category.entries.clear(): every entry that listed this category
+        entry_ids = KoloquaEntry.objects.filter(category_ids__contains=[instance.pk]).values_list('pk', flat=True)
+    KoloquaEntry.sync_category_ids(entry_ids)
+
+
+@receiver(post_delete, sender=WordCategory)
+def remove_deleted_category_ids(sender, instance, **kwargs):
+    """Deleting a category cascades its M2M rows without m2m_changed; resync affected entries."""
+    entry_ids = KoloquaEntry.objects.filter(category_ids__contains=[instance.pk]).values_list('pk', flat=True)
+    KoloquaEntry.sync_category_ids(entry_ids)
+
+
+@receiver(post_save, sender=KoloquaEntry)
+def update_search_vector(sender, instance, created, update_fields=None, **kwargs):
+    """Refresh the full-text search document when searchable fields change."""
+    if update_fields and not set(update_fields) & set(KoloquaEntry.SEARCH_FIELDS):
+        return
+    
+    # Column references can't go in the INSERT itself, so follow up with an UPDATE
+    KoloquaEntry.objects.filter(pk=instance.pk).update(
+        search_vector=KoloquaEntry.build_search_vector()
+    )
+
+
+class _EmbeddingBatch:
+    """Entry ids saved in one transaction, sent to the worker as a single task on commit"""
+    
+    def __init__(self, hooks):
+        self.ids = set()
+        self.hooks = hooks
+        self.sent = False
+    
+    def send(self):
+        self.sent = True
+        try:
+            from nl_interact.tasks import generate_entry_embeddings
+            generate_entry_embeddings.delay(sorted(self.ids))
+        except Exception:
+            # Queueing problems must not fail the save; generate_embeddings backfills later
+            logger.warning("Could not queue embeddings for entries %s", sorted(self.ids), exc_info=True)
+
+
+def queue_entry_embedding(entry_id):
+    """Add an entry to the current transaction's embedding batch, registering one on_commit per batch"""
+    connection = transaction.get_connection()
+    batch = getattr(connection, '_embedding_batch', None)
+    # Django swaps in a fresh run_on_commit list after every commit or rollback,
+    # so a different list means the batch belongs to a transaction that has ended
+    if batch is None or batch.sent or batch.hooks is not connection.run_on_commit:
+        batch = connection._embedding_batch = _EmbeddingBatch(connection.run_on_commit)
+        batch.ids.add(entry_id)
+        transaction.on_commit(batch.send)
+    else:
+        batch.ids.add(entry_id)
+
+
 @receiver(post_save, sender=KoloquaEntry)
 def generate_embedding_on_save(sender, instance, created, **kwargs):
-    """Automatically generate embedding when entry is created or updated."""
+    """Queue an embedding when a verified entry is created or its content changed."""
     
     # Skip if OpenAI API key is not available (e.g., during fixtures loading)
     if not os.getenv('OPENAI_API_KEY'):
         return
     
-    try:
-        from nl_interact.utils import generate_entry_embedding
-    except Exception as e:
-        # Silently skip if import fails (e.g., during migration/restore)
-        return
-    
     # Only generate if content changed or no embedding exists
+    # (checked via embedding_updated_at so the deferred vector isn't fetched)
     should_generate = (
-        not instance.embedding or
         created or
         instance.embedding_updated_at is None or
         instance.updated_at > instance.embedding_updated_at
     )
     
     if should_generate and instance.status == 'verified':
-        # Run async in production (use Celery or similar)
-        try:
-            generate_entry_embedding(instance)
-        except Exception as e:
-            # Log error but don't fail the save operation
-            print(f"Warning: Could not generate embedding: {e}")
\ No newline at end of file
+        # Sent after commit, so the worker can see the rows and no locks are held while queueing
+        queue_entry_embedding(instance.pk)
@@ -7,7 +7,7 @@ from gamification.utils import award_points
 class WordCategorySerializer(serializers.ModelSerializer):
     class Meta:
         model = WordCategory
-        fields = '__all__'
+        fields = ('id', 'name', 'description', 'created_at')
 
 
 class ContributorSerializer(serializers.ModelSerializer):
@@ -17,7 +17,8 @@ class ContributorSerializer(serializers.ModelSerializer):
 
 
 class KoloquaEntrySerializer(serializers.ModelSerializer):
-    contributor = ContributorSerializer(read_only=True)
+    # Built from the denormalized contributor_* columns, so no users join is needed
+    contributor = serializers.SerializerMethodField()
 
     class Meta:
         model = KoloquaEntry
@@ -27,6 +28,30 @@ class KoloquaEntrySerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['status', 'upvotes', 'downvotes', 'contributor']
 
+    # Columns for the .values() fast path in KoloquaEntryViewSet.list
+    VALUES_FIELDS = (
+        'id', 'koloqua_text', 'english_translation', 'entry_type', 'status', 'upvotes', 'downvotes',
+        'contributor_id', 'contributor_username', 'contributor_level',
+    )
+    
+    @staticmethod
+    def contributor_dict(contributor_id, username, level):
+        if contributor_id is None:
+            return None
+        return {'id': contributor_id, 'username': username, 'level': level}
+    
+    @classmethod
+    def from_values(cls, row):
+        """Same representation as to_representation(), from a .values(*VALUES_FIELDS) row"""
+        contributor = cls.contributor_dict(
+            row.pop('contributor_id'), row.pop('contributor_username'), row.pop('contributor_level')
+        )
+        row['contributor'] = contributor
+        return row
+    
+    def get_contributor(self, obj):
+        return self.contributor_dict(obj.contributor_id, obj.contributor_username, obj.contributor_level)
+
 
 class KoloquaEntryDetailSerializer(KoloquaEntrySerializer):
     categories = WordCategorySerializer(many=True, read_only=True)
@@ -0,0 +1,13 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from Kolokwa_connect.views import clear_local_site_stats
+from .models import KoloquaEntry, TranslationHistory
+
+
+# Connected from DictionaryConfig.ready() so management commands and Celery
+# workers clear the statistics caches too, not only processes that load the URLconf
+@receiver([post_save, post_delete], sender=KoloquaEntry)
+@receiver([post_save, post_delete], sender=TranslationHistory)
+def clear_site_stats_caches(sender, **kwargs):
+    """Entries or translations changed; drop the memoized home/about statistics."""
+    clear_local_site_stats()
@@ -1,3 +1,427 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
 from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from dictionary.filters import KoloquaEntryFilter
+from dictionary.management.commands.manage_history_partitions import add_months, month_start
+from dictionary.forms import KoloquaEntryForm
+from dictionary.models import KoloquaEntry, EntryVerification, EntryVote, SiteStats, TranslationHistory, WordCategory
+from dictionary.serializers import KoloquaEntrySerializer
+
+User = get_user_model()
+
+
+class SiteStatsTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='statsuser',
+            email='stats@example.com',
+            password='password123'
+        )
+        SiteStats.recount()
+
+    def create_entry(self, **kwargs):
+        defaults = {
+            'koloqua_text': 'Ba',
+            'english_translation': 'Friend',
+            'context_explanation': 'Common word',
+            'example_sentence_koloqua': 'Ba, come leh go',
+            'example_sentence_english': "Friend, come let's go",
+            'contributor': self.user,
+        }
+        defaults.update(kwargs)
+        return KoloquaEntry.objects.create(**defaults)
+
+    def test_counters_follow_new_entries(self):
+        self.create_entry()
+        stats = SiteStats.load()
+        self.assertEqual(stats.total_entries, 1)
+        self.assertEqual(stats.pending_entries, 1)
+        self.assertEqual(stats.word_count, 0)
+        self.assertEqual(stats.example_count, 1)
+
+    def test_counters_follow_status_changes(self):
+        entry = KoloquaEntry.objects.get(pk=self.create_entry().pk)
+        entry.status = 'verified'
+        entry.save()
+        stats = SiteStats.load()
+        self.assertEqual(stats.pending_entries, 0)
+        self.assertEqual(stats.word_count, 1)
+
+    def test_counters_follow_deletes(self):
+        entry = KoloquaEntry.objects.get(pk=self.create_entry(status='verified').pk)
+        entry.delete()
+        stats = SiteStats.load()
+        self.assertEqual(stats.total_entries, 0)
+        self.assertEqual(stats.word_count, 0)
+
+    def test_bump_matches_recount(self):
+        self.create_entry(status='verified')
+        self.create_entry(koloqua_text='Antay', example_sentence_koloqua='')
+        bumped = SiteStats.load().as_dict()
+        self.assertEqual(bumped, SiteStats.recount().as_dict())
+
+
+class CategoryIdsTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='categoryuser',
+            email='category@example.com',
+            password='password123'
+        )
+        self.food = WordCategory.objects.create(name='Food & Cooking')
+        self.family = WordCategory.objects.create(name='Family & Relationships')
+        self.entry = KoloquaEntry.objects.create(
+            koloqua_text='Antay',
+            english_translation='Aunt',
+            context_explanation='Common word',
+            example_sentence_koloqua='La ma antay',
+            example_sentence_english="That's my aunt",
+            contributor=self.user,
+        )
+
+    def stored_category_ids(self):
+        return KoloquaEntry.objects.values_list('category_ids', flat=True).get(pk=self.entry.pk)
+
+    def test_follows_categories_set(self):
+        self.entry.categories.set([self.family, self.food])
+        self.assertEqual(sorted(self.stored_category_ids()), sorted([self.food.pk, self.family.pk]))
+        self.assertEqual(self.entry.category_ids, self.stored_category_ids())
+
+    def test_follows_reverse_clear_and_category_delete(self):
+        self.entry.categories.set([self.family, self.food])
+        self.food.entries.clear()
+        self.assertEqual(self.stored_category_ids(), [self.family.pk])
+        self.family.delete()
+        self.assertEqual(self.stored_category_ids(), [])
+
+    def test_filter_matches_any_selected_category(self):
+        self.entry.categories.set([self.family])
+        matched = KoloquaEntryFilter({'categories': [self.family.pk, self.food.pk]}, queryset=KoloquaEntry.objects.all()).qs
+        self.assertEqual(list(matched), [self.entry])
+        unmatched = KoloquaEntryFilter({'categories': [self.food.pk]}, queryset=KoloquaEntry.objects.all()).qs
+        self.assertFalse(unmatched.exists())
+
+
+class EntryVoteCounterTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='voteuser',
+            email='vote@example.com',
+            password='password123'
+        )
+        self.voter = User.objects.create_user(
+            username='voter',
+            email='voter@example.com',
+            password='password123'
+        )
+        self.entry = KoloquaEntry.objects.create(
+            koloqua_text='Palava',
+            english_translation='Argument, problem',
+            context_explanation='Common word',
+            example_sentence_koloqua='We get palava',
+            example_sentence_english='We have a problem',
+            contributor=self.user,
+            status='verified',
+        )
+
+    def counts(self):
+        return KoloquaEntry.objects.values_list('upvotes', 'downvotes').get(pk=self.entry.pk)
+
+    def test_new_vote_adds_one(self):
+        EntryVote.objects.create(entry=self.entry, voter=self.voter, vote_type=1)
+        self.assertEqual(self.counts(), (1, 0))
+
+    def test_changed_vote_moves_across(self):
+        EntryVote.objects.create(entry=self.entry, voter=self.voter, vote_type=1)
+        vote = EntryVote.objects.get(entry=self.entry, voter=self.voter)
+        vote.vote_type = -1
+        vote.save()
+        self.assertEqual(self.counts(), (0, 1))
+
+    def test_unchanged_vote_is_not_counted_again(self):
+        vote = EntryVote.objects.create(entry=self.entry, voter=self.voter, vote_type=-1)
+        vote.save()
+        EntryVote.objects.get(pk=vote.pk).save()
+        self.assertEqual(self.counts(), (0, 1))
+
+    def test_vote_not_loaded_from_db_diffs_against_stored_value(self):
+        vote = EntryVote.objects.create(entry=self.entry, voter=self.voter, vote_type=1)
+        EntryVote(pk=vote.pk, entry=self.entry, voter=self.voter, vote_type=-1, created_at=vote.created_at).save()
+        self.assertEqual(self.counts(), (0, 1))
+
+
+class EntryVerifyTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='verifyuser',
+            email='verify@example.com',
+            password='password123'
+        )
+        self.entry = KoloquaEntry.objects.create(
+            koloqua_text='Hala',
+            english_translation='To shout, yell',
+            context_explanation='Common word',
+            example_sentence_koloqua='Why you hala so?',
+            example_sentence_english='Why are you shouting like that?',
+            contributor=self.user,
+        )
+
+    def add_verifications(self, count, verification_type='accurate'):
+        for i in range(count):
+            verifier = User.objects.create_user(
+                username=f'{verification_type}{i}',
+                email=f'{verification_type}{i}@example.com',
+                password='password123'
+            )
+            EntryVerification.objects.create(entry=self.entry, verifier=verifier, verification_type=verification_type)
+
+    def test_refresh_counts_only_accurate_verifications(self):
+        self.add_verifications(2)
+        self.add_verifications(1, 'incorrect')
+        self.entry.refresh_verification_count()
+        self.assertEqual(self.entry.verification_count, 2)
+
+    def test_stays_pending_below_threshold(self):
+        self.add_verifications(KoloquaEntry.AUTO_VERIFY_THRESHOLD - 1)
+        self.entry.refresh_verification_count()
+        self.assertFalse(self.entry.verify())
+        self.assertEqual(KoloquaEntry.objects.get(pk=self.entry.pk).status, 'pending')
+
+    def test_verifies_at_threshold(self):
+        self.add_verifications(KoloquaEntry.AUTO_VERIFY_THRESHOLD)
+        self.entry.refresh_verification_count()
+        self.assertTrue(self.entry.verify())
+        stored = KoloquaEntry.objects.get(pk=self.entry.pk)
+        self.assertEqual(stored.status, 'verified')
+        self.assertIsNotNone(stored.verified_at)
+
+    def test_only_one_of_concurrent_verifiers_wins(self):
+        self.add_verifications(KoloquaEntry.AUTO_VERIFY_THRESHOLD)
+        # Two requests holding their own copy of the still-pending entry
+        first = KoloquaEntry.objects.get(pk=self.entry.pk)
+        second = KoloquaEntry.objects.get(pk=self.entry.pk)
+        first.refresh_verification_count()
+        second.refresh_verification_count()
+        self.assertTrue(first.verify())
+        self.assertFalse(second.verify())
+
+
+class EntryTagsTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='taguser',
+            email='tag@example.com',
+            password='password123'
+        )
+
+    def form_data(self, **kwargs):
+        data = {
+            'koloqua_text': 'Wahala',
+            'english_translation': 'Problem, trouble',
+            'entry_type': 'word',
+            'context_explanation': 'Common word',
+            'example_sentence_koloqua': 'We get wahala',
+            'example_sentence_english': 'We have trouble',
+        }
+        data.update(kwargs)
+        return data
+
+    def test_tags_are_split_trimmed_lowercased_and_deduplicated(self):
+        form = KoloquaEntryForm(self.form_data(tags=' Slang, informal ,slang,, Greeting , '), user=self.user)
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(form.cleaned_data['tags'], ['slang', 'informal', 'greeting'])
+
+    def test_empty_tags_become_an_empty_list(self):
+        form = KoloquaEntryForm(self.form_data(tags=''), user=self.user)
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(form.cleaned_data['tags'], [])
+
+    def test_saved_tags_are_found_by_the_tag_filter(self):
+        form = KoloquaEntryForm(self.form_data(tags='Slang, Greeting'), user=self.user)
+        self.assertTrue(form.is_valid(), form.errors)
+        entry = form.save(commit=False)
+        entry.contributor = self.user
+        entry.save()
+        self.assertEqual(KoloquaEntry.objects.values_list('tags', flat=True).get(pk=entry.pk), ['slang', 'greeting'])
+        matched = KoloquaEntryFilter({'tag': ' SLANG '}, queryset=KoloquaEntry.objects.all()).qs
+        self.assertEqual([match.pk for match in matched], [entry.pk])
+
+
+class CsvImportTest(TestCase):
+
+    def write_csv(self, content):
+        handle, path = tempfile.mkstemp(suffix='.csv')
+        with os.fdopen(handle, 'w', encoding='utf-8', newline='') as file:
+            file.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def run_import(self, path):
+        call_command('populate_koloqua_dictionary', source='csv', csv_file=path, stdout=StringIO())
+
+    def test_creates_entries_and_updates_repeated_words(self):
+        path = self.write_csv(
+            'koloqua_text,english_translation,example_sentence_koloqua,example_sentence_english\n'
+            'Ba,A friend,"Ba, come leh go","Friend, come let\'s go"\n'
+            'Pekin,Young boy,This pekin smart,This boy is smart\n'
+            'Missing,,No translation,\n'
+            'ba,"A friend, buddy",Ba how you doing,Friend how are you\n'
+        )
+        self.run_import(path)
+
+        entries = {entry.koloqua_text.lower(): entry for entry in KoloquaEntry.objects.all()}
+        self.assertEqual(sorted(entries), ['ba', 'pekin'])
+        self.assertEqual(entries['ba'].english_translation, 'A friend, buddy')
+        self.assertEqual(entries['pekin'].status, 'verified')
+        self.assertEqual(entries['pekin'].tags, ['csv-import', 'verified'])
+        self.assertIsNotNone(entries['pekin'].search_vector)
+        self.assertEqual(
+            sorted(entries['pekin'].categories.values_list('pk', flat=True)),
+            sorted(entries['pekin'].category_ids),
+        )
+        self.assertEqual(SiteStats.load().word_count, 2)
+
+    def test_missing_file_raises_command_error(self):
+        with self.assertRaises(CommandError):
+            self.run_import(os.path.join(tempfile.gettempdir(), 'no-such-koloqua.csv'))
+
+
+class TextSearchTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='searchuser',
+            email='search@example.com',
+            password='password123'
+        )
+        self.palava = self.create_entry('Palava', 'Argument, problem')
+        self.wahala = self.create_entry('Wahala', 'Problem, trouble')
+        self.papay = self.create_entry('Papay', 'Wealthy older man')
+
+    def create_entry(self, koloqua_text, english_translation):
+        return KoloquaEntry.objects.create(
+            koloqua_text=koloqua_text,
+            english_translation=english_translation,
+            context_explanation='Common word',
+            example_sentence_koloqua=koloqua_text,
+            example_sentence_english=english_translation,
+            contributor=self.user,
+            status='verified',
+        )
+
+    def search(self, query, **kwargs):
+        return list(KoloquaEntry.objects.text_search(query, **kwargs).order_by('-similarity'))
+
+    def test_exact_word_ranks_first(self):
+        results = self.search('Wahala')
+        self.assertEqual(results[0], self.wahala)
+        self.assertEqual(results[0].similarity, 1)
+
+    def test_matches_misspellings(self):
+        self.assertEqual(self.search('palaver')[0], self.palava)
+
+    def test_matches_short_substrings_below_the_similarity_threshold(self):
+        self.assertEqual(set(self.search('ala')), {self.palava, self.wahala})
+
+    def test_searches_only_the_given_fields(self):
+        self.assertEqual(set(self.search('problem')), {self.palava, self.wahala})
+        self.assertEqual(self.search('problem', fields=('koloqua_text',)), [])
+
+    def test_unrelated_query_matches_nothing(self):
+        self.assertEqual(self.search('zzzz'), [])
+
+
+class EntryListApiTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='listuser',
+            email='list@example.com',
+            password='password123'
+        )
+        for koloqua_text, english_translation in (('Tote', 'To carry'), ('Vex', 'Angry')):
+            KoloquaEntry.objects.create(
+                koloqua_text=koloqua_text,
+                english_translation=english_translation,
+                context_explanation='Common word',
+                example_sentence_koloqua=koloqua_text,
+                example_sentence_english=english_translation,
+                contributor=self.user,
+                status='verified',
+                upvotes=2,
+            )
+
+    def test_values_rows_match_the_serializer(self):
+        response = self.client.get(reverse('dictionary:api-entry-list'))
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        rows = data['results'] if isinstance(data, dict) else data
+
+        entries = KoloquaEntry.objects.filter(status='verified').order_by('pk')
+        # Through the stock JSON renderer, so both sides are compared as plain JSON
+        expected = JSONRenderer().render(KoloquaEntrySerializer(entries, many=True).data)
+        self.assertEqual(
+            sorted(rows, key=lambda row: row['id']),
+            json.loads(expected),
+        )
+
+
+class HistoryPartitionTest(TestCase):
+
+    def setUp(self):
+        SiteStats.recount()
+        self.this_month = timezone.now().date().replace(day=1)
+
+    def add_search(self, month, found=True):
+        search = TranslationHistory.objects.create(search_text='ba', search_language='ko', found=found)
+        # searched_at is auto_now_add; moving it routes the row to that month's partition
+        TranslationHistory.objects.filter(pk=search.pk).update(searched_at=month_start(month))
+        return search
+
+    def count_rows(self, table):
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT count(*) FROM {connection.ops.quote_name(table)}')
+            return cursor.fetchone()[0]
+
+    def run_command(self, **options):
+        call_command('manage_history_partitions', stdout=StringIO(), **options)
+
+    def test_creating_a_month_moves_its_rows_out_of_the_default_partition(self):
+        # Migration 0019 only creates partitions up to three months ahead
+        month = add_months(self.this_month, 5)
+        search = self.add_search(month)
+        self.assertEqual(self.count_rows('translation_history_default'), 1)
+
+        self.run_command(ahead=6, retain_months=0)
+
+        self.assertEqual(self.count_rows('translation_history_default'), 0)
+        self.assertEqual(self.count_rows(f'translation_history_{month:%Y_%m}'), 1)
+        self.assertTrue(TranslationHistory.objects.filter(pk=search.pk).exists())
+
+    def test_retention_deletes_old_rows_in_the_default_partition(self):
+        old = add_months(self.this_month, -24)
+        self.add_search(old)
+        self.add_search(old, found=False)
+        recent = self.add_search(self.this_month)
+        self.assertEqual(SiteStats.load().translation_count, 2)
+
+        self.run_command(retain_months=6)
 
-# Create your tests here.
+        self.assertEqual(self.count_rows('translation_history_default'), 0)
+        self.assertEqual(list(TranslationHistory.objects.values_list('pk', flat=True)), [recent.pk])
+        self.assertEqual(SiteStats.load().translation_count, 1)
@@ -3,7 +3,7 @@ from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.renderers import JSONRenderer, BrowsableAPIRenderer
-from .models import KoloquaEntry, WordCategory, TranslationHistory, EntryVote, EntryVerification
+from .models import KoloquaEntry, WordCategory, TranslationHistory, EntryVote, EntryVerification, TEXT_SEARCH_FIELDS
 from .serializers import (
     KoloquaEntrySerializer,
     KoloquaEntryDetailSerializer,
@@ -12,7 +12,6 @@ from .serializers import (
     EntryVoteSerializer,
     EntryVerificationSerializer
 )
-from django.db.models import Q
 from gamification.utils import handle_entry_verification, handle_entry_rejection, handle_new_contribution, award_points
 from django.shortcuts import render, redirect, get_object_or_404
 from django.urls import reverse_lazy
@@ -23,9 +22,11 @@ from django.contrib import messages
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
-from .forms import KoloquaEntryForm, EntryVerificationForm
+from .forms import KoloquaEntryForm, EntryVerificationForm, get_word_categories
+from .filters import KoloquaEntryFilter
+from .renderers import ORJSONRenderer
 import json
-from django.db.utils import IntegrityError
+from django.db import IntegrityError, transaction
 
 
 class KoloquaEntryListView(ListView):
@@ -44,10 +45,7 @@ class KoloquaEntryListView(ListView):
         sort = self.request.GET.get('sort')
 
         if query:
-            queryset = queryset.filter(
-                Q(koloqua_text__icontains=query) |
-                Q(english_translation__icontains=query)
-            ).distinct()
+            queryset = queryset.text_search(query)
             
             # Log the search for analytics
             if self.request.user.is_authenticated:
@@ -68,9 +66,9 @@ class KoloquaEntryListView(ListView):
         if sort == 'alphabetical':
             queryset = queryset.order_by('koloqua_text')
         elif sort == 'popular':
-            queryset = queryset.extra(
-                select={'score': 'upvotes - downvotes + (verification_count * 2)'}
-            ).order_by('-score')
+            queryset = queryset.order_by('-score')
+        elif query:
+            queryset = queryset.order_by('-similarity', '-created_at')
         else:
             queryset = queryset.order_by('-created_at')
 
@@ -101,10 +99,7 @@ class PendingEntriesListView(LoginRequiredMixin, ListView):
         sort = self.request.GET.get('sort')
 
         if query:
-            queryset = queryset.filter(
-                Q(koloqua_text__icontains=query) |
-                Q(english_translation__icontains=query)
-            ).distinct()
+            queryset = queryset.text_contains(query)
         if entry_type:
             queryset = queryset.filter(entry_type=entry_type)
         if category:
@@ -171,7 +166,7 @@ class KoloquaEntryCreateView(LoginRequiredMixin, View):
 
     def get(self, request, *args, **kwargs):
         form = self.form_class(user=request.user)
-        categories = WordCategory.objects.all()
+        categories = get_word_categories()
         return render(request, self.template_name, {
             'form': form,
             'categories': categories,
@@ -244,7 +239,7 @@ class KoloquaEntryCreateView(LoginRequiredMixin, View):
                         messages.error(request, f'{field}: {error}')
         
         # Re-render form with errors
-        categories = WordCategory.objects.all()
+        categories = get_word_categories()
         return render(request, self.template_name, {
             'form': form,
             'categories': categories,
@@ -260,7 +255,7 @@ class KoloquaEntryUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView
 
     def test_func(self):
         entry = self.get_object()
-        return self.request.user == entry.contributor or self.request.user.is_staff
+        return entry.contributor_id == self.request.user.pk or self.request.user.is_staff
 
     def get_form_kwargs(self):
         """Pass user to the form"""
@@ -268,13 +263,25 @@ class KoloquaEntryUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView
         kwargs['user'] = self.request.user
         return kwargs
 
+    def form_valid(self, form):
+        # kol_unique_active catches duplicates that slip past clean_koloqua_text (e.g. concurrent edits)
+        try:
+            with transaction.atomic():
+                return super().form_valid(form)
+        except IntegrityError:
+            form.add_error(
+                'koloqua_text',
+                f'The word "{form.cleaned_data["koloqua_text"]}" has already been submitted.'
+            )
+            return self.form_invalid(form)
+
     def get_success_url(self):
         messages.success(self.request, 'Entry updated successfully!')
         return reverse_lazy('dictionary:entry-detail', kwargs={'pk': self.object.pk})
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['categories'] = WordCategory.objects.all()
+        context['categories'] = get_word_categories()
         context['is_edit'] = True
         return context
 
@@ -287,7 +294,7 @@ class KoloquaEntryDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView
 
     def test_func(self):
         entry = self.get_object()
-        return self.request.user == entry.contributor or self.request.user.is_staff
+        return entry.contributor_id == self.request.user.pk or self.request.user.is_staff
 
 class EntryVoteView(LoginRequiredMixin, View):
     """Handle voting on entries (AJAX/JSON)"""
@@ -323,7 +330,7 @@ class EntryVoteView(LoginRequiredMixin, View):
                 user_vote = None
                 
                 # Adjust contributor points
-                if entry.contributor != request.user:
+                if entry.contributor_id != request.user.pk:
                     award_points(
                         entry.contributor, 
                         -vote_type, 
@@ -338,7 +345,7 @@ class EntryVoteView(LoginRequiredMixin, View):
                 user_vote = vote_type
                 
                 # Adjust contributor points (net change is 2x the new vote)
-                if entry.contributor != request.user:
+                if entry.contributor_id != request.user.pk:
                     point_change = vote_type - old_vote_type
                     award_points(
                         entry.contributor, 
@@ -367,7 +374,7 @@ class EntryVoteView(LoginRequiredMixin, View):
             )
             
             # Award points to the contributor for the vote
-            if entry.contributor != request.user:
+            if entry.contributor_id != request.user.pk:
                 award_points(
                     entry.contributor, 
                     vote_type, 
@@ -392,7 +399,7 @@ class EntryVerifyView(LoginRequiredMixin, View):
     def post(self, request, pk):
         entry = get_object_or_404(KoloquaEntry, pk=pk)
         
-        if request.user == entry.contributor:
+        if entry.contributor_id == request.user.pk:
             if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
                 return JsonResponse({'error': 'Cannot verify your own entry'}, status=400)
             messages.error(request, 'You cannot verify your own entry')
@@ -417,22 +424,17 @@ class EntryVerifyView(LoginRequiredMixin, View):
             }
         )
         
-        # Update verification count
-        entry.verification_count = entry.verifications.filter(
-            verification_type='accurate'
-        ).count()
+        # Update verification count (one UPDATE with a COUNT subquery)
+        entry.refresh_verification_count()
         
         # Handle verification points and status changes
         if verification_type == 'accurate':
-            # Check if entry should be auto-verified
-            if entry.verification_count >= 3 and entry.status == 'pending':  # Lowered threshold for testing
-                entry.status = 'verified'
-                entry.save()
+            # Auto-verify once enough verifiers agree; only one concurrent caller wins
+            if entry.verify():
                 # Use the proper gamification function
                 handle_entry_verification(entry, request.user)
                 status_message = 'Entry has been verified!'
             else:
-                entry.save()
                 # Award points for verification activity
                 award_points(request.user, 3, 'verification', f'Verified entry: {entry.koloqua_text}')
                 # Award points to contributor for positive verification
@@ -443,17 +445,15 @@ class EntryVerifyView(LoginRequiredMixin, View):
             # Handle rejection
             if entry.verifications.filter(verification_type='incorrect').count() >= 2:
                 entry.status = 'rejected'
-                entry.save()
+                entry.save(update_fields=['status'])
                 handle_entry_rejection(entry, request.user)
                 status_message = 'Entry has been rejected due to multiple negative verifications.'
             else:
-                entry.save()
                 # Award points for verification activity
                 award_points(request.user, 2, 'verification', f'Reviewed entry: {entry.koloqua_text}')
                 status_message = 'Thank you for your verification!'
         
         else:  # needs_revision
-            entry.save()
             award_points(request.user, 2, 'verification', f'Reviewed entry: {entry.koloqua_text}')
             status_message = 'Thank you for your verification!'
         
@@ -482,7 +482,33 @@ class KoloquaEntryViewSet(viewsets.ModelViewSet):
     """API ViewSet for Koloqua dictionary entries"""
     queryset = KoloquaEntry.objects.filter(status='verified')
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
-    renderer_classes = [JSONRenderer, BrowsableAPIRenderer]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+    filterset_class = KoloquaEntryFilter
+    
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'retrieve':
+            # The detail serializer's categories come from one IN query
+            queryset = queryset.prefetch_related('categories')
+        elif self.action in ('vote', 'verify'):
+            # Points are awarded to the contributor
+            queryset = queryset.select_related('contributor')
+        return queryset
+    
+    def filter_queryset(self, queryset):
+        # Query-param filters (and the filterset's list projection) only apply to the list
+        if self.action != 'list':
+            return queryset
+        return super().filter_queryset(queryset)
+    
+    def list(self, request, *args, **kwargs):
+        # Read-only hot path: plain .values() rows instead of a ModelSerializer instance per entry
+        queryset = self.filter_queryset(self.get_queryset()).values(*KoloquaEntrySerializer.VALUES_FIELDS)
+        page = self.paginate_queryset(queryset)
+        rows = [KoloquaEntrySerializer.from_values(row) for row in (queryset if page is None else page)]
+        if page is None:
+            return Response(rows)
+        return self.get_paginated_response(rows)
     
     def get_serializer_class(self):
         if self.action == 'retrieve':
@@ -516,7 +542,7 @@ class KoloquaEntryViewSet(viewsets.ModelViewSet):
             if vote.vote_type == vote_type:
                 vote.delete()
                 # Adjust contributor points
-                if entry.contributor != request.user:
+                if entry.contributor_id != request.user.pk:
                     award_points(entry.contributor, -vote_type, 'vote_removed', f'Vote removed for your entry: {entry.koloqua_text}')
                 entry.refresh_from_db()
                 return Response({
@@ -529,12 +555,12 @@ class KoloquaEntryViewSet(viewsets.ModelViewSet):
                 vote.vote_type = vote_type
                 vote.save()
                 # Adjust contributor points
-                if entry.contributor != request.user:
+                if entry.contributor_id != request.user.pk:
                     award_points(entry.contributor, vote_type - old_vote, 'vote_changed', f'Vote changed for your entry: {entry.koloqua_text}')
         else:
             # Award points to voter and contributor
             award_points(request.user, 1, 'vote', f'Voted on entry: {entry.koloqua_text}')
-            if entry.contributor != request.user:
+            if entry.contributor_id != request.user.pk:
                 award_points(entry.contributor, vote_type, 'vote_received', f'Your entry received a vote: {entry.koloqua_text}')
         
         entry.refresh_from_db()
@@ -555,19 +581,14 @@ class KoloquaEntryViewSet(viewsets.ModelViewSet):
             return Response({'results': []}, status=status.HTTP_200_OK)
         
         # Determine search field based on language
+        queryset = self.get_queryset()
         if language == 'en':
-            results = self.queryset.filter(
-                english_translation__icontains=query
-            ).distinct()[:20]
+            fields = ('english_translation',)
         elif language == 'ko':
-            results = self.queryset.filter(
-                koloqua_text__icontains=query
-            ).distinct()[:20]
+            fields = ('koloqua_text',)
         else:  # auto-detect
-            results = self.queryset.filter(
-                Q(koloqua_text__icontains=query) |
-                Q(english_translation__icontains=query)
-            ).distinct()[:20]
+            fields = TEXT_SEARCH_FIELDS
+        results = queryset.text_search(query, fields).order_by('-similarity')[:20]
         
         # Log search
         if request.user.is_authenticated:
@@ -591,7 +612,7 @@ class KoloquaEntryViewSet(viewsets.ModelViewSet):
         """API endpoint for verification - FIXED VERSION"""
         entry = self.get_object()
         
-        if request.user == entry.contributor:
+        if entry.contributor_id == request.user.pk:
             return Response({'error': 'Cannot verify your own entry'}, status=status.HTTP_403_FORBIDDEN)
         
         serializer = EntryVerificationSerializer(data=request.data)
@@ -604,21 +625,16 @@ class KoloquaEntryViewSet(viewsets.ModelViewSet):
                 defaults=serializer.validated_data
             )
             
-            # Update verification count
-            entry.verification_count = entry.verifications.filter(
-                verification_type='accurate'
-            ).count()
+            # Update verification count (one UPDATE with a COUNT subquery)
+            entry.refresh_verification_count()
             
             # Handle verification points and status changes
             if verification_type == 'accurate':
-                # Check if entry should be auto-verified
-                if entry.verification_count >= 3 and entry.status == 'pending':
-                    entry.status = 'verified'
-                    entry.save()
+                # Auto-verify once enough verifiers agree; only one concurrent caller wins
+                if entry.verify():
                     handle_entry_verification(entry, request.user)
                     message = 'Entry has been verified!'
                 else:
-                    entry.save()
                     # Award points for verification activity
                     award_points(request.user, 3, 'verification', f'Verified entry: {entry.koloqua_text}')
                     # Award points to contributor for positive verification
@@ -629,16 +645,14 @@ class KoloquaEntryViewSet(viewsets.ModelViewSet):
                 # Handle rejection
                 if entry.verifications.filter(verification_type='incorrect').count() >= 2:
                     entry.status = 'rejected'
-                    entry.save()
+                    entry.save(update_fields=['status'])
                     handle_entry_rejection(entry, request.user)
                     message = 'Entry has been rejected.'
                 else:
-                    entry.save()
                     award_points(request.user, 2, 'verification', f'Reviewed entry: {entry.koloqua_text}')
                     message = 'Thank you for your verification!'
             
             else:  # needs_revision
-                entry.save()
                 award_points(request.user, 2, 'verification', f'Reviewed entry: {entry.koloqua_text}')
                 message = 'Thank you for your verification!'
 
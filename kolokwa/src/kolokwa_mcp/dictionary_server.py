@@ -55,7 +55,7 @@ def get_dictionary_stats() -> str:
             "total_contributors": User.objects.filter(contributions_count__gt=0).count(),
             "total_translations": TranslationHistory.objects.count(),
             "entries_with_audio": KoloquaEntry.objects.exclude(audio_pronunciation='').count(),
-            "entries_with_examples": KoloquaEntry.objects.exclude(example_sentence_koloqua='').count(),
+            "entries_with_examples": KoloquaEntry.objects.filter(example_sentence_koloqua__gt='').count(),
             "words": KoloquaEntry.objects.filter(status='verified', entry_type='word').count(),
             "phrases": KoloquaEntry.objects.filter(status='verified', entry_type='phrase').count(),
             "idioms": KoloquaEntry.objects.filter(status='verified', entry_type='idiom').count(),
@@ -151,7 +151,7 @@ def _search_dictionary_sync(query: str, search_type: str, limit: int):
             "pronunciation": entry.pronunciation_guide,
             "has_audio": bool(entry.audio_pronunciation),
             "region": entry.region_specific,
-            "score": entry.calculate_score(),
+            "score": entry.score,
         })
     
     return entries
@@ -211,9 +211,9 @@ def _get_entry_details_sync(entry_id: int):
             "categories": [cat.name for cat in entry.categories.all()],
             "upvotes": entry.upvotes,
             "downvotes": entry.downvotes,
-            "score": entry.calculate_score(),
+            "score": entry.score,
             "verification_count": entry.verification_count,
-            "contributor": entry.contributor.username if entry.contributor else "Anonymous",
+            "contributor": entry.contributor_username or "Anonymous",
             "created_at": str(entry.created_at),
             "verified_at": str(entry.verified_at) if entry.verified_at else None,
         }
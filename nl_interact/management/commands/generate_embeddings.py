@@ -6,13 +6,16 @@ Stores embeddings in database, not cache.
 Usage: 
   python manage.py generate_embeddings
   python manage.py generate_embeddings --force
-  python manage.py generate_embeddings --batch-size 5 --delay 2
+  python manage.py generate_embeddings --batch-size 50 --delay 2
 """
 
 from django.core.management.base import BaseCommand
 from dictionary.models import KoloquaEntry
-from nl_interact.utils import batch_generate_embeddings, get_rag_stats, is_rate_limited
+from nl_interact.utils import (
+    EMBEDDING_BATCH_DELAY, EMBEDDING_BATCH_SIZE, embed_entries, get_rag_stats, is_rate_limited,
+)
 import logging
+import math
 
 logger = logging.getLogger(__name__)
 
@@ -29,14 +32,14 @@ class Command(BaseCommand):
         parser.add_argument(
             '--batch-size',
             type=int,
-            default=10,
-            help='Number of entries to process before pausing (default: 10)',
+            default=EMBEDDING_BATCH_SIZE,
+            help=f'Entries embedded per API request (default: {EMBEDDING_BATCH_SIZE})',
         )
         parser.add_argument(
             '--delay',
             type=float,
-            default=1.0,
-            help='Seconds to wait between batches (default: 1.0)',
+            default=EMBEDDING_BATCH_DELAY,
+            help=f'Seconds to wait between API requests (default: {EMBEDDING_BATCH_DELAY})',
         )
         parser.add_argument(
             '--limit',
@@ -65,34 +68,35 @@ class Command(BaseCommand):
             )
             return
         
-        # Get entries to process
+        # Get entries to process; the embedding column itself is only written, never read
+        entries = KoloquaEntry.objects.filter(status='verified').defer('embedding', 'search_vector')
         if force:
-            entries = KoloquaEntry.objects.filter(status='verified')
+            total = entries.count()
             self.stdout.write(
-                self.style.WARNING(f"\n🔄 Force mode: Processing all {entries.count()} entries")
+                self.style.WARNING(f"\n🔄 Force mode: Processing all {total} entries")
             )
         else:
-            entries = KoloquaEntry.objects.filter(
-                status='verified',
-                embedding__isnull=True
-            )
+            entries = entries.filter(embedding__isnull=True)
+            total = entries.count()
             self.stdout.write(
-                self.style.SUCCESS(f"\n✨ Processing {entries.count()} entries without embeddings")
+                self.style.SUCCESS(f"\n✨ Processing {total} entries without embeddings")
             )
         
         if limit:
             entries = entries[:limit]
+            total = min(total, limit)
             self.stdout.write(f"Limited to {limit} entries")
         
-        if entries.count() == 0:
+        if total == 0:
             self.stdout.write(self.style.SUCCESS('\n✅ All entries already have embeddings!'))
             return
         
         # Confirm for large batches
-        if entries.count() > 50:
+        requests = math.ceil(total / batch_size)
+        if total > 50:
             self.stdout.write(
                 self.style.WARNING(
-                    f"\n⚠️  Processing {entries.count()} entries will make ~{entries.count()} API calls."
+                    f"\n⚠️  Processing {total} entries will make ~{requests} API calls."
                 )
             )
             confirm = input("Continue? (yes/no): ")
@@ -100,25 +104,20 @@ class Command(BaseCommand):
                 self.stdout.write("Cancelled.")
                 return
         
-        # Process embeddings
+        # Process embeddings: one API request per batch, written back with bulk_update
+        # (which bypasses generate_embedding_on_save)
         self.stdout.write(
             self.style.SUCCESS(
                 f"\n🚀 Starting generation (batch_size={batch_size}, delay={delay}s)...\n"
             )
         )
         
-        results = batch_generate_embeddings(
-            entries,
-            batch_size=batch_size,
-            delay=delay,
-            force=force
-        )
+        embedded = embed_entries(entries, batch_size=batch_size, delay=delay)
         
         # Show results
         self.stdout.write(self.style.SUCCESS('\n=== Results ==='))
-        self.stdout.write(f"✅ Success: {results['success']}")
-        self.stdout.write(f"⏭️  Skipped: {results['skipped']}")
-        self.stdout.write(f"❌ Failed: {results['failed']}")
+        self.stdout.write(f"✅ Success: {embedded}")
+        self.stdout.write(f"❌ Not processed: {total - embedded}")
         
         if is_rate_limited():
             self.stdout.write(
@@ -0,0 +1,16 @@
+# nl_interact/tasks.py
+"""
+Background tasks for RAG embeddings.
+"""
+from celery import shared_task
+
+from .utils import embed_entries
+
+
+@shared_task(ignore_result=True)
+def generate_entry_embeddings(entry_ids):
+    """Embed the given verified entries off the request path, in batched API calls."""
+    from dictionary.models import KoloquaEntry
+    
+    entries = KoloquaEntry.objects.filter(pk__in=entry_ids, status='verified')
+    return embed_entries(entries)
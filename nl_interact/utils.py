@@ -5,13 +5,27 @@ Utility functions for RAG operations with rate limit protection.
 from openai import OpenAI
 from django.conf import settings
 from django.core.cache import cache
+from django.db import connection, transaction
 from django.utils import timezone
+from pgvector.django import MaxInnerProduct
+import hashlib
+import itertools
 import logging
 import numpy as np
 import time
 
 logger = logging.getLogger(__name__)
 
+# Texts per embeddings API request, and the pause between requests to stay under TPM limits
+EMBEDDING_BATCH_SIZE = 100
+EMBEDDING_BATCH_DELAY = 0.05
+
+# Semantic-search hits are cached for an hour, and dropped early when entries change
+SEMANTIC_SEARCH_TIMEOUT = 3600
+
+# Cached count of embedded entries, used to pick hnsw.ef_search per query
+EMBEDDED_COUNT_CACHE_KEY = 'rag:embedded_count'
+
 # Initialize OpenAI client
 client = OpenAI(api_key=settings.OPENAI_API_KEY)
 
@@ -27,6 +41,25 @@ def set_rate_limited(duration_seconds=3600):
     logger.warning(f"Rate limited - embeddings disabled for {duration_seconds}s")
 
 
+def text_digest(text):
+    """Stable cache-key digest of normalized text."""
+    return hashlib.sha256(text.strip().lower().encode()).hexdigest()
+
+
+def normalize_embedding(embedding):
+    """
+    Scale an embedding to unit length and round it to FP16 (the halfvec column's precision).
+    
+    With unit vectors, cosine similarity is just the inner product, which the
+    kol_embedding_hnsw index (halfvec_ip_ops) computes without per-pair norms.
+    """
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    if norm:
+        vector /= norm
+    return vector.astype(np.float16)
+
+
 def get_embedding(text, model="text-embedding-3-small"):
     """
     Get OpenAI embedding for text with caching and rate limit handling.
@@ -46,12 +79,12 @@ def get_embedding(text, model="text-embedding-3-small"):
         logger.info("Skipping embedding - rate limited")
         return None
     
-    # Create cache key (30 day cache)
-    cache_key = f"emb_v1_{hash(text.strip().lower())}_{model}"
+    # Create cache key (30 day cache); sha256 is stable across processes, unlike hash()
+    cache_key = f"emb_v2_{text_digest(text)}_{model}"
     cached = cache.get(cache_key)
     
     if cached:
-        return cached
+        return np.frombuffer(cached, dtype=np.float16).tolist()
     
     try:
         response = client.embeddings.create(
@@ -60,8 +93,8 @@ def get_embedding(text, model="text-embedding-3-small"):
         )
         embedding = response.data[0].embedding
         
-        # Cache for 30 days
-        cache.set(cache_key, embedding, timeout=86400 * 30)
+        # Cache for 30 days, packed as FP16 (the precision stored in the halfvec column)
+        cache.set(cache_key, np.asarray(embedding, dtype=np.float16).tobytes(), timeout=86400 * 30)
         return embedding
         
     except Exception as e:
@@ -75,6 +108,40 @@ def get_embedding(text, model="text-embedding-3-small"):
         return None
 
 
+def get_embeddings(texts, model="text-embedding-3-small"):
+    """
+    Get OpenAI embeddings for several texts in a single API request.
+    
+    Args:
+        texts: List of non-empty strings to embed
+        model: OpenAI embedding model to use
+    
+    Returns:
+        List of embedding vectors in the same order as texts, or None on error
+    """
+    if is_rate_limited():
+        logger.info("Skipping embedding batch - rate limited")
+        return None
+    
+    try:
+        response = client.embeddings.create(
+            model=model,
+            input=[text.strip() for text in texts]
+        )
+        # The API tags each vector with its input position
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+        
+    except Exception as e:
+        error_str = str(e)
+        
+        # Handle rate limiting
+        if '429' in error_str or 'quota' in error_str.lower():
+            set_rate_limited(3600)  # 1 hour
+        
+        logger.error(f"Error generating embedding batch: {error_str}")
+        return None
+
+
 def create_entry_text(entry):
     """
     Create searchable text representation of a dictionary entry.
@@ -105,46 +172,48 @@ def create_entry_text(entry):
     return " | ".join(parts)
 
 
-def generate_entry_embedding(entry, force=False):
+def embed_entries(entries, batch_size=EMBEDDING_BATCH_SIZE, delay=EMBEDDING_BATCH_DELAY):
     """
-    Generate and store embedding for a dictionary entry.
+    Embed entries with one API request per batch and store them with bulk_update.
+    
+    bulk_update skips post_save, so writing the embeddings never re-triggers
+    generate_embedding_on_save.
     
     Args:
-        entry: KoloquaEntry instance
-        force: If True, regenerate even if embedding exists
+        entries: QuerySet or list of KoloquaEntry instances
+        batch_size: Entries per API request
+        delay: Seconds to wait between requests
     
     Returns:
-        Boolean indicating success
+        Number of entries embedded
     """
-    # Skip if rate limited
-    if is_rate_limited():
-        logger.info(f"Skipping embedding for entry {entry.id} - rate limited")
-        return False
+    from dictionary.models import KoloquaEntry, bump_semantic_search_version
     
-    # Skip if embedding exists and is current
-    if not force and entry.embedding and entry.embedding_updated_at:
-        if entry.embedding_updated_at >= entry.updated_at:
-            return True
+    embedded = 0
+    iterator = entries.iterator() if hasattr(entries, 'iterator') else iter(entries)
     
-    try:
-        # Create searchable text
-        entry_text = create_entry_text(entry)
-        
-        # Generate embedding
-        embedding = get_embedding(entry_text)
-        
-        if embedding:
-            entry.embedding = embedding
-            entry.embedding_updated_at = timezone.now()
-            entry.save(update_fields=['embedding', 'embedding_updated_at'])
-            logger.info(f"Generated embedding for entry {entry.id}: {entry.koloqua_text}")
-            return True
+    while batch := list(itertools.islice(iterator, batch_size)):
+        if embedded:
+            time.sleep(delay)
         
-        return False
+        embeddings = get_embeddings([create_entry_text(entry) for entry in batch])
+        if embeddings is None:
+            # Rate limited or API error; leave the rest for the next run
+            break
         
-    except Exception as e:
-        logger.error(f"Error generating embedding for entry {entry.id}: {str(e)}")
-        return False
+        now = timezone.now()
+        for entry, embedding in zip(batch, embeddings):
+            entry.embedding = normalize_embedding(embedding)
+            entry.embedding_updated_at = now
+        KoloquaEntry.objects.bulk_update(batch, ['embedding', 'embedding_updated_at'])
+        embedded += len(batch)
+        logger.info(f"Generated embeddings for {embedded} entries")
+    
+    if embedded:
+        # bulk_update sends no post_save, so invalidate cached search hits here
+        bump_semantic_search_version()
+    
+    return embedded
 
 
 def cosine_similarity(vec1, vec2):
@@ -162,84 +231,78 @@ def cosine_similarity(vec1, vec2):
     return dot_product / (norm1 * norm2)
 
 
-def semantic_search_entries(query_text, top_k=5, threshold=0.5):
+def configure_hnsw_params(vector_count):
     """
-    Perform semantic search using stored embeddings.
-    Only generates embedding for the query (1 API call).
+    HNSW build and search parameters for an index of the given size.
+    
+    Returns:
+        Dict with 'm' and 'ef_construction' (index build) and 'ef_search' (per query)
     """
+    if vector_count < 100_000:
+        return {'m': 16, 'ef_construction': 64, 'ef_search': 40}
+    if vector_count < 1_000_000:
+        return {'m': 24, 'ef_construction': 128, 'ef_search': 100}
+    return {'m': 32, 'ef_construction': 200, 'ef_search': 200}
+
+
+def get_embedded_count():
+    """Number of entries with an embedding, cached for an hour."""
     from dictionary.models import KoloquaEntry
     
-    # Get query embedding (ONLY API call per search)
-    query_embedding = get_embedding(query_text)
-    
-    if not query_embedding:
-        logger.warning("Failed to generate query embedding")
-        return []
-    
-    # Get entries with pre-computed embeddings (NO API calls)
-    entries = KoloquaEntry.objects.filter(
-        status='verified',
-        embedding__isnull=False
-    ).select_related('contributor')
-    
-    # Calculate similarities
-    scored_entries = []
-    for entry in entries:
-        if entry.embedding:
-            similarity = cosine_similarity(query_embedding, entry.embedding)
-            if similarity >= threshold:
-                scored_entries.append((entry, similarity))
-    
-    # Sort by similarity
-    scored_entries.sort(key=lambda x: x[1], reverse=True)
-    
-    return scored_entries[:top_k]
+    return cache.get_or_set(
+        EMBEDDED_COUNT_CACHE_KEY,
+        lambda: KoloquaEntry.objects.filter(embedding__isnull=False).count(),
+        timeout=3600,
+    )
 
 
-def batch_generate_embeddings(entries, batch_size=10, delay=1.0, force=False):
+def semantic_search_entries(query_text, top_k=5, threshold=0.5):
+    """
+    Perform semantic search using stored embeddings.
+    Only generates embedding for the query (1 API call).
     """
-    Generate embeddings for multiple entries with rate limit protection.
+    from dictionary.models import KoloquaEntry, SEMANTIC_SEARCH_VERSION_KEY
     
-    Args:
-        entries: QuerySet or list of KoloquaEntry instances
-        batch_size: Entries to process before pausing
-        delay: Seconds to wait between batches
-        force: Regenerate even if exists
+    # The candidate list must be at least top_k long or HNSW returns fewer rows
+    ef_search = max(configure_hnsw_params(get_embedded_count())['ef_search'], top_k)
     
-    Returns:
-        Dict with counts: {'success': int, 'failed': int, 'skipped': int}
-    """
-    results = {'success': 0, 'failed': 0, 'skipped': 0}
+    # Hits for a repeated query come from cache; the version moves whenever entries change
+    version = cache.get(SEMANTIC_SEARCH_VERSION_KEY, 0)
+    cache_key = f"semsearch:ip:{version}:{text_digest(query_text)}:{top_k}:{ef_search}"
+    hits = cache.get(cache_key)
     
-    for i, entry in enumerate(entries, 1):
-        # Stop if rate limited
-        if is_rate_limited():
-            logger.warning(f"Stopped at entry {i} due to rate limit")
-            break
-        
-        # Skip if already has current embedding
-        if not force and entry.embedding and entry.embedding_updated_at:
-            if entry.embedding_updated_at >= entry.updated_at:
-                results['skipped'] += 1
-                continue
+    if hits is None:
+        # Get query embedding (ONLY API call per search, and only on a cache miss)
+        query_embedding = get_embedding(query_text)
         
-        # Generate embedding
-        if generate_entry_embedding(entry, force=force):
-            results['success'] += 1
-        else:
-            results['failed'] += 1
-            
-            # If failed due to rate limit, stop
-            if is_rate_limited():
-                logger.warning(f"Hit rate limit at entry {i}")
-                break
+        if not query_embedding:
+            logger.warning("Failed to generate query embedding")
+            return []
         
-        # Pause between batches
-        if i % batch_size == 0:
-            logger.info(f"Processed {i} entries, pausing {delay}s...")
-            time.sleep(delay)
-    
-    return results
+        # Nearest entries by inner product, answered from the kol_embedding_hnsw index (NO API calls).
+        # Stored embeddings are unit length, so for a unit query this is cosine similarity.
+        # MaxInnerProduct compiles to <#> (the negated inner product), the operator of the
+        # index's halfvec_ip_ops opclass; any other distance would silently fall back to a
+        # sequential scan.
+        query_embedding = normalize_embedding(query_embedding)
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                # set_config(..., true) is SET LOCAL that takes a bound parameter
+                cursor.execute("SELECT set_config('hnsw.ef_search', %s, true)", [str(ef_search)])
+            nearest = (
+                KoloquaEntry.objects.filter(status='verified', embedding__isnull=False)
+                .annotate(negative_ip=MaxInnerProduct('embedding', query_embedding))
+                .order_by('negative_ip')
+                .values_list('pk', 'negative_ip')[:top_k]
+            )
+            hits = [(pk, -negative_ip) for pk, negative_ip in nearest]
+        cache.set(cache_key, hits, timeout=SEMANTIC_SEARCH_TIMEOUT)
+    
+    # Hits are already sorted; drop anything below the similarity threshold
+    hits = [(pk, similarity) for pk, similarity in hits if similarity >= threshold]
+    entries = KoloquaEntry.objects.select_related('contributor').in_bulk([pk for pk, _ in hits])
+    
+    return [(entries[pk], similarity) for pk, similarity in hits if pk in entries]
 
 
 def get_rag_stats():
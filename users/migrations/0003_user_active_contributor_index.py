@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_user_workos_id_user_users_email_4b85f2_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(condition=models.Q(('is_active', True), ('contributions_count__gt', 0)), fields=['id'], name='u_active_contrib_idx'),
+        ),
+    ]
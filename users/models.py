@@ -51,22 +51,48 @@ class User(AbstractUser):
             models.Index(fields=['email']),
             models.Index(fields=['workos_id']),
             models.Index(fields=['points']),
+            models.Index(
+                fields=['id'],
+                condition=models.Q(is_active=True, contributions_count__gt=0),
+                name='u_active_contrib_idx',
+            ),
         ]
         
     def __str__(self):
         return self.email
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the counted state so SiteStats can apply deltas on save/delete
+        if 'is_active' in field_names and 'contributions_count' in field_names:
+            instance._stats_state = instance.get_stats_state()
+        return instance
+    
+    def get_stats_state(self):
+        """SiteStats counters this user contributes to (1 or 0 each)"""
+        if hasattr(self.contributions_count, 'resolve_expression'):
+            # Saved with an F() expression; read back the stored value
+            self.refresh_from_db(fields=['contributions_count'])
+        return {
+            'total_users': int(self.is_active),
+            'contributor_count': int(self.is_active and self.contributions_count > 0),
+        }
+    
     def update_level(self):
         """Update user level based on points"""
         if self.points >= 1000:
-            self.level = 'chief'
+            level = 'chief'
         elif self.points >= 500:
-            self.level = 'expert'
+            level = 'expert'
         elif self.points >= 100:
-            self.level = 'intermediate'
+            level = 'intermediate'
         else:
-            self.level = 'beginner'
-        self.save(update_fields=['level'])
+            level = 'beginner'
+        # Skip the no-op save; a level change is copied onto every entry the user contributed
+        if level != self.level:
+            self.level = level
+            self.save(update_fields=['level'])
     
     def add_points(self, points, reason=''):
         """Add points and update level"""
@@ -0,0 +1,46 @@
+from django.db.models import Q
+from django.db.models.signals import post_save, post_delete, pre_delete
+from django.dispatch import receiver
+from dictionary.models import KoloquaEntry, SiteStats
+from .models import User
+
+
+@receiver(post_save, sender=User)
+def update_user_counters(sender, instance, created, update_fields=None, **kwargs):
+    """Keep SiteStats user counters in step with activation and contributions."""
+    if update_fields and not {'is_active', 'contributions_count'} & set(update_fields):
+        return
+    
+    old_state = {} if created else getattr(instance, '_stats_state', None)
+    if old_state is None:
+        # Loaded without the counted columns, nothing reliable to diff against
+        return
+    
+    new_state = instance.get_stats_state()
+    SiteStats.bump(**{field: value - old_state.get(field, 0) for field, value in new_state.items()})
+    instance._stats_state = new_state
+
+
+@receiver(post_delete, sender=User)
+def remove_user_counters(sender, instance, **kwargs):
+    state = getattr(instance, '_stats_state', None)
+    if state:
+        SiteStats.bump(**{field: -value for field, value in state.items()})
+
+
+@receiver(post_save, sender=User)
+def sync_contributor_fields(sender, instance, created, update_fields=None, **kwargs):
+    """Push username/level changes onto the user's entries (KoloquaEntry.contributor_*)."""
+    if created or (update_fields and not {'username', 'level'} & set(update_fields)):
+        return
+    
+    # Only rows that are actually out of date get rewritten
+    KoloquaEntry.objects.filter(contributor_id=instance.pk).filter(
+        ~Q(contributor_username=instance.username) | ~Q(contributor_level=instance.level)
+    ).update(contributor_username=instance.username, contributor_level=instance.level)
+
+
+@receiver(pre_delete, sender=User)
+def clear_contributor_fields(sender, instance, **kwargs):
+    """The FK is nulled with a bare UPDATE on delete; blank the copied fields with it."""
+    KoloquaEntry.objects.filter(contributor_id=instance.pk).update(contributor_username='', contributor_level='')
@@ -0,0 +1,13 @@
+"""
+users/workos_urls.py
+WorkOS AuthKit routes, mounted under auth/workos/ by the root URLconf
+"""
+from django.urls import path
+
+from .workos_views import workos_callback, workos_login, workos_logout
+
+urlpatterns = [
+    path('callback', workos_callback, name='workos-callback'),
+    path('login', workos_login, name='workos-login'),
+    path('logout', workos_logout, name='workos-logout'),
+]